@@ -0,0 +1,27 @@
+## local.mk -- repo-owned targets, included by the Makefile shim.
+
+# Where `benchmark-baseline` keeps its run -- under `_tests/`, which git
+# ignores, with the other outputs of the benchmarks -- and how much slower
+# than it a benchmark may get before `benchmark-compare` fails: a
+# pytest-benchmark `--benchmark-compare-fail` expression, statistic and
+# tolerance.
+BENCHMARK_BASELINE ?= _tests/benchmarks/baseline.json
+BENCHMARK_THRESHOLD ?= median:25%
+BENCHMARK_ARGS = tests/benchmarks -m "not stress" --benchmark-only
+
+.PHONY: benchmark benchmark-baseline benchmark-compare
+
+# `benchmark` overrides rhiza's task of that name on purpose -- `uv run rhiza-task
+# benchmark` still reaches that one. pytest.ini skips the benchmarks by default, and
+# only --benchmark-only, which these targets pass, runs them past the skip.
+
+benchmark: $(UV) ## run the benchmarks, provisioning pytest-benchmark
+	@$(UV) run --with pytest-benchmark pytest $(BENCHMARK_ARGS)
+
+benchmark-baseline: $(UV) ## save a benchmark run as the baseline for benchmark-compare
+	@mkdir -p $(dir $(BENCHMARK_BASELINE))
+	@$(UV) run --with pytest-benchmark pytest $(BENCHMARK_ARGS) --benchmark-json=$(BENCHMARK_BASELINE)
+
+benchmark-compare: $(UV) ## rerun the benchmarks, failing on slowdowns past BENCHMARK_THRESHOLD
+	@$(UV) run --with pytest-benchmark pytest $(BENCHMARK_ARGS) \
+		--benchmark-compare=$(BENCHMARK_BASELINE) --benchmark-compare-fail=$(BENCHMARK_THRESHOLD)
@@ -15,15 +15,20 @@
 
 from __future__ import annotations
 
-from .builder import Builder as Builder
+from typing import TYPE_CHECKING
+
 from .cvxerror import CvxBuildError as CvxBuildError
 from .cvxerror import CvxDataError as CvxDataError
 from .cvxerror import CvxError as CvxError
 from .cvxerror import CvxSolverError as CvxSolverError
-from .portfolios.max_sharpe import MaxSharpe as MaxSharpe
-from .portfolios.min_var import MinVar as MinVar
-from .portfolios.soft_risk import SoftRisk as SoftRisk
-from .problem import Problem as Problem
+from .utils.lazy import attributes
+
+if TYPE_CHECKING:
+    from .builder import Builder as Builder
+    from .portfolios.max_sharpe import MaxSharpe as MaxSharpe
+    from .portfolios.min_var import MinVar as MinVar
+    from .portfolios.soft_risk import SoftRisk as SoftRisk
+    from .problem import Problem as Problem
 
 __all__ = [
     "Builder",
@@ -36,3 +41,17 @@ __all__ = [
     "Problem",
     "SoftRisk",
 ]
+
+# The builders and the problem are imported on first access, not with the
+# package: they pull in cvxpy, and a job that uses one builder should not wait
+# for the others. The errors are cheap and stay eager.
+__getattr__, __dir__ = attributes(
+    __name__,
+    {
+        "Builder": ".builder",
+        "MaxSharpe": ".portfolios.max_sharpe",
+        "MinVar": ".portfolios.min_var",
+        "Problem": ".problem",
+        "SoftRisk": ".portfolios.soft_risk",
+    },
+)
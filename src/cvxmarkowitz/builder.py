@@ -16,12 +16,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from typing import Any
 
 import cvxpy as cp
 
 from cvxmarkowitz.cvxerror import CvxBuildError, CvxDataError, CvxError
 from cvxmarkowitz.model import Model
+from cvxmarkowitz.models.active import ActiveSet
 
 # `Bounds` is imported concretely on purpose: it is not a default being chosen
 # among alternatives but part of what a Builder unconditionally is, so putting
@@ -55,6 +58,16 @@ class Builder(ABC):
         constraints: Mapping of named cvxpy constraints added during build.
         variables: Mapping of problem variables (weights, factor weights, etc.).
         parameter: Mapping of cvxpy Parameters used by the builder/models.
+        robust: Whether to build the uncertainty terms. With False, the default
+            risk model and the expected returns are built without them and no
+            absolute-weight variable is created, so the problem is smaller and
+            `update` takes no `*_uncertainty` keywords. An injected risk model
+            keeps its own setting, and gets the absolute-weight variable if it
+            is robust or has no `robust` setting.
+        mask: Whether to add an `ActiveSet` under `ModelName.ACTIVE`, the mask
+            `update` takes as `active`: one compiled problem then serves any
+            universe of up to `assets` assets, and its fast path solves only
+            the active ones.
     """
 
     assets: int = 0
@@ -63,12 +76,19 @@ class Builder(ABC):
     constraints: dict[str, cp.Constraint] = field(default_factory=dict)
     variables: Variables = field(default_factory=dict)
     parameter: Parameter = field(default_factory=dict)
+    robust: bool = True
+    mask: bool = False
+    # the expressions of the models, by kind and model name, each with the model
+    # it was built from; see `estimate`
+    _expressions: dict[tuple[str, str], tuple[Model, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Initialize the risk model, variables, and bounds.
 
-        Creates the variables (weights and, if `factors` is given, factor weights
-        and their absolute values) and registers the per-asset and/or per-factor
+        Creates the variables (weights and, if `factors` is given, factor weights,
+        plus the absolute values the robust terms need) and registers the per-asset and/or per-factor
         bound models.
 
         The risk model is only defaulted when the caller did not supply one.
@@ -87,16 +107,18 @@ class Builder(ABC):
             self.variables[D.FACTOR_WEIGHTS] = cp.Variable(self.factors, name=D.FACTOR_WEIGHTS)
             # add bounds for factor weights
             self.model[M.BOUND_FACTORS] = Bounds(assets=self.factors, name="factors", acting_on=D.FACTOR_WEIGHTS)
-            # add variable for absolute factor weights
-            self.variables[D._ABS] = cp.Variable(self.factors, name=D._ABS, nonneg=True)
-
-        else:
-            # add variable for absolute weights
-            self.variables[D._ABS] = cp.Variable(self.assets, name=D._ABS, nonneg=True)
 
         # pick the default risk model, unless the caller injected one
         if M.RISK not in self.model:
-            self.model[M.RISK] = default_risk_model(assets=self.assets, factors=self.factors)
+            self.model[M.RISK] = default_risk_model(assets=self.assets, factors=self.factors, robust=self.robust)
+
+        # add variable for absolute (factor) weights, which the robust terms of
+        # the risk model need -- whatever `robust` says, for an injected one; a
+        # model that has no `robust` of its own may use them, so it gets them
+        if getattr(self.model[M.RISK], "robust", True):
+            self.variables[D._ABS] = cp.Variable(
+                self.assets if self.factors is None else self.factors, name=D._ABS, nonneg=True
+            )
 
         # Note that for the SampleCovariance model the factor_weights are None.
         # They are only included for the harmony of the interfaces for both models.
@@ -105,6 +127,9 @@ class Builder(ABC):
         # add bounds on assets
         self.model[M.BOUND_ASSETS] = Bounds(assets=self.assets, name="assets", acting_on=D.WEIGHTS)
 
+        if self.mask:
+            self.model[M.ACTIVE] = ActiveSet(assets=self.assets)
+
     @property
     @abstractmethod
     def objective(self) -> cp.Minimize | cp.Maximize:
@@ -120,7 +145,7 @@ class Builder(ABC):
                 the whole caching story rests on.
         """
         for name_model, model in self.model.items():
-            for name_constraint, constraint in model.constraints(self.variables).items():
+            for name_constraint, constraint in self._memoized("constraints", name_model, model.constraints).items():
                 self.constraints[f"{name_model}_{name_constraint}"] = constraint
 
         problem = cp.Problem(self.objective, list(self.constraints.values()))
@@ -134,6 +159,29 @@ class Builder(ABC):
 
         return Problem(problem=problem, model=self.model)
 
+    def estimate(self, name: str = M.RISK) -> cp.Expression:
+        """Return the objective term of the model `name` -- the risk, by default.
+
+        The expression is built on first request and kept: the objective, the
+        risk constraint and every later `build` then share one expression tree,
+        and so can constraints of your own, as in
+
+            builder.constraints["risk_cap"] = builder.estimate() <= cap
+
+        The constraints of each model are kept likewise. Replacing a model
+        under its name builds its expressions afresh.
+        """
+        expression: cp.Expression = self._memoized("estimate", name, self.model[name].estimate)
+        return expression
+
+    def _memoized(self, kind: str, name: str, make: Callable[[Variables], Any]) -> Any:
+        """Return the `kind` expression of the model `name`, calling `make` only if it is not kept."""
+        model = self.model[name]
+        kept = self._expressions.get((kind, name))
+        if kept is None or kept[0] is not model:
+            kept = self._expressions[(kind, name)] = (model, make(self.variables))
+        return kept[1]
+
     @property
     def weights(self) -> cp.Variable:
         """Return the asset-weight decision variable (`weights`)."""
@@ -0,0 +1,250 @@
+#    Copyright 2023 Stanford University Convex Optimization Group
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""A size-bounded cache of compiled problems, keyed by their structure."""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from dataclasses import dataclass, field
+
+import cvxpy as cp
+
+from cvxmarkowitz.builder import Builder
+from cvxmarkowitz.model import Model
+from cvxmarkowitz.problem import Problem
+from cvxmarkowitz.tuning import pattern, structure
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Counters of a `ProblemCache`, in the spirit of `functools.lru_cache`.
+
+    Attributes:
+        hits: Requests answered from the cache.
+        misses: Requests that had to compile.
+        maxsize: The most problems the cache holds.
+        currsize: The problems it holds now.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass(frozen=True)
+class ProblemCache:
+    """Hand out compiled problems, compiling each structure only once.
+
+    A service that builds the same kind of problem for many universes spends
+    most of its time compiling problems that differ only in their data. This
+    cache keys each built problem by its structure -- the builder class, the
+    numbers of assets and factors, the type and settings of every model, and
+    the objective, constraints, parameters and variables of the assembled
+    problem -- and compiles a structure the first time it sees it. Every
+    request, the first included, gets its own copy of the compiled problem,
+    so callers never share parameter values; the copy starts from the
+    parameter values of the requesting builder. A builder like one seen
+    before -- of the same `key` -- is not even built.
+
+    Problems are evicted least recently used first once `maxsize` is reached.
+
+        cache = ProblemCache(maxsize=32)
+        problem = cache.build(MinVar(assets=500))  # compiles
+        problem = cache.build(MinVar(assets=500))  # copies, no compilation
+
+    Attributes:
+        maxsize: The most compiled problems to keep.
+        solver: The solver to compile for; solve the problems with it.
+    """
+
+    maxsize: int = 128
+    solver: str = cp.CLARABEL
+    # each problem with the id of the parameter at every path of the builder
+    # that compiled it, and the signature of every builder key seen
+    _problems: OrderedDict[Hashable, tuple[Problem, dict[Hashable, int]]] = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _counts: dict[str, int] = field(default_factory=lambda: {"hits": 0, "misses": 0}, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _aliases: dict[Hashable, Hashable] = field(default_factory=dict, repr=False)
+
+    def build(self, builder: Builder) -> Problem:
+        """Return a compiled problem for `builder`, compiling only on a miss.
+
+        Set the builder's parameters -- `sigma_max`, say -- before the call:
+        they are copied into the problem returned, but later changes to the
+        builder do not reach it. Likewise read the solution from the problem
+        (`problem.weights`), not from the builder's variables.
+
+        A builder whose `key` was seen before is not built at all: the problem
+        of that key is copied. Otherwise the builder is built, and keyed by the
+        `signature` of the problem, which builders of other keys may share.
+
+        Raises:
+            CvxBuildError: If the assembled problem is not DPP-compliant.
+        """
+        alias = self.key(builder)
+        fresh, compiled = None, False
+        with self._lock:
+            key = self._aliases.get(alias)
+            entry = None if key is None else self._problems.get(key)
+
+        if entry is None:
+            fresh = builder.build()
+            key = self.signature(builder, fresh)
+            with self._lock:
+                entry = self._problems.get(key)
+            if entry is None:
+                fresh.get_problem_data(self.solver)
+                entry = (fresh, {path: parameter.id for path, parameter in _parameters(builder)})
+                compiled = True
+            if set(entry[1]) != {path for path, _ in _parameters(builder)}:
+                # the builder holds its parameters elsewhere than the one that
+                # compiled the problem, so its key cannot stand in for a build
+                alias = None
+
+        with self._lock:
+            self._counts["misses" if compiled else "hits"] += 1
+            self._problems[key] = entry
+            self._problems.move_to_end(key)
+            if alias is not None:
+                self._aliases[alias] = key
+            while len(self._problems) > self.maxsize:
+                evicted, _ = self._problems.popitem(last=False)
+                for stale in [name for name, target in self._aliases.items() if target == evicted]:
+                    del self._aliases[stale]
+
+        cached, ids = entry
+
+        # the copy shares the compiled map from parameter values to solver
+        # data with the cached problem, and has parameters of its own, with
+        # the ids of those of the cached problem
+        problem = cached.clone()
+        targets = {parameter.id: parameter for parameter in problem.problem.parameters()}
+        for model in problem.model.values():
+            targets |= {parameter.id: parameter for parameter in (*model.parameter.values(), *model.data.values())}
+
+        # a built builder has the same structure, so the parameters of its
+        # problem line up one to one with those of the copy
+        sources = (
+            [] if fresh is None else list(zip(fresh.problem.parameters(), problem.problem.parameters(), strict=True))
+        )
+        # the others are found by where the builder holds them; a callback
+        # reads parameters the problem does not hold, such as the alpha of
+        # ParametricCVar, and they are carried over as well
+        sources += [
+            (parameter, targets[ids[path]]) for path, parameter in _parameters(builder) if ids.get(path) in targets
+        ]
+
+        for source, target in sources:
+            if isinstance(target, cp.CallbackParam):
+                continue
+            if source.sparse_idx is not None:
+                target.value_sparse = source.value_sparse
+            else:
+                target.value = source.value
+
+        return problem
+
+    @staticmethod
+    def key(builder: Builder) -> Hashable:
+        """Return the key of `builder`, taken without building it.
+
+        The structure of a problem follows from what it is built from: the
+        builder class and its settings, the type and settings of every model,
+        the names, shapes and sparsity patterns of their parameters, and the
+        text of the constraints the builder holds. Builders with equal keys
+        have equal signatures, so `build` copies a problem for a key it has
+        seen without building the builder at all.
+        """
+        return (
+            type(builder),
+            _settings(builder, "model", "constraints", "variables", "parameter"),
+            _models(builder),
+            tuple((name, variable.shape) for name, variable in builder.variables.items()),
+            tuple((name, str(constraint)) for name, constraint in builder.constraints.items()),
+            tuple((path, parameter.shape, pattern(parameter)) for path, parameter in _parameters(builder)),
+        )
+
+    @staticmethod
+    def signature(builder: Builder, problem: Problem) -> Hashable:
+        """Return the structural key of `problem`, as built by `builder`.
+
+        Two problems with equal signatures compile to the same canonicalization
+        and differ at most in their parameter values. Expressions enter by
+        their text, which names parameters and variables but does not print
+        their values; parameters by name, shape and sparsity pattern. A model
+        setting that only gives a parameter its initial value -- the `alpha`
+        of `ParametricCVar` -- is left out for the same reason: builders that
+        differ in it share a compilation. Such a setting is recognized by its
+        name, that of a parameter of the model.
+        """
+        return (type(builder), builder.assets, builder.factors, _models(builder), *structure(problem.problem))
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit and miss counters and the current size."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._counts["hits"],
+                misses=self._counts["misses"],
+                maxsize=self.maxsize,
+                currsize=len(self._problems),
+            )
+
+    def cache_clear(self) -> None:
+        """Drop every cached problem and reset the counters."""
+        with self._lock:
+            self._problems.clear()
+            self._aliases.clear()
+            self._counts.update(hits=0, misses=0)
+
+
+def _settings(instance: Builder | Model, *exclude: str) -> tuple[tuple[str, object], ...]:
+    """Return the public fields of the dataclass `instance` that take part in comparisons, but those in `exclude`."""
+    return tuple(
+        (f.name, getattr(instance, f.name))
+        for f in dataclasses.fields(instance)
+        if f.compare and not f.name.startswith("_") and f.name not in exclude
+    )
+
+
+def _models(builder: Builder) -> tuple[Hashable, ...]:
+    """Return the name, type and settings of every model of `builder`, leaving out those that seed a parameter."""
+    return tuple(
+        (name, type(model), _settings(model, "parameter", "data", *model.parameter, *model.data))
+        for name, model in builder.model.items()
+    )
+
+
+def _parameters(builder: Builder) -> Iterator[tuple[Hashable, cp.Parameter]]:
+    """Yield the parameters `builder` holds, each with a path that finds it in another builder of its key.
+
+    These are the parameters of the builder, those of its models and the
+    parameters of the constraints it holds, which covers a constraint of your
+    own on a parameter held nowhere else.
+    """
+    for key, parameter in builder.parameter.items():
+        yield ("parameter", key), parameter
+    for name, model in builder.model.items():
+        for key, parameter in model.parameter.items():
+            yield (name, "parameter", key), parameter
+        for key, parameter in model.data.items():
+            yield (name, "data", key), parameter
+    for name, constraint in builder.constraints.items():
+        for index, parameter in enumerate(constraint.parameters()):
+            yield ("constraints", name, index), parameter
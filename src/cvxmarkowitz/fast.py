@@ -0,0 +1,312 @@
+#    Copyright 2023 Stanford University Convex Optimization Group
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""A direct path from parameter values to Clarabel, bypassing cvxpy per solve."""
+
+from __future__ import annotations
+
+import copy
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import clarabel
+import cvxpy as cp
+import cvxpy.settings as s
+import numpy as np
+import numpy.typing as npt
+from cvxpy.problems.problem import SolverStats
+from cvxpy.reductions.reduction import Reduction
+from cvxpy.reductions.solution import Solution, failure_solution
+from cvxpy.reductions.solvers.conic_solvers.clarabel_conif import CLARABEL, dims_to_solver_cones
+
+from cvxmarkowitz.cvxerror import CvxSolverError
+
+
+@dataclass(frozen=True)
+class SolverData:
+    """Clarabel's data for one set of parameter values, presolved under a mask.
+
+    Attributes:
+        q: The cost vector.
+        A: The constraint matrix, in compressed sparse columns.
+        b: The constraint offsets.
+        dims: The cone dimensions of the rows of `A`.
+        offset: The constant term of the objective.
+        keep: The columns of the compiled problem that remain.
+        structure: The remaining columns and rows, or None without presolve.
+    """
+
+    q: npt.NDArray[np.float64]
+    A: Any
+    b: npt.NDArray[np.float64]
+    dims: Any
+    offset: float
+    keep: npt.NDArray[np.intp]
+    structure: tuple[bytes, bytes] | None = None
+
+
+@dataclass(frozen=True)
+class FastPath:
+    """The compiled form of a problem, solved by calling Clarabel directly.
+
+    `cvxpy.Problem.solve` on a compiled DPP problem still walks its solving
+    chain on every call: it checks the cache key, lets every reduction update
+    its parameters, and on the way back inverts the solution through every
+    reduction to recover primal and dual values for each variable and
+    constraint. None of that changes between solves of one problem. A fast path
+    keeps only what does: the affine map from parameter values to the solver's
+    `(q, A, b)` -- a sparse matrix-vector product -- and the primal solution
+    mapped back onto the problem's variables. Dual values are not recovered.
+
+    Build one with `compile`; `Problem.compile_fast` does that for you.
+
+    Given a mask -- a parameter that is 0 where it pins an entry of a variable
+    to zero -- each solve presolves the data first: the pinned columns go,
+    then the rows left with no entries that hold trivially, then the columns
+    left with no entries and no cost. Clarabel solves what remains, and the
+    removed columns read zero. A problem compiled for a large universe then
+    solves a small one at close to the cost of a problem compiled for it.
+
+    Attributes:
+        program: cvxpy's parametrized cone program: the parameter-to-data map.
+        solver: cvxpy's Clarabel interface, used to format the data.
+        dims: The cone dimensions, fixed by the structure of the problem.
+        columns: For each variable of the problem, by id, the indices of its
+            entries in Clarabel's solution vector.
+        reductions: The reductions of the chain that derive parameters of the
+            program from those of the problem -- the entries of a parameter
+            with a sparsity pattern, say -- and so must see every solve.
+        mask: The parameter that is 0 where an entry is pinned to zero, if any.
+        masked: The columns of the entries `mask` pins, one per entry of it.
+    """
+
+    program: Any
+    solver: CLARABEL
+    dims: Any
+    columns: dict[int, npt.NDArray[np.intp]]
+    reductions: list[Reduction] = field(default_factory=list)
+    mask: cp.Parameter | None = None
+    masked: npt.NDArray[np.intp] = field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    # the native solver of the last solve, kept for warm starts; never pickled
+    _workspace: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def compile(cls, problem: cp.Problem, mask: tuple[cp.Parameter, cp.Variable] | None = None) -> FastPath:
+        """Compile `problem` for Clarabel, if not yet, and extract its data map.
+
+        Also works out, once, which entries of Clarabel's solution vector each
+        of the problem's variables reads. cvxpy's reductions may have replaced a
+        variable -- a `nonneg` one, say -- with a new one, so the columns are
+        found by passing the column numbers themselves back through the chain's
+        inversion: what comes out as a variable's value is its column indices.
+
+        Args:
+            problem: The problem to compile.
+            mask: A parameter and the variable of its shape whose entries it
+                pins to zero where it is 0. The problem itself must hold them
+                there, by a constraint; the mask only tells the presolve.
+        """
+        data, chain, inverse_data = problem.get_problem_data(cp.CLARABEL)
+        program = data[s.PARAM_PROB]
+
+        solution = Solution(s.OPTIMAL, 0.0, {program.x.id: np.arange(program.x.size, dtype=float)}, {}, {})
+        for reduction, inverse in reversed(list(zip(chain.reductions[:-1], inverse_data[:-1], strict=True))):
+            solution = reduction.invert(solution, inverse)
+
+        columns = {var_id: np.asarray(value).astype(np.intp) for var_id, value in solution.primal_vars.items()}
+        return cls(
+            program=program,
+            solver=chain.solver,
+            dims=data[CLARABEL.DIMS],
+            columns=columns,
+            reductions=[
+                reduction
+                for reduction in chain.reductions
+                if type(reduction).update_parameters is not Reduction.update_parameters
+            ],
+            mask=None if mask is None else mask[0],
+            masked=np.empty(0, dtype=np.intp) if mask is None else columns[mask[1].id].ravel(order="F"),
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to pickle, without the native solver (which does not pickle)."""
+        return {**self.__dict__, "_workspace": {}}
+
+    def data(self, problem: cp.Problem) -> SolverData:
+        """Map the current parameter values of `problem` to Clarabel's data, presolved under the mask."""
+        for reduction in self.reductions:
+            reduction.update_parameters(problem)
+        data, inverse_data = self.solver.apply(self.program)
+        q, A, b = data[s.C], data[s.A], data[s.B]  # noqa: N806  # solver-data names
+
+        if self.mask is None:
+            return SolverData(q, A, b, self.dims, inverse_data[s.OFFSET], np.arange(q.size))
+
+        pinned = self.masked[np.asarray(self.mask.value).ravel(order="F") == 0]
+        q, A, b, dims, keep, rows = _presolve(q, A, b, self.dims, pinned)  # noqa: N806  # solver-data names
+        return SolverData(q, A, b, dims, inverse_data[s.OFFSET], keep, (keep.tobytes(), rows.tobytes()))
+
+    def solve_batch(
+        self, blocks: Iterable[SolverData], verbose: bool = False, **settings: Any
+    ) -> Iterator[tuple[str, npt.NDArray[np.float64], float]]:
+        """Solve one problem of this path's structure per block of data, with one native solver.
+
+        The native solver is set up for the first block and updated in place
+        for the next ones with the same structure, which without a mask is all
+        of them: one set-up for the batch, not one per block. Blocks are taken
+        one at a time, so their data need not all be held at once.
+
+        Args:
+            blocks: The data of each problem, from `data`.
+            verbose: Let Clarabel print its progress.
+            **settings: Clarabel settings, e.g. `tol_gap_abs`.
+
+        Yields:
+            For each block, the status, the values of all columns of the
+            compiled problem and the objective value; NaN for the latter two
+            if the block was not solved to optimality.
+        """
+        settings_ = CLARABEL.parse_solver_opts(verbose, settings)
+        native, structure = None, None
+        for block in blocks:
+            if native is not None and native.is_data_update_allowed() and block.structure == structure:
+                native.update(q=block.q, A=block.A, b=block.b)
+            else:
+                P = type(block.A)((block.q.size, block.q.size))  # noqa: N806  # solver-data names
+                cones = dims_to_solver_cones(block.dims)
+                native = clarabel.DefaultSolver(P, block.q, block.A, block.b, cones, settings_)  # ty: ignore[unresolved-attribute]
+                structure = block.structure
+
+            result = native.solve()
+            status = CLARABEL.STATUS_MAP.get(str(result.status), s.SOLVER_ERROR)
+            if status != s.OPTIMAL:
+                yield status, np.full(self.program.x.size, np.nan), np.nan
+                continue
+
+            x = np.zeros(self.program.x.size)
+            x[block.keep] = result.x
+            yield status, x, result.obj_val + block.offset
+
+    def solve(self, problem: cp.Problem, warm_start: bool = False, verbose: bool = False, **settings: Any) -> None:
+        """Solve `problem` with its current parameter values and store the solution in it.
+
+        Afterwards `problem.status`, `problem.value`, the variables' values and
+        `problem.solver_stats` read as they would after `problem.solve`, and so
+        do its set-up and solve times and the solver kept in its solver cache.
+
+        Args:
+            problem: The problem this path was compiled from.
+            warm_start: Update the native solver of the previous solve in place
+                rather than setting up a new one.
+            verbose: Let Clarabel print its progress.
+            **settings: Clarabel settings, e.g. `tol_gap_abs`.
+
+        Raises:
+            CvxSolverError: If Clarabel fails without a solution or a verdict of
+                infeasible or unbounded, which `problem` could not represent.
+        """
+        start = time.perf_counter()
+        data = self.data(problem)
+        q, A, b = data.q, data.A, data.b  # noqa: N806  # solver-data names
+
+        native = self._workspace.get("solver") if warm_start else None
+        # a presolved problem can be updated in place only if it kept the same rows and columns
+        if (
+            native is not None
+            and native.is_data_update_allowed()
+            and self._workspace.get("structure") == data.structure
+        ):
+            native.update(q=q, A=A, b=b, settings=CLARABEL.parse_solver_opts(verbose, settings, native.get_settings()))
+        else:
+            # A cone program has no quadratic term: P is an empty sparse matrix, of
+            # A's type so as not to import scipy, which only cvxpy depends on.
+            P = type(A)((q.size, q.size))  # noqa: N806  # solver-data names
+            settings_ = CLARABEL.parse_solver_opts(verbose, settings)
+            native = clarabel.DefaultSolver(P, q, A, b, dims_to_solver_cones(data.dims), settings_)  # ty: ignore[unresolved-attribute]
+            self._workspace["solver"] = native
+            self._workspace["structure"] = data.structure
+
+        setup = time.perf_counter()
+        result = native.solve()
+        end = time.perf_counter()
+        status = CLARABEL.STATUS_MAP.get(str(result.status), s.SOLVER_ERROR)
+        attr = {s.SOLVE_TIME: result.solve_time, s.NUM_ITERS: result.iterations}
+
+        if status in s.SOLUTION_PRESENT:
+            x = np.zeros(self.program.x.size)
+            x[data.keep] = result.x
+            primal = {var_id: x[columns] for var_id, columns in self.columns.items()}
+            problem.unpack(Solution(status, result.obj_val + data.offset, primal, {}, attr))
+        elif status in s.INF_OR_UNB:
+            problem.unpack(failure_solution(status, attr))
+        else:
+            raise CvxSolverError(f"Problem status is {status}")  # noqa: TRY003
+
+        # cvxpy only fills these in on its own solve path
+        problem._solver_stats = SolverStats.from_dict(attr, CLARABEL().name())
+        problem._solver_cache[CLARABEL().name()] = native
+        problem._compilation_time = setup - start
+        problem._solve_time = end - setup
+
+
+def _presolve(
+    q: npt.NDArray[np.float64],
+    A: Any,  # noqa: N803  # solver-data names
+    b: npt.NDArray[np.float64],
+    dims: Any,
+    pinned: npt.NDArray[np.intp],
+) -> tuple[npt.NDArray[np.float64], Any, npt.NDArray[np.float64], Any, npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Remove the `pinned` columns and what they leave empty from a cone program.
+
+    A row left with no entries is `b >= 0` in its cone, and is dropped where
+    that holds trivially: `b == 0` in the zero cone, `b >= 0` in the
+    nonnegative cone, and `b == 0` outside the head of a second-order cone,
+    which then loses a dimension. Any other empty row is kept, for Clarabel to
+    find the problem infeasible. A column then left with no entries and no
+    cost is free and is dropped too. Other cones are left as they are.
+
+    Returns:
+        The presolved `(q, A, b)` and cone dimensions, and the columns and rows
+        of the original data that remain.
+    """
+    columns = np.ones(q.size, dtype=bool)
+    columns[pinned] = False
+    A = A[:, columns]  # noqa: N806  # solver-data names
+
+    empty = np.asarray(abs(A).sum(axis=1)).ravel() == 0
+    rows = np.ones(b.size, dtype=bool)
+    zero, nonneg = dims.zero, dims.nonneg
+    rows[:zero] = ~(empty[:zero] & (b[:zero] == 0))
+    rows[zero : zero + nonneg] = ~(empty[zero : zero + nonneg] & (b[zero : zero + nonneg] >= 0))
+
+    soc, start = [], zero + nonneg
+    for dim in dims.soc:
+        drop = empty[start + 1 : start + dim] & (b[start + 1 : start + dim] == 0)
+        # keep one row besides the head, so the cone stays a cone
+        if drop.size and drop.all():
+            drop[0] = False
+        rows[start + 1 : start + dim] = ~drop
+        soc.append(dim - int(drop.sum()))
+        start += dim
+
+    A = A[rows]  # noqa: N806  # solver-data names
+    free = np.asarray(abs(A).sum(axis=0)).ravel() == 0
+    free &= q[columns] == 0
+    A = A[:, ~free]  # noqa: N806  # solver-data names
+    columns[np.flatnonzero(columns)[free]] = False
+
+    dims = copy.copy(dims)
+    dims.zero, dims.nonneg, dims.soc = int(rows[:zero].sum()), int(rows[zero : zero + nonneg].sum()), soc
+    return q[columns], A, b[rows], dims, np.flatnonzero(columns), np.flatnonzero(rows)
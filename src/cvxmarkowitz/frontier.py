@@ -0,0 +1,164 @@
+#    Copyright 2023 Stanford University Convex Optimization Group
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""Efficient frontiers: one compiled problem solved over a grid of risk limits."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+import cvxpy as cp
+import numpy as np
+
+from cvxmarkowitz.cvxerror import CvxDataError, CvxSolverError
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.problem import Problem
+from cvxmarkowitz.types import Matrix
+from cvxmarkowitz.utils import processes
+
+# one point of the frontier: weights, expected return, risk, status
+_Point = tuple[Matrix, float, float, str]
+
+
+@dataclass(frozen=True)
+class Frontier:
+    """The solutions of a problem along a grid of risk limits, stacked.
+
+    Row `i` of every array belongs to `limits[i]`. Points the solver could not
+    solve to optimality -- limits below the least risk attainable, say -- carry
+    their status and NaN weights, return and risk.
+
+    Attributes:
+        limits: The risk limits, in the order they were given.
+        weights: Asset weights, one row per limit.
+        returns: The expected return (as the problem's `ExpectedReturns`
+            estimates it) of each solution.
+        risks: The risk (as the problem's risk model estimates it) of each.
+        status: The cvxpy status of each solve.
+    """
+
+    limits: Matrix
+    weights: Matrix
+    returns: Matrix
+    risks: Matrix
+    status: list[str]
+
+
+def frontier(
+    problem: Problem,
+    limit: cp.Parameter,
+    limits: Iterable[float],
+    workers: int = 1,
+    solver: str | None = None,
+    **kwargs: Any,
+) -> Frontier:
+    """Solve `problem` once for each value of `limit` in `limits`.
+
+    Meant for `MaxSharpe`, whose `sigma_max` is the limit; update the problem
+    with its data first, then sweep:
+
+        builder = MaxSharpe(assets=20)
+        problem = builder.build()
+        problem.update(**data)
+        result = frontier(problem, builder.parameter[P.SIGMA_MAX], np.linspace(0.1, 0.3, 50))
+
+    The limits are solved in increasing order, so that every solve but the
+    first starts warm from its neighbour on the frontier (see `Problem.solve`
+    for what that buys each solver); the results come back in the order given.
+    With more than one worker the sorted grid is cut into one contiguous run
+    per worker process, each of which receives one pickled copy of the problem
+    and sweeps its run with it. Compile the problem first (solve it once, or
+    call `get_problem_data`) and the copies arrive compiled.
+
+    With one worker the sweep runs on `problem` itself, which is left holding
+    the largest limit.
+
+    Args:
+        problem: The problem to solve, its data in place.
+        limit: The scalar parameter of `problem` to sweep.
+        limits: The values to give it.
+        workers: Number of worker processes; 1 sweeps in this process.
+        solver: The solver to use; by default the one `problem.solver` names.
+        **kwargs: Further keyword arguments forwarded to `Problem.solve`.
+
+    Returns:
+        The stacked solutions, in the order of `limits`.
+
+    Raises:
+        CvxDataError: If `problem` has no expected returns to trace, or
+            `limit` is not one of its parameters.
+    """
+    if M.RETURN not in problem.model:
+        raise CvxDataError("A frontier needs a problem with expected returns, like MaxSharpe")  # noqa: TRY003
+    if all(parameter.id != limit.id for parameter in problem.problem.parameters()):
+        raise CvxDataError(f"{limit.name()} is not a parameter of the problem")  # noqa: TRY003
+
+    grid = np.asarray(list(limits), dtype=float)
+    order = np.argsort(grid, kind="stable")
+    runs = [run.tolist() for run in np.array_split(grid[order], max(min(workers, grid.size), 1))]
+
+    task = partial(_sweep_in_worker, limit.id, solver=solver, kwargs=kwargs)
+    if len(runs) == 1:
+        points = _sweep(problem, limit.id, runs[0], solver=solver, kwargs=kwargs)
+    else:
+        with processes.pool(len(runs), problem) as pool:
+            points = [point for run in pool.map(task, runs) for point in run]
+
+    # back from the sorted order to the order given
+    unsorted = [points[i] for i in np.argsort(order, kind="stable")]
+    weights, returns, risks, status = zip(*unsorted, strict=True) if unsorted else ((), (), (), ())
+
+    return Frontier(
+        limits=grid,
+        weights=np.array(weights, dtype=float).reshape(grid.size, *problem.variables[D.WEIGHTS].shape),
+        returns=np.array(returns),
+        risks=np.array(risks),
+        status=list(status),
+    )
+
+
+def _sweep_in_worker(limit_id: int, limits: list[float], solver: str | None, kwargs: dict[str, Any]) -> list[_Point]:
+    """Sweep one run of limits on the problem installed in this worker process."""
+    return _sweep(processes.installed(), limit_id, limits, solver=solver, kwargs=kwargs)
+
+
+def _sweep(
+    problem: Problem, limit_id: int, limits: list[float], solver: str | None, kwargs: dict[str, Any]
+) -> list[_Point]:
+    """Solve `problem` for each limit in turn, each solve warm from the one before.
+
+    The limit is found by id, which pickling preserves, so this works on a copy
+    of the problem as well as on the original.
+    """
+    limit = next(parameter for parameter in problem.problem.parameters() if parameter.id == limit_id)
+    expected_return = problem.model[M.RETURN].estimate(problem.variables)
+    risk = problem.model[M.RISK].estimate(problem.variables)
+
+    points: list[_Point] = []
+    for i, value in enumerate(limits):
+        limit.value = value
+        try:
+            problem.solve(solver=solver, warm_start=i > 0, **kwargs)
+        except CvxSolverError:
+            nan = float("nan")
+            points.append((np.full(problem.variables[D.WEIGHTS].shape, nan), nan, nan, str(problem.problem.status)))
+        else:
+            points.append(
+                (problem.weights, float(np.asarray(expected_return.value)), float(np.asarray(risk.value)), cp.OPTIMAL)
+            )
+
+    return points
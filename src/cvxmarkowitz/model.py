@@ -67,6 +67,21 @@ class Model(ABC):
         """
         return tuple(self.data)
 
+    def targets(self) -> Parameter | None:
+        """Return the parameter each keyword of `update` is written to, by keyword.
+
+        This is what `update` does with valid data, spelled out: write each
+        keyword into its parameter with `fill_parameter`. `Problem` flattens the
+        targets of its models into the plan `update(validate=False)` runs in
+        place of `update`, with none of its checks.
+
+        The default is `data`. Override it alongside `keywords` when `update`
+        writes a keyword `data` does not back, and return None when `update`
+        does more with valid data than write it -- derive a value from it, say;
+        `update(validate=False)` then calls `update` for the model as before.
+        """
+        return dict(self.data)
+
     @abstractmethod
     def estimate(self, variables: Variables) -> cp.Expression:
         """Return this component's objective contribution, given the variables.
@@ -0,0 +1,74 @@
+#    Copyright 2023 Stanford University Convex Optimization Group
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""Model for the active universe."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import cvxpy as cp
+import numpy as np
+
+from cvxmarkowitz.cvxerror import CvxDataError
+from cvxmarkowitz.model import Model
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.types import Constraints, Matrix, Variables
+from cvxmarkowitz.utils.fill import fill_parameter
+
+
+@dataclass(frozen=True)
+class ActiveSet(Model):
+    """Mask of the assets in the current universe; the others are held at zero.
+
+    A problem compiled for many assets serves a smaller universe once the
+    inactive assets are pinned to zero. The mask makes that explicit: its
+    parameter is 1 for an active asset and 0 for an inactive one, and the
+    constraint `(1 - active) * w == 0` holds every inactive weight at zero. A
+    mask shorter than `assets` is padded with zeros, like any other input, so
+    the padded assets are inactive.
+
+    Knowing which assets are inactive lets the fast path drop them from the
+    solver data before a solve -- see `cvxmarkowitz.fast.FastPath`.
+    """
+
+    def __post_init__(self) -> None:
+        """Initialize the mask with every asset active."""
+        self.data[D.ACTIVE] = cp.Parameter(shape=self.assets, name=D.ACTIVE, value=np.ones(self.assets))
+
+    def estimate(self, variables: Variables) -> cp.Expression:
+        """No estimation for the mask.
+
+        The mask only contributes a constraint; it does not produce an objective term.
+        """
+        raise NotImplementedError("No estimation for the active set")
+
+    def update(self, **kwargs: Matrix) -> None:
+        """Assign the mask, padding it with inactive assets.
+
+        Expected keyword arguments:
+            active: Boolean vector, or a vector of zeros and ones, True for an
+                asset in the universe.
+
+        Raises:
+            CvxDataError: If the mask holds values other than 0 and 1.
+        """
+        active = np.asarray(kwargs[D.ACTIVE], dtype=np.float64)
+        if not np.isin(active, (0.0, 1.0)).all():
+            raise CvxDataError("The active mask must hold zeros and ones only")  # noqa: TRY003
+
+        fill_parameter(self.data[D.ACTIVE], active)
+
+    def constraints(self, variables: Variables) -> Constraints:
+        """Return the constraint holding the inactive weights at zero."""
+        return {"inactive": cp.multiply(1 - self.data[D.ACTIVE], variables[D.WEIGHTS]) == 0}
@@ -22,7 +22,7 @@ import numpy as np
 
 from cvxmarkowitz.model import Model
 from cvxmarkowitz.types import Constraints, Matrix, Variables
-from cvxmarkowitz.utils.fill import fill_vector
+from cvxmarkowitz.utils.fill import fill_parameter
 
 
 @dataclass(frozen=True)
@@ -67,8 +67,8 @@ class Bounds(Model):
 
     def update(self, **kwargs: Matrix) -> None:
         """Assign lower/upper vectors, padding or trimming to asset length."""
-        self.data[self._f("lower")].value = fill_vector(num=self.assets, x=kwargs[self._f("lower")])
-        self.data[self._f("upper")].value = fill_vector(num=self.assets, x=kwargs[self._f("upper")])
+        fill_parameter(self.data[self._f("lower")], kwargs[self._f("lower")])
+        fill_parameter(self.data[self._f("upper")], kwargs[self._f("upper")])
 
     def constraints(self, variables: Variables) -> Constraints:
         """Return lower/upper inequality constraints for `acting_on` variable.
@@ -23,13 +23,19 @@ import numpy as np
 from cvxmarkowitz.cvxerror import CvxDataError
 from cvxmarkowitz.model import Model
 from cvxmarkowitz.names import DataNames as D
-from cvxmarkowitz.types import Matrix, Variables
-from cvxmarkowitz.utils.fill import fill_vector
+from cvxmarkowitz.types import Matrix, Parameter, Variables
+from cvxmarkowitz.utils.fill import fill_parameter
 
 
 @dataclass(frozen=True)
 class ExpectedReturns(Model):
-    """Model for expected returns."""
+    """Model for expected returns.
+
+    With `robust=False` the return is the plain w^T mu: no `mu_uncertainty`
+    parameter, no |w| term, and `update` takes `mu` alone.
+    """
+
+    robust: bool = True
 
     def __post_init__(self) -> None:
         """Initialize expected-return parameters and uncertainty bounds."""
@@ -40,6 +46,9 @@ class ExpectedReturns(Model):
         )
 
         # Robust return estimate
+        if not self.robust:
+            return
+
         self.parameter[D.MU_UNCERTAINTY] = cp.Parameter(
             shape=self.assets,
             name=D.MU_UNCERTAINTY,
@@ -56,8 +65,15 @@ class ExpectedReturns(Model):
         `Problem.update` would let a caller omit it and then fail with a
         `KeyError` from `update` below.
         """
+        if not self.robust:
+            return super().keywords
+
         return (*self.data, D.MU_UNCERTAINTY)
 
+    def targets(self) -> Parameter:
+        """Return the parameters of `mu` and, when robust, of `mu_uncertainty`."""
+        return {**self.data, **self.parameter}
+
     def estimate(self, variables: Variables) -> cp.Expression:
         """Return robust expected return w^T mu - mu_uncertainty^T |w|.
 
@@ -67,6 +83,9 @@ class ExpectedReturns(Model):
         Returns:
             A CVXPY expression for the robust expected return.
         """
+        if not self.robust:
+            return self.data[D.MU] @ variables[D.WEIGHTS]
+
         return self.data[D.MU] @ variables[D.WEIGHTS] - self.parameter[D.MU_UNCERTAINTY] @ cp.abs(variables[D.WEIGHTS])
 
     def update(self, **kwargs: Matrix) -> None:
@@ -74,14 +93,17 @@ class ExpectedReturns(Model):
 
         Expected keyword arguments:
             mu: Vector of expected returns.
-            mu_uncertainty: Nonnegative vector with element-wise uncertainty.
+            mu_uncertainty: Nonnegative vector with element-wise uncertainty,
+                only when the model is robust.
         """
         exp_returns = kwargs[D.MU]
-        self.data[D.MU].value = fill_vector(num=self.assets, x=exp_returns)
+        fill_parameter(self.data[D.MU], exp_returns)
+        if not self.robust:
+            return
 
         # Robust return estimate
         uncertainty = kwargs[D.MU_UNCERTAINTY]
         if not uncertainty.shape[0] == exp_returns.shape[0]:
             raise CvxDataError("Mismatch in length for mu and mu_uncertainty")  # noqa: TRY003
 
-        self.parameter[D.MU_UNCERTAINTY].value = fill_vector(num=self.assets, x=uncertainty)
+        fill_parameter(self.parameter[D.MU_UNCERTAINTY], uncertainty)
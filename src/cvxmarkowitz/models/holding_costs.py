@@ -23,7 +23,7 @@ import numpy as np
 from cvxmarkowitz.model import Model
 from cvxmarkowitz.names import DataNames as D
 from cvxmarkowitz.types import Matrix, Variables
-from cvxmarkowitz.utils.fill import fill_vector
+from cvxmarkowitz.utils.fill import fill_parameter
 
 
 @dataclass(frozen=True)
@@ -40,4 +40,4 @@ class HoldingCosts(Model):
 
     def update(self, **kwargs: Matrix) -> None:
         """Update the holding-cost vector from kwargs[D.HOLDING_COSTS]."""
-        self.data[D.HOLDING_COSTS].value = fill_vector(num=self.assets, x=kwargs[D.HOLDING_COSTS])
+        fill_parameter(self.data[D.HOLDING_COSTS], kwargs[D.HOLDING_COSTS])
@@ -24,7 +24,7 @@ from cvxmarkowitz.model import Model
 from cvxmarkowitz.names import DataNames as D
 from cvxmarkowitz.names import ParameterName as P
 from cvxmarkowitz.types import Matrix, Variables
-from cvxmarkowitz.utils.fill import fill_vector
+from cvxmarkowitz.utils.fill import fill_parameter
 
 
 @dataclass(frozen=True)
@@ -62,4 +62,4 @@ class TradingCosts(Model):
         Expected keyword arguments:
             weights: Vector of previous weights used as the trading baseline.
         """
-        self.data[D.WEIGHTS].value = fill_vector(num=self.assets, x=kwargs[D.WEIGHTS])
+        fill_parameter(self.data[D.WEIGHTS], kwargs[D.WEIGHTS])
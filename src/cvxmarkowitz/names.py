@@ -45,6 +45,7 @@ class DataNames:
     SYSTEMATIC_VOLA_UNCERTAINTY = "systematic_vola_uncertainty"
     FACTOR_WEIGHTS = "factor_weights"
     WEIGHTS = "weights"
+    ACTIVE = "active"
     _ABS = "_abs"
 
 
@@ -55,6 +56,7 @@ class ModelName:
     RETURN = "return"
     BOUND_ASSETS = "bound_assets"
     BOUND_FACTORS = "bound_factors"
+    ACTIVE = "active"
 
 
 class ConstraintName:
@@ -74,3 +76,4 @@ class ParameterName:
     OMEGA = "omega"
     SIGMA_TARGET = "sigma_target"
     POWER = "power"
+    ALPHA = "alpha"
@@ -33,16 +33,16 @@ class MaxSharpe(Builder):
     @property
     def objective(self) -> cp.Maximize:
         """Return the CVXPY objective for maximizing expected return."""
-        return cp.Maximize(self.model[M.RETURN].estimate(self.variables))
+        return cp.Maximize(self.estimate(M.RETURN))
 
     def __post_init__(self) -> None:
         """Initialize models, parameters, and constraints for the builder."""
         super().__post_init__()
 
-        self.model[M.RETURN] = ExpectedReturns(assets=self.assets)
+        self.model[M.RETURN] = ExpectedReturns(assets=self.assets, robust=self.robust)
 
         self.parameter[P.SIGMA_MAX] = cp.Parameter(nonneg=True, name="maximal volatility")
 
         self.constraints[C.LONG_ONLY] = self.weights >= 0
         self.constraints[C.BUDGET] = cp.sum(self.weights) == 1.0
-        self.constraints[C.RISK] = self.risk.estimate(self.variables) <= self.parameter[P.SIGMA_MAX]
+        self.constraints[C.RISK] = self.estimate(M.RISK) <= self.parameter[P.SIGMA_MAX]
@@ -21,6 +21,7 @@ import cvxpy as cp
 
 from cvxmarkowitz.builder import Builder
 from cvxmarkowitz.names import ConstraintName as C
+from cvxmarkowitz.names import ModelName as M
 
 
 @dataclass(frozen=True)
@@ -30,7 +31,7 @@ class MinVar(Builder):
     @property
     def objective(self) -> cp.Minimize:
         """Return the CVXPY objective for minimizing portfolio risk."""
-        return cp.Minimize(self.risk.estimate(self.variables))
+        return cp.Minimize(self.estimate(M.RISK))
 
     def __post_init__(self) -> None:
         """Set up default constraints for the minimum-variance portfolio."""
@@ -41,10 +41,14 @@ class SoftRisk(Builder):
         )
     )
 
+    def _target_times_omega(self) -> float:
+        """Return the target volatility times the risk priority, read at every solve."""
+        return float(self.parameter[P.SIGMA_TARGET].value * self.parameter[P.OMEGA].value)  # ty: ignore[unsupported-operator]
+
     @property
     def objective(self) -> cp.Maximize:
         """Return the CVXPY objective for soft-risk maximization."""
-        expected_return = self.model[M.RETURN].estimate(self.variables)
+        expected_return = self.estimate(M.RETURN)
         soft_risk = cp.pos(self.parameter[P.OMEGA] * self._sigma - self._sigma_target_times_omega)
         return cp.Maximize(expected_return - soft_risk)
 
@@ -52,18 +56,18 @@ class SoftRisk(Builder):
         """Initialize models, parameters, and constraints for soft-risk portfolio."""
         super().__post_init__()
 
-        self.model[M.RETURN] = ExpectedReturns(assets=self.assets)
+        self.model[M.RETURN] = ExpectedReturns(assets=self.assets, robust=self.robust)
 
         self.parameter[P.SIGMA_MAX] = cp.Parameter(nonneg=True, name="limit volatility")
 
         self.parameter[P.SIGMA_TARGET] = cp.Parameter(nonneg=True, name="target volatility")
 
         self.parameter[P.OMEGA] = cp.Parameter(nonneg=True, name="risk priority")
-        self._sigma_target_times_omega._callback = lambda: (
-            self.parameter[P.SIGMA_TARGET].value * self.parameter[P.OMEGA].value  # ty: ignore[unsupported-operator]
-        )
+        # a bound method rather than a closure, so the builder and the problems
+        # it builds pickle -- to the workers of `Problem.solve_many`, say
+        self._sigma_target_times_omega._callback = self._target_times_omega
 
         self.constraints[C.LONG_ONLY] = self.weights >= 0
         self.constraints[C.BUDGET] = cp.sum(self.weights) == 1.0
-        self.constraints[C.RISK] = self.risk.estimate(self.variables) <= self._sigma
+        self.constraints[C.RISK] = self.estimate(M.RISK) <= self._sigma
         self.constraints["max_risk"] = self._sigma <= self.parameter[P.SIGMA_MAX]
@@ -15,17 +15,86 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import hashlib
+import time
+import warnings
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import cvxpy as cp
 import numpy as np
+from cvxpy.reductions.utilities import ReducedMat
 
 from cvxmarkowitz.cvxerror import CvxDataError, CvxSolverError
 from cvxmarkowitz.model import Model
 from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.stats import SolveStats, residuals
+from cvxmarkowitz.tuning import Trial, Tuning, lookup, signature, store
 from cvxmarkowitz.types import Matrix, Parameter, Variables
+from cvxmarkowitz.utils import serialize
+from cvxmarkowitz.utils.fill import fill_trusted
+
+if TYPE_CHECKING:
+    # asyncio, the process pool and the fast path are imported where they are
+    # used: importing the package should not pay for what few jobs call
+    import asyncio
+    from concurrent.futures import Executor
+
+    from cvxmarkowitz.fast import FastPath, SolverData
+
+
+@dataclass(frozen=True)
+class SolveResult:
+    """The outcome of one solve in a batch run by `Problem.solve_many`.
+
+    Attributes:
+        weights: Asset weights; NaN throughout if the solve was not optimal.
+        value: Objective value; NaN if the solve was not optimal.
+        status: The cvxpy status the solver reported.
+        stats: Timings and solver statistics of the solve.
+    """
+
+    weights: Matrix
+    value: float
+    status: str
+    stats: SolveStats | None = None
+
+
+@dataclass(frozen=True)
+class AccountsResult:
+    """The outcome of `Problem.solve_accounts`.
+
+    Attributes:
+        weights: Asset weights, one row per account; NaN throughout for an
+            account not solved to optimality.
+        values: Objective value of each account; NaN likewise.
+        status: The cvxpy status of each account.
+    """
+
+    weights: Matrix
+    values: Matrix
+    status: list[str]
+
+
+@dataclass(frozen=True)
+class UpdateStep:
+    """One write of the plan `Problem.update(validate=False)` runs.
+
+    Attributes:
+        keyword: The keyword whose data is written.
+        parameter: The parameter it is written to; data smaller than its shape
+            is zero-padded.
+        fill: How the data is written.
+    """
+
+    keyword: str
+    parameter: cp.Parameter
+    fill: Callable[[cp.Parameter, Matrix], None] = fill_trusted
 
 
 @dataclass(frozen=True)
@@ -34,9 +103,54 @@ class Problem:
 
     problem: cp.Problem
     model: dict[str, Model] = field(default_factory=dict)
+    # whether `update` compares data by a digest of its contents; see `update`
+    fingerprints: bool = False
+    # iterations of the most recent cold solve, by solver name; see `iterations_saved`
+    _cold_iterations: dict[str, int] = field(default_factory=dict, repr=False)
+    # direct solver paths set up by `compile_fast`, by solver name
+    _fast_paths: dict[str, FastPath] = field(default_factory=dict, repr=False)
+    # the data of the last update, by keyword, with its fingerprint: None if
+    # not taken, empty if the data was written unchecked; see `update`
+    _inputs: dict[str, tuple[bytes | None, Matrix]] = field(default_factory=dict, repr=False)
+    # time spent in and parameters written by `update` since the last solve,
+    # and the `stats` of that solve
+    _record: dict[str, Any] = field(default_factory=dict, repr=False)
+    # the lock `asolve` holds while it updates and solves, by event loop; never pickled
+    _locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = field(default_factory=dict, repr=False)
+    # the solver `solve` uses when given none, once looked up; see `solver`
+    _tuned: dict[str, str] = field(default_factory=dict, repr=False)
+    # the writes of `update(validate=False)`, flattened from the `targets` of
+    # the models, and the models without targets, which it updates as usual
+    _plan: list[UpdateStep] = field(default_factory=list, init=False, repr=False)
+    _unplanned: list[str] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Compile the plan of `update(validate=False)` from the models."""
+        for name, model in self.model.items():
+            targets = model.targets()
+            if targets is None:
+                self._unplanned.append(name)
+            else:
+                self._plan.extend(UpdateStep(keyword, parameter) for keyword, parameter in targets.items())
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state to pickle, without the solver's native workspace.
+
+        cvxpy keeps the solver object of the last solve (a Clarabel
+        `DefaultSolver`, say) in the problem's `_solver_cache`, and those do not
+        pickle, and neither does the lock of `asolve`, which is left out too.
+        The copy handed to pickle leaves that cache empty; everything
+        else -- including the cached canonicalization -- is shared with `self`
+        and pickled as is, so an unpickled problem does not compile again.
+        """
+        # Not `copy.copy`: cvxpy's `__copy__` rebuilds the expression tree and
+        # with it drops the cached canonicalization this is meant to carry.
+        problem = object.__new__(type(self.problem))
+        problem.__dict__.update(self.problem.__dict__, _solver_cache={})
+        return {**self.__dict__, "problem": problem, "_locks": {}}
 
-    def update(self, **kwargs: Matrix) -> None:
-        """Overwrite the parameter values of every model, **in place**.
+    def update(self, *, validate: bool = True, **kwargs: Matrix) -> None:
+        """Overwrite the parameter values of the models, **in place**.
 
         This mutates the problem rather than returning a new one. `frozen=True`
         on this dataclass only stops attribute rebinding; the `model` mapping and
@@ -51,37 +165,626 @@ class Problem:
 
         Consequently there is only ever one problem. Two `update` calls against
         the same object do not yield two independently parametrized problems --
-        the second overwrites the first. Call `build()` again for that.
+        the second overwrites the first. Call `clone()` for that, which does not
+        compile again, or `build()`.
+
+        Only models whose data changed are written. The problem remembers the
+        data of previous updates by keyword, and an array is unchanged if it is
+        the very array passed for its keyword before; a model none of whose
+        keywords changed keeps its values. So after a first complete update,
+        later ones may pass just the keywords that change -- `problem.update(mu=mu)`,
+        say -- and the models reading other keywords are left alone, while a
+        model with some of its keywords passed is handed the rest from earlier
+        updates. Arrays are remembered by reference: an array mutated in place
+        is still the same array, so pass a fresh one for new data. `stats`
+        counts the parameters written.
+
+        Any other array counts as changed and is written, which costs little
+        next to comparing it. Where equal data arrives in fresh arrays -- read
+        again from a store every period, say -- and the models are costly to
+        write, build the problem with `fingerprints=True`:
+
+            problem = dataclasses.replace(builder.build(), fingerprints=True)
+
+        An array of the shape and type of the one before then counts as changed
+        only if a digest of its contents differs, which takes a pass over it.
 
         Returns `None` (like `Model.update`) so the in-place semantics are
         visible at the call site.
 
+        With `validate=False` none of this is checked or compared: the data
+        passed is written, as is, by a plan compiled when the problem was
+        built -- for each keyword, the parameters it goes to (see
+        `Model.targets`) -- without going through the models, and without
+        cvxpy's checks of every value against its parameter. That saves most
+        of the cost of an update of a small problem, where those checks
+        outweigh the solve; the price is that data of the wrong length, sign
+        or kind is no longer caught, but solved as given. Keep it for data
+        that has been through a validated update before, or is known good.
+        Keywords no model takes are ignored either way.
+
+        An update that raises may have written some models before it did; the
+        data it was given is then forgotten, so the next update has to give
+        those keywords again, and writes them whatever they were before.
+
+        Args:
+            validate: Check the data, and write only what changed. Pass it
+                when unpacking a mapping of data, too: type checkers match the
+                mapping's arrays against it otherwise.
+            **kwargs: The data, by keyword.
+
         Raises:
-            CvxDataError: If any model is missing data for one of its parameters.
+            CvxDataError: If any model is missing data for one of its parameters,
+                in this update and all earlier ones.
         """
+        start = time.perf_counter()
+
+        if not validate:
+            self._write(kwargs)
+            self._record["update_time"] = self._record.get("update_time", 0.0) + time.perf_counter() - start
+            return
+
+        fingerprints = {key: self._compare(key, value) for key, value in kwargs.items()}
+        changed = {key for key, (_, same) in fingerprints.items() if not same}
+        data = {key: value for key, (_, value) in self._inputs.items()} | kwargs
+
         for name, model in self.model.items():
             # `Model.keywords`, not `model.data`: a model may consume a keyword
             # that `data` does not back (see `ExpectedReturns.keywords`), and
             # checking `data` alone let those through to a bare KeyError.
             for key in model.keywords:
-                if key not in kwargs:
+                if key not in data:
                     raise CvxDataError(f"Missing data for {key} in model {name}")  # noqa: TRY003
 
-            # It's tempting to operate without the models at this stage.
-            # However, we would give up a lot of convenience. For example,
-            # the models can be prepared to deal with data that has not
-            # exactly the correct shape.
-            model.update(**kwargs)
+        written = 0
+        try:
+            for model in self.model.values():
+                # every keyword was seen by an earlier update, none has changed since
+                if changed.isdisjoint(model.keywords) and all(key in self._inputs for key in model.keywords):
+                    continue
+
+                # It's tempting to operate without the models at this stage.
+                # However, we would give up a lot of convenience. For example,
+                # the models can be prepared to deal with data that has not
+                # exactly the correct shape.
+                model.update(**data)
+                written += _size(model)
+        except Exception:
+            self._forget(kwargs)
+            raise
+
+        self._inputs.update({key: (fingerprints[key][0], value) for key, value in kwargs.items()})
+        self._record["parameters_written"] = self._record.get("parameters_written", 0) + written
+        self._record["update_time"] = self._record.get("update_time", 0.0) + time.perf_counter() - start
+
+    def _compare(self, key: str, value: Matrix) -> tuple[bytes | None, bool]:
+        """Return the fingerprint to remember for `value`, and whether it equals the data of `key`.
+
+        The cheap checks go first: the same array as before, then its shape and
+        type; only with `fingerprints` set are the contents hashed.
+        """
+        previous = self._inputs.get(key)
+        if previous is None:
+            return (_fingerprint(value) if self.fingerprints else None), False
+
+        fingerprint, remembered = previous
+        # data written unchecked is never taken for checked data
+        if value is remembered and fingerprint != b"":
+            return fingerprint, True
+        if not self.fingerprints:
+            return None, False
+        if np.shape(value) != np.shape(remembered) or np.asarray(value).dtype != np.asarray(remembered).dtype:
+            return _fingerprint(value), False
+
+        digest = _fingerprint(value)
+        return digest, digest == fingerprint
+
+    def _write(self, kwargs: dict[str, Matrix]) -> None:
+        """Write `kwargs` by the plan, unchecked; see `update`."""
+        written = 0
+        try:
+            for step in self._plan:
+                if step.keyword in kwargs:
+                    step.fill(step.parameter, kwargs[step.keyword])
+                    written += 1
+
+            for name in self._unplanned:
+                model = self.model[name]
+                if not kwargs.keys().isdisjoint(model.keywords):
+                    model.update(**{key: value for key, (_, value) in self._inputs.items()} | kwargs)
+                    written += _size(model)
+        except Exception:
+            self._forget(kwargs)
+            raise
+
+        # an empty fingerprint matches none: a validated update writes the data again
+        self._inputs.update({key: (b"", value) for key, value in kwargs.items()})
+        self._record["parameters_written"] = self._record.get("parameters_written", 0) + written
+
+    def _forget(self, keywords: Iterable[str]) -> None:
+        """Forget the data remembered for `keywords`, after an update failed midway.
 
-    def solve(self, solver: str = cp.CLARABEL, **kwargs: Any) -> float:
-        """Solve the problem."""
-        value = self.problem.solve(solver=solver, **kwargs)
+        The models written before the failure hold data that was rejected, and
+        the data remembered no longer describes them: had it been kept, sending
+        it again would have been taken for no change, and the rejected data
+        solved. Forgotten, the keywords must be given again, and are written.
+        """
+        for key in keywords:
+            self._inputs.pop(key, None)
+
+    def solve(self, solver: str | None = None, warm_start: bool = False, **kwargs: Any) -> float:
+        """Solve the problem.
+
+        Every solve starts cold unless `warm_start=True` is passed, in which
+        case the solver picks up from the state the previous solve left behind.
+        What that state is depends on the solver: SCS and OSQP are handed the
+        previous primal and dual iterate, which is what cuts iterations when
+        consecutive data sets are close -- successive dates of a backtest, say.
+        Clarabel is an interior-point method and takes no starting point; it
+        keeps its workspace and factorization structure instead, which saves
+        set-up time but not iterations.
+
+        `iterations_saved` reports what a warm solve gained over the last cold
+        one with the same solver, and `stats` where the time of the solve went.
+
+        After `compile_fast`, Clarabel solves take the direct path it set up.
+
+        Args:
+            solver: The solver to use; `solver` -- the one `autotune` chose
+                for this structure, or Clarabel -- if None.
+            warm_start: Start from the state of the previous solve.
+            **kwargs: Further keyword arguments forwarded to `cvxpy.Problem.solve`
+                -- or, on the fast path, Clarabel settings and `verbose`.
+
+        Returns:
+            The optimal objective value.
+
+        Raises:
+            CvxSolverError: If the solver does not report an optimal solution.
+        """
+        solver = self.solver if solver is None else solver
+        program = self.problem._cache.param_prog
+        start = time.perf_counter()
+
+        fast_path = self._fast_paths.get(solver)
+        with _quiet_sparse_reads():
+            if fast_path is not None:
+                fast_path.solve(self.problem, warm_start=warm_start, **kwargs)
+                value = self.problem.value
+            else:
+                value = self.problem.solve(solver=solver, warm_start=warm_start, **kwargs)
+
+        self._record["stats"] = self._collect_stats(
+            time.perf_counter() - start, compiled=self.problem._cache.param_prog is not program
+        )
 
         if self.problem.status is not cp.OPTIMAL:
             raise CvxSolverError(f"Problem status is {self.problem.status}")  # noqa: TRY003
 
+        if not warm_start:
+            self._cold_iterations[self.problem.solver_stats.solver_name] = self.iterations
+
         return float(value)
 
+    def compile_fast(self) -> None:
+        """Route later Clarabel solves past cvxpy, straight to the solver.
+
+        Compiles the problem for Clarabel (a no-op if `solve` already did) and
+        keeps the affine map from parameter values to solver data it produced.
+        From then on, `update` followed by `solve` is a sparse matrix-vector
+        product to get the data, one `clarabel.DefaultSolver` call, and the
+        primal solution written back into the variables -- without cvxpy's
+        per-solve chain. See `cvxmarkowitz.fast.FastPath` for what is skipped;
+        notably, constraints carry no dual values afterwards.
+
+        The objective value, the weights and `iterations` read as before. Other
+        solvers keep the cvxpy path.
+
+        A problem built with `mask=True` hands its mask to the fast path, which
+        then drops the inactive assets from the solver data on every solve.
+        """
+        from cvxmarkowitz.fast import FastPath
+
+        active = self.model.get(M.ACTIVE)
+        mask = None if active is None else (active.data[D.ACTIVE], self.variables[D.WEIGHTS])
+        with _quiet_sparse_reads():
+            self._fast_paths[cp.CLARABEL] = FastPath.compile(self.problem, mask=mask)
+
+    @property
+    def solver(self) -> str:
+        """Return the solver `solve` uses when given none.
+
+        That is the solver `autotune` chose for a problem of this structure,
+        in this process or an earlier one, as recorded in the file of tuned
+        solvers (see `cvxmarkowitz.tuning.solvers_file`); Clarabel if there
+        is none, or if the one chosen is not installed here. The file is read
+        on first use only.
+        """
+        if "solver" not in self._tuned:
+            choice = lookup(signature(self.problem))
+            self._tuned["solver"] = choice if choice is not None and choice in cp.installed_solvers() else cp.CLARABEL
+        return self._tuned["solver"]
+
+    def autotune(
+        self,
+        samples: Iterable[Mapping[str, Matrix]],
+        solvers: Iterable[str] | None = None,
+        reference: str = cp.CLARABEL,
+        tolerance: float = 1e-4,
+        path: str | Path | None = None,
+    ) -> Tuning:
+        """Time every solver on sample data and make the fastest accurate one the default.
+
+        Each sample is a keyword payload as `update` takes it, ideally real
+        data the problem will see. The reference solver solves all of them
+        first. Then each solver in turn solves them all: once untimed, on the
+        first sample, to compile the problem for it, and then every sample,
+        timed as `solve` runs -- on the fast path for Clarabel after
+        `compile_fast`. A solver that cannot handle the problem at all, or
+        does not solve a sample to optimality, is recorded as such and does
+        not stop the others.
+
+        The winner is the fastest solver that solves every sample with an
+        objective value within `tolerance` of the reference (relative to its
+        size, or absolute below 1), or the reference if none does. It becomes
+        the default of `solve`, `solve_many`, `asolve` and `save`, and is
+        recorded under the signature of the problem's structure -- which does
+        not depend on the data -- so later problems of the same structure, in
+        other processes too, default to it as well.
+
+        Afterwards the problem holds the data of the last sample, compiled for
+        the winner.
+
+        Args:
+            samples: Keyword payloads to solve, at least one.
+            solvers: The solvers to try; every installed solver if None.
+            reference: The solver whose objective values count as exact.
+            tolerance: The largest relative error a solver may make.
+            path: The file of tuned solvers; `cvxmarkowitz.tuning.solvers_file()`
+                if None.
+
+        Returns:
+            The winner and how every solver fared.
+
+        Raises:
+            CvxDataError: If there are no samples, one is missing data a
+                model needs, or there is no file to store the outcome in.
+            CvxSolverError: If the reference does not solve a sample to optimality.
+        """
+        samples = list(samples)
+        if not samples:
+            raise CvxDataError("autotune needs at least one sample")  # noqa: TRY003
+
+        expected = []
+        for payload in samples:
+            self.update(validate=True, **payload)
+            expected.append(self.solve(solver=reference))
+
+        trials = [self._trial(solver, samples, expected) for solver in solvers or cp.installed_solvers()]
+        passed = [trial for trial in trials if trial.passes(tolerance)]
+        winner = min(passed, key=lambda trial: trial.time).solver if passed else reference
+
+        tuning = Tuning(signature=signature(self.problem), solver=winner, trials=trials)
+        store(tuning, path)
+        self._tuned["solver"] = winner
+        self.get_problem_data(winner)
+        return tuning
+
+    def _trial(self, solver: str, samples: list[Mapping[str, Matrix]], expected: list[float]) -> Trial:
+        """Solve every sample with `solver`, timing the solves and comparing their values."""
+        times, errors = [], []
+        try:
+            self.update(validate=True, **samples[0])
+            self.solve(solver=solver)
+        except (CvxSolverError, cp.error.SolverError):
+            # cvxpy raises SolverError for a solver that cannot take the problem
+            pass
+
+        for payload, value in zip(samples, expected, strict=True):
+            self.update(validate=True, **payload)
+            start = time.perf_counter()
+            try:
+                result = self.solve(solver=solver)
+            except (CvxSolverError, cp.error.SolverError):
+                continue
+            times.append(time.perf_counter() - start)
+            errors.append(abs(result - value) / max(abs(value), 1.0))
+
+        return Trial(
+            solver=solver,
+            time=float(np.mean(times)) if times else float("nan"),
+            error=max(errors, default=float("nan")),
+            solved=len(times),
+            samples=len(samples),
+        )
+
+    @property
+    def iterations(self) -> int:
+        """Return the number of iterations the solver took in the last solve, 0 before any."""
+        stats = self.problem.solver_stats
+        return int(stats.num_iters or 0) if stats is not None else 0
+
+    @property
+    def stats(self) -> SolveStats | None:
+        """Return the timings and solver statistics of the last solve, None before any.
+
+        Also recorded when the solve did not end optimal, before `solve` raises.
+        """
+        return self._record.get("stats")
+
+    def _collect_stats(self, elapsed: float, compiled: bool) -> SolveStats:
+        """Split the `elapsed` time of the solve just finished into its phases."""
+        # cvxpy times the set-up and the solver call (`_solve_time` has no public
+        # accessor); what is left of the solve is unpacking the solution
+        setup_time = self.problem.compilation_time or 0.0
+        solve_time = self.problem._solve_time or 0.0
+        solver = self.problem.solver_stats.solver_name
+        primal, dual = residuals(self.problem._solver_cache.get(solver))
+
+        return SolveStats(
+            solver=solver,
+            status=str(self.problem.status),
+            compiled=compiled,
+            update_time=self._record.pop("update_time", 0.0),
+            parameters_written=self._record.pop("parameters_written", 0),
+            setup_time=setup_time,
+            solve_time=solve_time,
+            unpack_time=max(elapsed - setup_time - solve_time, 0.0),
+            iterations=self.iterations,
+            primal_residual=primal,
+            dual_residual=dual,
+        )
+
+    @property
+    def iterations_saved(self) -> int:
+        """Return the iterations the last solve took fewer than the last cold one.
+
+        The baseline is the most recent cold solve (`warm_start=False`) with the
+        same solver, so a cold solve reports 0 and a warm one the difference to
+        that baseline -- negative if it took more. Before any cold solve with
+        the solver there is nothing to compare against, and this is 0 as well.
+        """
+        stats = self.problem.solver_stats
+        if stats is None or stats.solver_name not in self._cold_iterations:
+            return 0
+
+        return self._cold_iterations[stats.solver_name] - self.iterations
+
+    def solve_many(
+        self,
+        data: Iterable[Mapping[str, Matrix]],
+        workers: int = 1,
+        solver: str | None = None,
+        chunksize: int = 1,
+        **kwargs: Any,
+    ) -> Iterator[SolveResult]:
+        """Update and solve once per data set, yielding results in input order.
+
+        Each element of `data` is the keyword payload one `update` call takes.
+        With `workers=1` the data sets are solved here, one after the other,
+        against this very problem -- which is left holding the last of them.
+        With more workers they fan out over a process pool instead: every
+        worker receives one pickled copy of this problem when it starts and
+        `update`s and `solve`s that copy for each task it is handed, so this
+        problem is left untouched. Solve this problem (or call
+        `get_problem_data`) before fanning out and the copies arrive with the
+        canonicalization already cached; otherwise each worker compiles once,
+        on its first task, and reuses it from there.
+
+        A data set the solver cannot solve to optimality does not stop the
+        batch; its result carries the status and NaN weights and value. Missing
+        or malformed data still raises, as `update` does.
+
+        Args:
+            data: Keyword payloads, one per solve.
+            workers: Number of worker processes; 1 solves in this process.
+            solver: The solver to use for every data set; see `solve`.
+            chunksize: Data sets sent to a worker at a time. Raise it when the
+                individual solves are short.
+            **kwargs: Further keyword arguments forwarded to `solve`.
+
+        Yields:
+            One `SolveResult` per data set, in the order of `data`.
+
+        Raises:
+            CvxDataError: If a data set is missing data one of the models needs.
+        """
+        if workers <= 1:
+            for payload in data:
+                yield _solve_one(self, payload, solver=solver, kwargs=kwargs)
+            return
+
+        from cvxmarkowitz.utils import processes
+
+        task = partial(_solve_in_worker, solver=solver, kwargs=kwargs)
+        with processes.pool(workers, self) as pool:
+            yield from pool.map(task, data, chunksize=chunksize)
+
+    def solve_accounts(
+        self, accounts: Iterable[Mapping[str, Matrix]], verbose: bool = False, **settings: Any
+    ) -> AccountsResult:
+        """Solve the problem once per account, with Clarabel, on the leanest path there is.
+
+        The accounts run the strategy of this problem on the data it holds --
+        the factor data, say, written once by an `update` beforehand. They
+        differ in the keywords of their payloads: bounds, previous weights, an
+        active mask. Each payload is written in turn, which as `update` goes
+        touches only the models it changes, mapped to solver data on the fast
+        path -- `compile_fast` is called if it was not -- and solved by one
+        native solver, set up once and updated in place from one account to
+        the next. Nothing is written back into the variables, and no solve
+        statistics are kept.
+
+        Stacking the accounts into one cvxpy problem instead would make cvxpy
+        compile a problem with the parameters of all of them, at a cost in
+        time and memory that grows with the square of their number, and leave
+        the solver no faster: the iterations of the stack are those of its
+        hardest account, each as costly as one of every account.
+
+        Afterwards the problem holds the data of the last account. Give every
+        payload the same keywords, as an account omitting one reads that of
+        the account before it.
+
+        Args:
+            accounts: Keyword payloads, one per account.
+            verbose: Let Clarabel print its progress.
+            **settings: Clarabel settings, e.g. `tol_gap_abs`.
+
+        Returns:
+            The weights of all accounts, one row each, their objective values
+            and statuses. An account the solver cannot solve to optimality does
+            not stop the others.
+
+        Raises:
+            CvxDataError: If a payload is missing data one of the models needs.
+        """
+        if cp.CLARABEL not in self._fast_paths:
+            self.compile_fast()
+        fast_path = self._fast_paths[cp.CLARABEL]
+
+        def blocks() -> Iterator[SolverData]:
+            with _quiet_sparse_reads():
+                for payload in accounts:
+                    self.update(validate=True, **payload)
+                    yield fast_path.data(self.problem)
+
+        results = list(fast_path.solve_batch(blocks(), verbose=verbose, **settings))
+        columns = fast_path.columns[self.variables[D.WEIGHTS].id]
+        # the solver minimizes; a maximized objective is the negative of what it reports
+        sign = -1.0 if isinstance(self.problem.objective, cp.Maximize) else 1.0
+        return AccountsResult(
+            weights=np.array([x[columns] for _, x, _ in results]).reshape(len(results), columns.size),
+            values=sign * np.array([value for _, _, value in results]),
+            status=[status for status, _, _ in results],
+        )
+
+    async def asolve(
+        self,
+        solver: str | None = None,
+        warm_start: bool = False,
+        executor: Executor | None = None,
+        **kwargs: Matrix,
+    ) -> SolveResult:
+        """Update with `kwargs` and solve on an executor, without blocking the event loop.
+
+        The update and the solve run together on `executor` -- a bounded thread
+        pool, typically, shared by the service -- or on the event loop's default
+        executor if None. Since both mutate this problem in place, concurrent
+        calls on one problem take turns: each waits, without holding a thread,
+        until the previous one has finished, and gets back a snapshot of its
+        own solution. Calls on different problems overlap, and so do calls on
+        one problem from different event loops, which should not share it.
+
+            results = await asyncio.gather(
+                problem.asolve(**data_today),
+                problem.asolve(**data_tomorrow),   # waits for the first
+                other.asolve(**data_other),        # runs alongside
+            )
+
+        Cancelling a call that is already running does not interrupt the solve;
+        the next call still waits for it to finish. A data set the solver cannot
+        solve to optimality yields its status and NaN weights and value, as in
+        `solve_many`.
+
+        Args:
+            solver: The solver to use; see `solve`.
+            warm_start: Start from the state of the previous solve.
+            executor: Where to run the update and solve.
+            **kwargs: The data, as passed to `update`.
+
+        Returns:
+            The weights, value, status and statistics of this solve.
+
+        Raises:
+            CvxDataError: If any model is missing data for one of its parameters.
+        """
+        import asyncio
+
+        # an asyncio lock serves the event loop it was first used on only, and
+        # those of loops since closed -- by `asyncio.run` -- are dropped
+        loop = asyncio.get_running_loop()
+        for closed in [other for other in self._locks if other.is_closed()]:
+            del self._locks[closed]
+        lock = self._locks.setdefault(loop, asyncio.Lock())
+        await lock.acquire()
+
+        task = partial(_solve_one, self, kwargs, solver=solver, kwargs={"warm_start": warm_start})
+        try:
+            future = loop.run_in_executor(executor, task)
+        except BaseException:
+            lock.release()
+            raise
+        # released once the solve is over, not when the caller stops waiting
+        future.add_done_callback(lambda _: lock.release())
+
+        return await asyncio.shield(future)
+
+    def save(self, path: str | Path, solver: str | None = None) -> None:
+        """Compile the problem for `solver` and write it, compiled, to `path`.
+
+        The file carries the cached canonicalization -- the affine map from
+        parameter values to solver data -- so a process that `load`s it skips
+        the compilation `build` leaves to the first solve. Compiling is a no-op
+        if the problem is already compiled for `solver`. The current parameter
+        values are saved with it.
+
+        Args:
+            path: The file to write.
+            solver: The solver to compile for; later solves should use the same.
+                The one `solve` uses by default if None.
+        """
+        self.get_problem_data(self.solver if solver is None else solver)
+        serialize.dump(self, path)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = False) -> Problem:
+        """Read a problem written by `save`, ready for `update` and `solve`.
+
+        With `mmap=True` the arrays of the compiled problem are mapped from the
+        file copy-on-write instead of being read into memory, so worker
+        processes loading the same file share its pages.
+
+        Only load files you trust: the format is a pickle, and unpickling can
+        run arbitrary code.
+
+        Raises:
+            CvxDataError: If the file does not hold a `Problem`.
+        """
+        problem = serialize.load(path, mmap=mmap)
+
+        if not isinstance(problem, cls):
+            raise CvxDataError(f"{path} holds a {type(problem).__name__}, not a {cls.__name__}")  # noqa: TRY003
+
+        return problem
+
+    def clone(self) -> Problem:
+        """Return an independent copy of the problem that shares its compilation.
+
+        The copy has parameters, variables and models of its own -- `update`
+        and `solve` on it leave this problem alone, and the other way round --
+        with the parameter values, solution and remembered update data this
+        one holds now. What it shares is the bulk of the compiled problem: the
+        sparse map from parameter values to solver data, which solves only
+        read. Cloning a compiled problem thus compiles nothing, and each clone
+        costs the memory of its parameter values rather than of the map:
+
+            problem = MaxSharpe(assets=500).build()
+            problem.solve()                         # compile once
+            local = threading.local()
+            ...
+            local.problem = problem.clone()         # one per thread or task
+            local.problem.update(**data)
+            local.problem.solve()
+
+        Clone after compiling, by a first solve or `get_problem_data`: a clone
+        of a problem not yet compiled compiles on its first solve, for itself.
+        The fast path of `compile_fast` is shared likewise, and the clone is on
+        it too; the native solver kept for warm starts is not, so the first
+        warm solve of a clone starts cold.
+        """
+        clone: Problem = serialize.copy(self, share=_compiled)
+        return clone
+
     def get_problem_data(
         self,
         solver: str = cp.CLARABEL,
@@ -110,15 +813,16 @@ class Problem:
         Returns:
             The ``(data, chain, inverse_data)`` triple produced by cvxpy.
         """
-        return self.problem.get_problem_data(
-            solver,
-            gp=gp,
-            enforce_dpp=enforce_dpp,
-            ignore_dpp=ignore_dpp,
-            verbose=verbose,
-            canon_backend=canon_backend,
-            solver_opts=solver_opts,
-        )
+        with _quiet_sparse_reads():
+            return self.problem.get_problem_data(
+                solver,
+                gp=gp,
+                enforce_dpp=enforce_dpp,
+                ignore_dpp=ignore_dpp,
+                verbose=verbose,
+                canon_backend=canon_backend,
+                solver_opts=solver_opts,
+            )
 
     @property
     def value(self) -> float:
@@ -165,3 +869,63 @@ class Problem:
             raise CvxDataError(  # noqa: TRY003
                 "No factor weights: this problem was built without 'factors'."
             ) from err
+
+
+def _solve_in_worker(data: Mapping[str, Matrix], solver: str | None, kwargs: dict[str, Any]) -> SolveResult:
+    """Solve one data set against the problem installed in this worker process."""
+    from cvxmarkowitz.utils import processes
+
+    return _solve_one(processes.installed(), data, solver=solver, kwargs=kwargs)
+
+
+@contextmanager
+def _quiet_sparse_reads() -> Generator[None]:
+    """Silence the warning cvxpy gives when it reads a sparse parameter densely.
+
+    It does so itself, whenever it compiles or solves, to check that every
+    parameter has a value -- nothing a caller of this package could avoid.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "Reading from a sparse", RuntimeWarning)
+        yield
+
+
+def _compiled(obj: Any) -> bool:
+    """Return True for the parts of a compiled problem that solves only read.
+
+    These are cvxpy's condensed maps from parameter values to solver data and
+    the sparse tensors they are made from; a parameter's own value is never a
+    sparse matrix, as cvxpy keeps even that of a sparse parameter as an array.
+    """
+    return isinstance(obj, ReducedMat) or type(obj).__module__.startswith("scipy.sparse")
+
+
+def _size(model: Model) -> int:
+    """Return the number of parameters `update` writes for `model`."""
+    targets = model.targets()
+    return len(model.keywords if targets is None else targets)
+
+
+def _fingerprint(value: Matrix) -> bytes:
+    """Return a digest of the shape, type and contents of `value`."""
+    array = np.ascontiguousarray(value)
+    digest = hashlib.blake2b(f"{array.shape}{array.dtype.str}".encode(), digest_size=16)
+    digest.update(array)
+    return digest.digest()
+
+
+def _solve_one(problem: Problem, data: Mapping[str, Matrix], solver: str | None, kwargs: dict[str, Any]) -> SolveResult:
+    """Update and solve `problem` with one data set, capturing a non-optimal status."""
+    problem.update(validate=True, **data)
+
+    try:
+        value = problem.solve(solver=solver, **kwargs)
+    except CvxSolverError:
+        return SolveResult(
+            weights=np.full(problem.variables[D.WEIGHTS].shape, np.nan),
+            value=float("nan"),
+            status=str(problem.problem.status),
+            stats=problem.stats,
+        )
+
+    return SolveResult(weights=problem.weights, value=value, status=str(problem.problem.status), stats=problem.stats)
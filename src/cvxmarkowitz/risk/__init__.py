@@ -15,16 +15,35 @@
 
 from __future__ import annotations
 
-from cvxmarkowitz.model import Model
+from typing import TYPE_CHECKING
 
-from .cvar.cvar import CVar as CVar
-from .factor.factor import FactorModel as FactorModel
-from .sample.sample import SampleCovariance as SampleCovariance
+from cvxmarkowitz.utils.lazy import attributes
 
-__all__ = ["CVar", "FactorModel", "SampleCovariance", "default_risk_model"]
+if TYPE_CHECKING:
+    from cvxmarkowitz.model import Model
 
+    from .cvar.cutting import CuttingPlaneCVar as CuttingPlaneCVar
+    from .cvar.cvar import CVar as CVar
+    from .cvar.cvar import ParametricCVar as ParametricCVar
+    from .factor.factor import FactorModel as FactorModel
+    from .sample.sample import SampleCovariance as SampleCovariance
 
-def default_risk_model(assets: int, factors: int | None) -> Model:
+__all__ = ["CVar", "CuttingPlaneCVar", "FactorModel", "ParametricCVar", "SampleCovariance", "default_risk_model"]
+
+# each model is imported on first access; a builder loads only its own
+__getattr__, __dir__ = attributes(
+    __name__,
+    {
+        "CVar": ".cvar.cvar",
+        "CuttingPlaneCVar": ".cvar.cutting",
+        "FactorModel": ".factor.factor",
+        "ParametricCVar": ".cvar.cvar",
+        "SampleCovariance": ".sample.sample",
+    },
+)
+
+
+def default_risk_model(assets: int, factors: int | None, robust: bool = True) -> Model:
     """Return the risk model a `Builder` uses when the caller injects none.
 
     A `FactorModel` when `factors` is given, a `SampleCovariance` otherwise.
@@ -43,11 +62,16 @@ def default_risk_model(assets: int, factors: int | None) -> Model:
     Args:
         assets: Number of assets the model is sized for.
         factors: Number of factors, or None for a non-factor problem.
+        robust: Whether the model carries the volatility-uncertainty terms.
 
     Returns:
         A `Model` instance to register under `ModelName.RISK`.
     """
     if factors is None:
-        return SampleCovariance(assets=assets)
+        from .sample.sample import SampleCovariance
+
+        return SampleCovariance(assets=assets, robust=robust)
+
+    from .factor.factor import FactorModel
 
-    return FactorModel(assets=assets, factors=factors)
+    return FactorModel(assets=assets, factors=factors, robust=robust)
@@ -15,6 +15,27 @@
 
 from __future__ import annotations
 
-from .cvar import CVar as CVar
+from typing import TYPE_CHECKING
 
-__all__ = ["CVar"]
+from cvxmarkowitz.utils.lazy import attributes
+
+if TYPE_CHECKING:
+    from .cutting import CuttingPlaneCVar as CuttingPlaneCVar
+    from .cutting import CuttingPlaneResult as CuttingPlaneResult
+    from .cutting import solve_cutting_plane as solve_cutting_plane
+    from .cvar import CVar as CVar
+    from .cvar import ParametricCVar as ParametricCVar
+
+__all__ = ["CVar", "CuttingPlaneCVar", "CuttingPlaneResult", "ParametricCVar", "solve_cutting_plane"]
+
+# the cutting-plane solver is only loaded by those who use it
+__getattr__, __dir__ = attributes(
+    __name__,
+    {
+        "CVar": ".cvar",
+        "CuttingPlaneCVar": ".cutting",
+        "CuttingPlaneResult": ".cutting",
+        "ParametricCVar": ".cvar",
+        "solve_cutting_plane": ".cutting",
+    },
+)
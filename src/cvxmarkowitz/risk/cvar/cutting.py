@@ -0,0 +1,244 @@
+#    Copyright 2023 Stanford University Convex Optimization Group
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""CVaR over very many scenarios, solved on an active set of them."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import cvxpy as cp
+import numpy as np
+import numpy.typing as npt
+
+from cvxmarkowitz.cvxerror import CvxDataError, CvxSolverError
+from cvxmarkowitz.model import Model
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.problem import Problem
+from cvxmarkowitz.types import Constraints, Matrix, Variables
+from cvxmarkowitz.utils.fill import fill_trusted
+
+
+@dataclass(frozen=True)
+class CuttingPlaneCVar(Model):
+    """Conditional value at risk over an active set of scenarios.
+
+    In the Rockafellar-Uryasev form, CVaR over T scenarios with a tail of
+    k = int(T * (1 - alpha)) is the least over t of
+
+        t + 1 / k * sum_i max(loss_i - t, 0),
+
+    and only the scenarios whose loss exceeds the value at risk t add to the
+    sum. The problem therefore holds at most `rows` of them, the active set,
+    with a slack each. `solve_cutting_plane` keeps all T scenarios outside
+    cvxpy, checks each solution against every one of them and activates the
+    scenarios beyond the value at risk that the set is missing, until the
+    CVaR of the solution meets the bound the active set proves.
+
+    Plain `update` leaves this model alone; its data come from
+    `solve_cutting_plane`.
+
+    Attributes:
+        alpha: Confidence level; the tail holds int(T * (1 - alpha)) scenarios.
+        rows: The most scenarios the problem holds at once. It has to exceed
+            the tail; five or more times the tail leaves room to converge
+            from a starting portfolio far from the solution.
+    """
+
+    alpha: float = 0.95
+    rows: int = 0
+    _variables: Variables = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the active scenarios, their weights and the auxiliary variables.
+
+        Raises:
+            CvxDataError: If the model has room for no scenario.
+        """
+        if self.rows < 1:
+            raise CvxDataError(f"CuttingPlaneCVar needs room for a scenario, got rows={self.rows}")  # noqa: TRY003
+
+        self.parameter["active"] = cp.Parameter(
+            shape=(self.rows, self.assets),
+            name="cvar_active",
+            value=np.zeros((self.rows, self.assets)),
+        )
+        # 1 / k on the active scenarios, 0 on the free rows
+        self.parameter["tail_weights"] = cp.Parameter(
+            shape=self.rows,
+            name="cvar_tail_weights",
+            value=np.zeros(self.rows),
+            nonneg=True,
+        )
+
+        self._variables["value_at_risk"] = cp.Variable(name="value_at_risk")
+        self._variables["slack"] = cp.Variable(self.rows, name="cvar_slack", nonneg=True)
+
+    def estimate(self, variables: Variables) -> cp.Expression:  # noqa: ARG002  # the expression is in the model's own variables
+        """Return the CVaR over the active scenarios, a lower bound on the full one."""
+        return self._variables["value_at_risk"] + self.parameter["tail_weights"] @ self._variables["slack"]
+
+    def update(self, **kwargs: Matrix) -> None:
+        """Do nothing: the scenarios go to `solve_cutting_plane`, not here."""
+
+    def constraints(self, variables: Variables) -> Constraints:
+        """Return the slacks' lower bound by the active losses beyond the VaR."""
+        return {
+            "tail": self._variables["slack"]
+            >= -self.parameter["active"] @ variables[D.WEIGHTS] - self._variables["value_at_risk"],
+        }
+
+    @property
+    def value_at_risk(self) -> float:
+        """Return the value at risk of the last solve."""
+        return float(np.asarray(self._variables["value_at_risk"].value))
+
+    def activate(self, scenarios: Matrix, active: npt.NDArray[np.intp], size: int) -> None:
+        """Write the scenarios numbered `active` into the problem, each weighted 1 / `size`.
+
+        Both are zero-padded into the buffers the parameters keep, rather than
+        into arrays of `rows` allocated at every cut, and without cvxpy's
+        checks: the weights are positive and the scenarios unconstrained.
+        """
+        fill_trusted(self.parameter["active"], scenarios[active])
+        fill_trusted(self.parameter["tail_weights"], np.full(active.size, 1 / size))
+
+
+@dataclass(frozen=True)
+class CuttingPlaneResult:
+    """The outcome of `solve_cutting_plane`.
+
+    Attributes:
+        value: The optimal objective value of the last solve.
+        risk: The CVaR of the solution over all scenarios.
+        gap: How far `risk` lies above the bound the active set proves.
+        iterations: The solves taken.
+        active: The scenarios in the active set of the last solve.
+    """
+
+    value: float
+    risk: float
+    gap: float
+    iterations: int
+    active: int
+
+
+def losses(scenarios: Matrix, weights: Matrix, chunk: int = 65_536) -> Matrix:
+    """Return the loss of `weights` in every scenario, reading `chunk` rows at a time.
+
+    A `numpy.memmap` of scenarios therefore never needs to fit in memory;
+    only the losses, one per scenario, do.
+    """
+    rows, columns = scenarios.shape
+    result = np.empty(rows)
+    for start in range(0, rows, chunk):
+        result[start : start + chunk] = -(np.asarray(scenarios[start : start + chunk]) @ weights[:columns])
+    return result
+
+
+def _largest(values: Matrix, size: int) -> npt.NDArray[np.intp]:
+    """Return the positions of the `size` largest `values`, in increasing order."""
+    return np.sort(np.argpartition(values, values.size - size)[values.size - size :])
+
+
+def solve_cutting_plane(
+    problem: Problem,
+    scenarios: Matrix,
+    tol: float = 1e-6,
+    max_iterations: int = 20,
+    chunk: int = 65_536,
+    solver: str | None = None,
+    **kwargs: Any,
+) -> CuttingPlaneResult:
+    """Solve a problem with a `CuttingPlaneCVar` risk model over `scenarios`.
+
+    The first active set holds the largest losses of the problem's current
+    weights -- or of equal weights, before its first solve: the tail and
+    half the model's rows beyond it. Every iteration solves, warm from the last, then
+    computes the loss of the solution in all scenarios. The solve is done
+    once the CVaR of the solution exceeds the active-set bound by at most
+    `tol` times the CVaR, or once no scenario outside the set loses more
+    than the value at risk -- the bound then holds for all of them, and
+    what gap is left is the accuracy of the solver. Otherwise the scenarios
+    beyond the value at risk join the set, the largest losses first if they
+    do not all fit. Each check
+    reads the scenarios in blocks of `chunk` rows, so they may be a
+    `numpy.memmap` of a file larger than memory:
+
+        model = CuttingPlaneCVar(assets=50, alpha=0.99, rows=40_000)
+        problem = MinVar(assets=50, model={M.RISK: model}).build()
+        problem.update(**bounds)
+        result = solve_cutting_plane(problem, np.load("scenarios.npy", mmap_mode="r"))
+
+    Args:
+        problem: The problem to solve, its other data in place.
+        scenarios: Returns, one row per scenario, at most `assets` columns.
+        tol: The gap between risk and bound accepted as converged, relative
+            to the risk.
+        max_iterations: The most solves to take.
+        chunk: Scenario rows read at a time.
+        solver: The solver to use; by default the one `problem.solver` names.
+        **kwargs: Further keyword arguments forwarded to `Problem.solve`.
+
+    Returns:
+        The value, risk, gap, iteration count and size of the active set of
+        the solution, which is left in the problem's variables.
+
+    Raises:
+        CvxDataError: If the risk model of `problem` is not a `CuttingPlaneCVar`,
+            or the tail is empty or does not fit in its `rows`.
+        CvxSolverError: If a solve is not optimal, or the gap is still above
+            `tol` after `max_iterations` solves or once the rows are full.
+    """
+    model = problem.model[M.RISK]
+    if not isinstance(model, CuttingPlaneCVar):
+        raise CvxDataError(f"Cutting planes need a CuttingPlaneCVar risk model, not {type(model).__name__}")  # noqa: TRY003
+
+    size = int(scenarios.shape[0] * (1 - model.alpha))
+    if not 1 <= size < model.rows:
+        raise CvxDataError(  # noqa: TRY003
+            f"The tail of alpha={model.alpha} holds {size} of {scenarios.shape[0]} scenarios; "
+            f"it needs at least one, and fewer than the model's rows={model.rows}."
+        )
+
+    weights = problem.variables[D.WEIGHTS]
+    start = np.full(model.assets, 1 / model.assets) if weights.value is None else weights.value
+    loss = losses(scenarios, start, chunk)
+    # the tail and half the rows beyond it; the other half is room for violations
+    active = _largest(loss, (size + model.rows) // 2)
+
+    gap = np.inf
+    for iteration in range(max_iterations):
+        model.activate(scenarios, active, size)
+        value = problem.solve(solver=solver, warm_start=iteration > 0, **kwargs)
+
+        loss = losses(scenarios, np.asarray(weights.value), chunk)
+        risk = float(loss[_largest(loss, size)].mean())
+        gap = risk - float(np.asarray(model.estimate(problem.variables).value))
+        violated = np.setdiff1d(np.flatnonzero(loss > model.value_at_risk), active, assume_unique=True)
+        if gap <= tol * abs(risk) or violated.size == 0:
+            return CuttingPlaneResult(value=value, risk=risk, gap=gap, iterations=iteration + 1, active=active.size)
+
+        # activate the worst violations there is room for; scenarios once active
+        # stay so, which makes the bound rise monotonically
+        room = model.rows - active.size
+        if room == 0:
+            break
+        active = np.union1d(active, violated[_largest(loss[violated], min(violated.size, room))])
+
+    raise CvxSolverError(  # noqa: TRY003
+        f"The active set did not converge in {iteration + 1} iterations; the gap is {gap:.3g}. "
+        f"Raise `max_iterations`, `tol` or the model's rows."
+    )
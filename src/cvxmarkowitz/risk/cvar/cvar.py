@@ -15,7 +15,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import cvxpy as cp
 import numpy as np
@@ -23,8 +23,9 @@ import numpy as np
 from cvxmarkowitz.cvxerror import CvxDataError
 from cvxmarkowitz.model import Model
 from cvxmarkowitz.names import DataNames as D
-from cvxmarkowitz.types import Matrix, Variables
-from cvxmarkowitz.utils.fill import fill_matrix
+from cvxmarkowitz.names import ParameterName as P
+from cvxmarkowitz.types import Constraints, Matrix, Variables
+from cvxmarkowitz.utils.fill import fill_parameter
 
 
 @dataclass(frozen=True)
@@ -80,4 +81,87 @@ class CVar(Model):
         Expected keyword arguments:
             D.RETURNS: Matrix of historical/scenario returns with shape (rows, assets).
         """
-        self.data[D.RETURNS].value = fill_matrix(rows=self.rows, cols=self.assets, x=kwargs[D.RETURNS])
+        fill_parameter(self.data[D.RETURNS], kwargs[D.RETURNS])
+
+
+@dataclass(frozen=True)
+class ParametricCVar(Model):
+    """Conditional value at risk in the Rockafellar-Uryasev formulation.
+
+    CVaR at level alpha over `rows` equally likely scenarios r_i is
+
+        min_t  t + 1 / ((1 - alpha) * rows) * sum_i max(-r_i @ w - t, 0)
+
+    with the minimizing t the value at risk. The maxima are scenario slacks
+    u_i >= -r_i @ w - t, u_i >= 0, registered by `constraints`.
+
+    Unlike `CVar`, whose tail size is fixed when the model is built, alpha is
+    the cvxpy Parameter `parameter[ParameterName.ALPHA]` of the model, reached
+    through `problem.model[ModelName.RISK]`: setting its value and solving
+    again reuses the compiled problem, so a sweep over confidence levels
+    compiles once. Where rows * (1 - alpha) is a whole number both
+    models give the same risk.
+
+    Attributes:
+        alpha: Initial confidence level, in [0, 1).
+        rows: Number of scenarios.
+    """
+
+    alpha: float = 0.95
+    rows: int = 0
+    _variables: Variables = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Initialize the returns, the confidence level and the auxiliary variables.
+
+        Raises:
+            CvxDataError: If there are no scenarios.
+        """
+        if self.rows < 1:
+            raise CvxDataError(f"ParametricCVar needs at least one scenario, got rows={self.rows}")  # noqa: TRY003
+
+        self.data[D.RETURNS] = cp.Parameter(
+            shape=(self.rows, self.assets),
+            name=D.RETURNS,
+            value=np.zeros((self.rows, self.assets)),
+        )
+
+        self.parameter[P.ALPHA] = cp.Parameter(shape=(), name=P.ALPHA, value=self.alpha, nonneg=True)
+
+        # 1 / ((1 - alpha) * rows) is not affine in alpha; a callback keeps the
+        # objective DPP and follows the value of alpha at every solve
+        self.parameter["tail_weight"] = cp.CallbackParam(callback=self._tail_weight, nonneg=True, name="tail_weight")
+
+        self._variables["value_at_risk"] = cp.Variable(name="value_at_risk")
+        self._variables["slack"] = cp.Variable(self.rows, name="cvar_slack", nonneg=True)
+
+    def _tail_weight(self) -> float:
+        """Return the weight 1 / ((1 - alpha) * rows) of each scenario slack.
+
+        Raises:
+            CvxDataError: If alpha is outside [0, 1).
+        """
+        alpha = float(np.asarray(self.parameter[P.ALPHA].value))
+        if not 0.0 <= alpha < 1.0:
+            raise CvxDataError(f"alpha must lie in [0, 1), got {alpha}")  # noqa: TRY003
+
+        return 1.0 / ((1.0 - alpha) * self.rows)
+
+    def estimate(self, variables: Variables) -> cp.Expression:  # noqa: ARG002  # the expression is in the model's own variables
+        """Return the value at risk plus the weighted scenario slacks."""
+        return self._variables["value_at_risk"] + self.parameter["tail_weight"] * cp.sum(self._variables["slack"])
+
+    def update(self, **kwargs: Matrix) -> None:
+        """Update the returns matrix used by the CVaR model.
+
+        Expected keyword arguments:
+            D.RETURNS: Matrix of historical/scenario returns with shape (rows, assets).
+        """
+        fill_parameter(self.data[D.RETURNS], kwargs[D.RETURNS])
+
+    def constraints(self, variables: Variables) -> Constraints:
+        """Return the scenario slacks' lower bound by the losses beyond the VaR."""
+        return {
+            "tail": self._variables["slack"]
+            >= -self.data[D.RETURNS] @ variables[D.WEIGHTS] - self._variables["value_at_risk"],
+        }
@@ -15,7 +15,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import cvxpy as cp
 import numpy as np
@@ -24,22 +24,60 @@ from cvxmarkowitz.cvxerror import CvxDataError
 from cvxmarkowitz.model import Model
 from cvxmarkowitz.names import DataNames as D
 from cvxmarkowitz.types import Constraints, Matrix, Variables
-from cvxmarkowitz.utils.fill import fill_matrix, fill_vector
+from cvxmarkowitz.utils.fill import fill_parameter
 
 
 @dataclass(frozen=True)
 class FactorModel(Model):
-    """Factor risk model."""
+    """Factor risk model.
+
+    Exposures to industries and countries are dummies, mostly zeros. Declare
+    which entries may be nonzero with `sparsity`, a boolean (factors x assets)
+    mask, and the exposure parameter holds those entries only: compiling it
+    and mapping each update to the solver then scale with their number rather
+    than with factors x assets. The pattern is fixed once the model is built;
+    `update` takes either the entries in it, in row-major order, or a dense
+    exposure that is zero outside it.
+
+    With `robust=False` the volatility uncertainties are left out: no
+    uncertainty parameters, no `|factor_weights|` column in the systematic
+    norm, no uncertainty column in the residual norm and no constraint on the
+    absolute factor weights. `update` then takes neither uncertainty keyword.
+
+    Attributes:
+        factors: Number of factors.
+        sparsity: Optional mask of the exposure entries that may be nonzero.
+        robust: Whether to build the uncertainty terms, True by default.
+    """
 
     factors: int = 0
+    sparsity: Matrix | None = field(default=None, repr=False, compare=False)
+    robust: bool = True
 
     def __post_init__(self) -> None:
-        """Initialize parameters that define the factor risk model."""
-        self.data[D.EXPOSURE] = cp.Parameter(
-            shape=(self.factors, self.assets),
-            name=D.EXPOSURE,
-            value=np.zeros((self.factors, self.assets)),
-        )
+        """Initialize parameters that define the factor risk model.
+
+        Raises:
+            CvxDataError: If `sparsity` is not a (factors x assets) mask.
+        """
+        if self.sparsity is None:
+            self.data[D.EXPOSURE] = cp.Parameter(
+                shape=(self.factors, self.assets),
+                name=D.EXPOSURE,
+                value=np.zeros((self.factors, self.assets)),
+            )
+        else:
+            if np.shape(self.sparsity) != (self.factors, self.assets):
+                raise CvxDataError(  # noqa: TRY003
+                    f"The sparsity pattern has shape {np.shape(self.sparsity)}, "
+                    f"the exposure {(self.factors, self.assets)}"
+                )
+            self.data[D.EXPOSURE] = cp.Parameter(
+                shape=(self.factors, self.assets),
+                name=D.EXPOSURE,
+                sparsity=np.nonzero(self.sparsity),
+            )
+            fill_parameter(self.data[D.EXPOSURE], np.zeros(np.count_nonzero(self.sparsity)))
 
         self.data[D.IDIOSYNCRATIC_VOLA] = cp.Parameter(
             shape=self.assets,
@@ -53,6 +91,9 @@ class FactorModel(Model):
             value=np.zeros((self.factors, self.factors)),
         )
 
+        if not self.robust:
+            return
+
         self.data[D.SYSTEMATIC_VOLA_UNCERTAINTY] = cp.Parameter(
             shape=self.factors,
             name=D.SYSTEMATIC_VOLA_UNCERTAINTY,
@@ -86,6 +127,9 @@ class FactorModel(Model):
         systematic/residual split is what a factor model is for, and
         `estimate` is the norm of this and `systematic_risk`.
         """
+        if not self.robust:
+            return cp.norm2(cp.multiply(self.data[D.IDIOSYNCRATIC_VOLA], variables[D.WEIGHTS]))
+
         return cp.norm2(
             cp.hstack(
                 [
@@ -104,6 +148,9 @@ class FactorModel(Model):
         The L2 norm of the systematic volatility contribution and its
         uncertainty contribution. See `residual_risk` for the counterpart.
         """
+        if not self.robust:
+            return cp.norm2(self.data[D.CHOLESKY] @ variables[D.FACTOR_WEIGHTS])
+
         return cp.norm2(
             cp.hstack(
                 [
@@ -117,25 +164,26 @@ class FactorModel(Model):
         """Validate and assign all factor-model inputs.
 
         Expected keyword arguments:
-            exposure: Factor exposure matrix (factors x assets).
+            exposure: Factor exposure matrix (factors x assets), or with
+                `sparsity` the vector of the entries in the pattern.
             idiosyncratic_vola: Asset-specific volatility vector.
             chol: Cholesky factor of factor covariance (factors x factors).
-            systematic_vola_uncertainty: Nonnegative vector for systematic risk uncertainty.
-            idiosyncratic_vola_uncertainty: Nonnegative vector for residual risk uncertainty.
+            systematic_vola_uncertainty: Nonnegative vector for systematic risk
+                uncertainty, only when the model is robust.
+            idiosyncratic_vola_uncertainty: Nonnegative vector for residual risk
+                uncertainty, only when the model is robust.
         """
         self._validate(**kwargs)
 
-        self.data[D.EXPOSURE].value = fill_matrix(rows=self.factors, cols=self.assets, x=kwargs[D.EXPOSURE])
-        self.data[D.IDIOSYNCRATIC_VOLA].value = fill_vector(num=self.assets, x=kwargs[D.IDIOSYNCRATIC_VOLA])
-        self.data[D.CHOLESKY].value = fill_matrix(rows=self.factors, cols=self.factors, x=kwargs[D.CHOLESKY])
+        fill_parameter(self.data[D.EXPOSURE], kwargs[D.EXPOSURE])
+        fill_parameter(self.data[D.IDIOSYNCRATIC_VOLA], kwargs[D.IDIOSYNCRATIC_VOLA])
+        fill_parameter(self.data[D.CHOLESKY], kwargs[D.CHOLESKY])
+        if not self.robust:
+            return
 
         # Robust risk
-        self.data[D.SYSTEMATIC_VOLA_UNCERTAINTY].value = fill_vector(
-            num=self.factors, x=kwargs[D.SYSTEMATIC_VOLA_UNCERTAINTY]
-        )
-        self.data[D.IDIOSYNCRATIC_VOLA_UNCERTAINTY].value = fill_vector(
-            num=self.assets, x=kwargs[D.IDIOSYNCRATIC_VOLA_UNCERTAINTY]
-        )
+        fill_parameter(self.data[D.SYSTEMATIC_VOLA_UNCERTAINTY], kwargs[D.SYSTEMATIC_VOLA_UNCERTAINTY])
+        fill_parameter(self.data[D.IDIOSYNCRATIC_VOLA_UNCERTAINTY], kwargs[D.IDIOSYNCRATIC_VOLA_UNCERTAINTY])
 
     def _validate(self, **kwargs: Matrix) -> None:
         """Check that all required inputs are present and shape-consistent."""
@@ -147,23 +195,27 @@ class FactorModel(Model):
 
     def _check_shapes(self, **kwargs: Matrix) -> None:
         """Validate that the input dimensions are mutually consistent."""
-        k, assets = kwargs[D.EXPOSURE].shape
+        # the entries of a sparse exposure alone span the model's full shape
+        k, assets = kwargs[D.EXPOSURE].shape if kwargs[D.EXPOSURE].ndim == 2 else (self.factors, self.assets)
 
-        if kwargs[D.IDIOSYNCRATIC_VOLA].shape[0] != kwargs[D.IDIOSYNCRATIC_VOLA_UNCERTAINTY].shape[0]:
+        if self.robust and kwargs[D.IDIOSYNCRATIC_VOLA].shape[0] != kwargs[D.IDIOSYNCRATIC_VOLA_UNCERTAINTY].shape[0]:
             raise CvxDataError("Mismatch in length for idiosyncratic_vola and idiosyncratic_vola_uncertainty")  # noqa: TRY003
 
         if kwargs[D.IDIOSYNCRATIC_VOLA].shape[0] != assets:
             raise CvxDataError("Mismatch in length for idiosyncratic_vola and exposure")  # noqa: TRY003
 
-        if kwargs[D.SYSTEMATIC_VOLA_UNCERTAINTY].shape[0] != k:
+        if self.robust and kwargs[D.SYSTEMATIC_VOLA_UNCERTAINTY].shape[0] != k:
             raise CvxDataError("Mismatch in length of systematic_vola_uncertainty and exposure")  # noqa: TRY003
 
         if kwargs[D.CHOLESKY].shape[0] != k:
             raise CvxDataError("Mismatch in size of chol and exposure")  # noqa: TRY003
 
     def constraints(self, variables: Variables) -> Constraints:
-        """Return factor-model linking and robust-risk constraints."""
-        return {
+        """Return factor-model linking and, when robust, robust-risk constraints."""
+        constraints = {
             "factors": variables[D.FACTOR_WEIGHTS] == self.data[D.EXPOSURE] @ variables[D.WEIGHTS],
-            "_abs": variables[D._ABS] >= cp.abs(variables[D.FACTOR_WEIGHTS]),  # Robust risk dummy variable
         }
+        if self.robust:
+            constraints["_abs"] = variables[D._ABS] >= cp.abs(variables[D.FACTOR_WEIGHTS])  # Robust risk dummy variable
+
+        return constraints
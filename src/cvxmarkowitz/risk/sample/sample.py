@@ -24,31 +24,53 @@ from cvxmarkowitz.cvxerror import CvxDataError
 from cvxmarkowitz.model import Model
 from cvxmarkowitz.names import DataNames as D
 from cvxmarkowitz.types import Constraints, Matrix, Variables
-from cvxmarkowitz.utils.fill import fill_matrix, fill_vector
+from cvxmarkowitz.utils.fill import fill_parameter
 
 
 @dataclass(frozen=True)
 class SampleCovariance(Model):
-    """Risk model based on the Cholesky decomposition of the sample cov matrix."""
+    """Risk model based on the Cholesky decomposition of the sample cov matrix.
+
+    Any square root R of the covariance, R.T @ R = cov, gives the same risk
+    norm2(R @ w), so the factor need not be square. With `rows` set, the
+    factor parameter is `(rows, assets)`: for T observations that is the
+    demeaned returns scaled by 1 / sqrt(T - 1), see `returns_factor`. The
+    second-order cone then grows with T rather than with the number of
+    assets, which keeps compilation and solves small when T is much less
+    than the universe. The default, `rows=0`, is the square Cholesky factor.
+
+    With `robust=False` the model is built without the volatility uncertainty:
+    no `vola_uncertainty` parameter, no `|w|` column in the norm and no
+    constraint on the absolute weights. The cone shrinks to the factor rows,
+    and `update` no longer takes `vola_uncertainty`.
+    """
+
+    rows: int = 0
+    robust: bool = True
 
     def __post_init__(self) -> None:
         """Initialize parameters for the sample-covariance risk model."""
+        rows = self.rows or self.assets
         self.data[D.CHOLESKY] = cp.Parameter(
-            shape=(self.assets, self.assets),
+            shape=(rows, self.assets),
             name=D.CHOLESKY,
-            value=np.zeros((self.assets, self.assets)),
+            value=np.zeros((rows, self.assets)),
         )
 
-        self.data[D.VOLA_UNCERTAINTY] = cp.Parameter(
-            shape=self.assets,
-            name=D.VOLA_UNCERTAINTY,
-            value=np.zeros(self.assets),
-            nonneg=True,
-        )
+        if self.robust:
+            self.data[D.VOLA_UNCERTAINTY] = cp.Parameter(
+                shape=self.assets,
+                name=D.VOLA_UNCERTAINTY,
+                value=np.zeros(self.assets),
+                nonneg=True,
+            )
 
     # x: array([ 5.19054e-01,  4.80946e-01, -1.59557e-12, -1.59557e-12])
     def estimate(self, variables: Variables) -> cp.Expression:
         """Estimate risk via Cholesky-based norm of exposures and uncertainties."""
+        if not self.robust:
+            return cp.norm2(self.data[D.CHOLESKY] @ variables[D.WEIGHTS])
+
         return cp.norm2(
             cp.hstack(
                 [
@@ -62,17 +84,49 @@ class SampleCovariance(Model):
         """Assign Cholesky factor and volatility-uncertainty vector.
 
         Expected keyword arguments:
-            D.CHOLESKY: Cholesky factor of the covariance matrix (assets x assets).
-            D.VOLA_UNCERTAINTY: Nonnegative vector of per-asset uncertainty.
+            D.CHOLESKY: Cholesky factor of the covariance matrix (assets x assets),
+                or with `rows` set any square root of it with at most `rows` rows.
+            D.VOLA_UNCERTAINTY: Nonnegative vector of per-asset uncertainty,
+                only when the model is robust.
         """
-        if not kwargs[D.CHOLESKY].shape[0] == kwargs[D.VOLA_UNCERTAINTY].shape[0]:
+        if not self.robust:
+            fill_parameter(self.data[D.CHOLESKY], kwargs[D.CHOLESKY])
+            return
+
+        # a square factor is matched on its rows, a thin one on its columns
+        axis = 1 if self.rows else 0
+        if not kwargs[D.CHOLESKY].shape[axis] == kwargs[D.VOLA_UNCERTAINTY].shape[0]:
             raise CvxDataError("Mismatch in length for chol and vola_uncertainty")  # noqa: TRY003
 
-        self.data[D.CHOLESKY].value = fill_matrix(rows=self.assets, cols=self.assets, x=kwargs[D.CHOLESKY])
-        self.data[D.VOLA_UNCERTAINTY].value = fill_vector(num=self.assets, x=kwargs[D.VOLA_UNCERTAINTY])
+        fill_parameter(self.data[D.CHOLESKY], kwargs[D.CHOLESKY])
+        fill_parameter(self.data[D.VOLA_UNCERTAINTY], kwargs[D.VOLA_UNCERTAINTY])
+
+    @staticmethod
+    def returns_factor(returns: Matrix) -> Matrix:
+        """Return the thin square root of the sample covariance of `returns`.
+
+        Args:
+            returns: Matrix of T observations by assets, T at least 2.
+
+        Returns:
+            The demeaned returns scaled by 1 / sqrt(T - 1), a (T, assets)
+            factor R with R.T @ R equal to `np.cov(returns, rowvar=False)`.
+
+        Raises:
+            CvxDataError: If there are fewer than two observations.
+        """
+        returns = np.asarray(returns, dtype=np.float64)
+        if returns.shape[0] < 2:
+            raise CvxDataError(f"Need at least 2 observations for a sample covariance, got {returns.shape[0]}")  # noqa: TRY003
+
+        factor: Matrix = (returns - returns.mean(axis=0)) / np.sqrt(returns.shape[0] - 1)
+        return factor
 
     def constraints(self, variables: Variables) -> Constraints:
-        """Return auxiliary constraints used for robust risk modeling."""
+        """Return auxiliary constraints used for robust risk modeling, none without it."""
+        if not self.robust:
+            return {}
+
         return {
             "dummy": variables[D._ABS] >= cp.abs(variables[D.WEIGHTS]),  # Robust risk dummy variable
         }
@@ -0,0 +1,134 @@
+#    Copyright 2023 Stanford University Convex Optimization Group
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""Timings and solver statistics of single solves, and their aggregation."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SolveStats:
+    """Where the time of one `Problem.solve` went, and what the solver reported.
+
+    The phases follow one another: the `update` calls since the previous solve,
+    the set-up -- compiling on the first solve, afterwards mapping the parameter
+    values to solver data -- the solver run itself, and unpacking the solution
+    into the problem's variables. Times are in seconds.
+
+    Attributes:
+        solver: Name of the solver.
+        status: The cvxpy status the solver reported.
+        compiled: True if this solve compiled the problem, False if it reused
+            the cached canonicalization.
+        update_time: Time spent in `update` since the previous solve.
+        setup_time: Time spent compiling or mapping parameters to solver data.
+        solve_time: Time spent in the solver, including its interface.
+        unpack_time: Time spent writing the solution back into the problem.
+        iterations: Iterations the solver took.
+        parameters_written: Parameters `update` wrote since the previous solve;
+            those of models whose data did not change are not counted.
+        primal_residual: Primal residual at termination, or None if the solver
+            does not report one.
+        dual_residual: Dual residual at termination, or None likewise.
+    """
+
+    solver: str
+    status: str
+    compiled: bool
+    update_time: float
+    setup_time: float
+    solve_time: float
+    unpack_time: float
+    iterations: int
+    parameters_written: int = 0
+    primal_residual: float | None = None
+    dual_residual: float | None = None
+
+    @property
+    def total_time(self) -> float:
+        """Return the time of all phases together."""
+        return self.update_time + self.setup_time + self.solve_time + self.unpack_time
+
+
+@dataclass(frozen=True)
+class SolveStatsLog:
+    """Collect `SolveStats` under labels -- one per builder type, say -- for dashboards.
+
+    Counts are cumulative; percentiles are taken over the most recent `window`
+    solves of a label, so a long-running service keeps a bounded history:
+
+        log = SolveStatsLog()
+        problem.solve()
+        log.record(type(builder).__name__, problem.stats)
+        log.percentiles("MinVar")  # {50: ..., 90: ..., 99: ...} of total_time
+
+    Attributes:
+        window: The most solves per label kept for percentiles.
+    """
+
+    window: int = 10_000
+    _stats: dict[str, deque[SolveStats]] = field(default_factory=dict, repr=False)
+    _counts: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def record(self, label: str, stats: SolveStats) -> None:
+        """Add the statistics of one solve under `label`."""
+        self._stats.setdefault(label, deque(maxlen=self.window)).append(stats)
+        self._counts[label] = self._counts.get(label, 0) + 1
+
+    @property
+    def labels(self) -> list[str]:
+        """Return the labels recorded so far, in the order first seen."""
+        return list(self._stats)
+
+    def count(self, label: str) -> int:
+        """Return the number of solves ever recorded under `label`."""
+        return self._counts.get(label, 0)
+
+    def percentiles(
+        self, label: str, q: Iterable[float] = (50, 90, 99), attribute: str = "total_time"
+    ) -> dict[float, float]:
+        """Return percentiles of `attribute` over the recent solves under `label`.
+
+        Args:
+            label: The label the solves were recorded under.
+            q: The percentiles to compute, between 0 and 100.
+            attribute: The `SolveStats` attribute to summarize, e.g. `solve_time`
+                or `iterations`.
+
+        Returns:
+            The value of each percentile, keyed by the percentile; NaN throughout
+            if nothing was recorded under `label`.
+        """
+        values = [float(getattr(stats, attribute)) for stats in self._stats.get(label, ())]
+        return {p: float(np.percentile(values, p)) if values else float("nan") for p in q}
+
+
+def residuals(native: Any) -> tuple[float | None, float | None]:
+    """Return the primal and dual residuals a native solver object reports.
+
+    Clarabel's solver reports them through `get_info`; for other solvers
+    there is nothing to read and both are None.
+    """
+    get_info = getattr(native, "get_info", None)
+    if get_info is None:
+        return None, None
+
+    info = get_info()
+    return float(info.res_primal), float(info.res_dual)
@@ -0,0 +1,174 @@
+#    Copyright 2023 Stanford University Convex Optimization Group
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""The solver `Problem.solve` picks by default, chosen by `Problem.autotune` and kept on disk."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import cvxpy as cp
+import numpy as np
+
+from cvxmarkowitz.cvxerror import CvxDataError
+
+# The variable naming the file of tuned solvers; see `solvers_file`.
+ENVIRONMENT = "CVXMARKOWITZ_SOLVERS"
+
+
+@dataclass(frozen=True)
+class Trial:
+    """How one solver fared on the samples of `Problem.autotune`.
+
+    Attributes:
+        solver: Name of the solver.
+        time: Mean time of a solve, in seconds, over the samples it solved;
+            NaN if it solved none.
+        error: Largest deviation of its objective values from those of the
+            reference solver, relative to their size (or absolute, below 1);
+            NaN if it solved none.
+        solved: Samples it solved to optimality.
+        samples: Samples it was given.
+    """
+
+    solver: str
+    time: float
+    error: float
+    solved: int
+    samples: int
+
+    def passes(self, tolerance: float) -> bool:
+        """Return True if the solver solved every sample, to within `tolerance`."""
+        return self.solved == self.samples and self.error <= tolerance
+
+
+@dataclass(frozen=True)
+class Tuning:
+    """The outcome of `Problem.autotune`.
+
+    Attributes:
+        signature: The structural key of the problem tuned; see `signature`.
+        solver: The fastest solver that passed, or the reference if none did.
+        trials: One trial per solver tried, in the order they were tried.
+    """
+
+    signature: str
+    solver: str
+    trials: list[Trial]
+
+
+def structure(problem: cp.Problem) -> tuple[Any, ...]:
+    """Return what determines the canonicalization of `problem`, but not its data.
+
+    Expressions enter by their text, which names parameters and variables but
+    does not print their values; parameters by name, shape and sparsity
+    pattern; variables by name and shape.
+    """
+    return (
+        str(problem.objective),
+        tuple(str(constraint) for constraint in problem.constraints),
+        tuple((parameter.name(), parameter.shape, pattern(parameter)) for parameter in problem.parameters()),
+        tuple((variable.name(), variable.shape) for variable in problem.variables()),
+    )
+
+
+def signature(problem: cp.Problem) -> str:
+    """Return a digest of the `structure` of `problem`, the same in every process."""
+    return hashlib.sha256(repr(structure(problem)).encode()).hexdigest()
+
+
+def solvers_file() -> Path:
+    """Return the file of tuned solvers: `$CVXMARKOWITZ_SOLVERS`, or one in the user's cache.
+
+    Raises:
+        CvxDataError: If the variable is not set and there is no home directory
+            to find the user's cache in.
+    """
+    if path := os.environ.get(ENVIRONMENT):
+        return Path(path)
+
+    try:
+        home = Path.home()
+    except RuntimeError as err:
+        raise CvxDataError(f"No home directory for the file of tuned solvers; set ${ENVIRONMENT}") from err  # noqa: TRY003
+    return home / ".cache" / "cvxmarkowitz" / "solvers.json"
+
+
+def lookup(key: str, path: str | Path | None = None) -> str | None:
+    """Return the solver tuned for the problem with signature `key`, None if there is none.
+
+    Every solve of a problem given no solver asks, so this never raises: a
+    file that cannot be found or read, or does not hold what `store` writes,
+    has nothing tuned.
+
+    Args:
+        key: The signature of the problem.
+        path: The file of tuned solvers; `solvers_file()` if None.
+    """
+    try:
+        entry = _read(Path(path) if path is not None else solvers_file()).get(key)
+    except CvxDataError:
+        return None
+
+    solver = entry.get("solver") if isinstance(entry, dict) else None
+    return solver if isinstance(solver, str) else None
+
+
+def store(tuning: Tuning, path: str | Path | None = None) -> None:
+    """Record `tuning` in the file of tuned solvers, replacing any earlier one of its problem.
+
+    The file is written whole to a sibling and moved into place, so a process
+    reading it never sees it half written. A file that does not hold what this
+    writes is replaced.
+
+    Args:
+        tuning: The outcome to record.
+        path: The file of tuned solvers; `solvers_file()` if None.
+
+    Raises:
+        CvxDataError: If `path` is None and `solvers_file` finds no file.
+    """
+    target = Path(path) if path is not None else solvers_file()
+    entries = _read(target)
+    entries[tuning.signature] = {
+        "solver": tuning.solver,
+        "trials": [dataclasses.asdict(trial) for trial in tuning.trials],
+    }
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    scratch = target.with_name(f"{target.name}.{os.getpid()}")
+    scratch.write_text(json.dumps(entries, indent=2))
+    scratch.replace(target)
+
+
+def _read(path: Path) -> dict[str, Any]:
+    """Return the entries of the file of tuned solvers, none if it cannot be read or parsed."""
+    try:
+        entries = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def pattern(parameter: cp.Parameter) -> bytes | None:
+    """Return the sparsity pattern of `parameter` as bytes, or None if it is dense."""
+    if parameter.sparse_idx is None:
+        return None
+    pattern: bytes = np.ravel_multi_index(parameter.sparse_idx, parameter.shape).tobytes()
+    return pattern
@@ -0,0 +1,129 @@
+#    Copyright 2023 Stanford University Convex Optimization Group
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""Rank-one updates and downdates of Cholesky factors, for rolling covariances.
+
+The factors here are upper triangular, `R` with `R.T @ R` the covariance: the
+convention of `cvx.linalg.cholesky` and what `SampleCovariance` reads under
+`chol`. Adding or removing one observation `x` changes the covariance by
+`x x^T`, and the factor can follow in O(n^2) rather than being recomputed in
+O(n^3). The rotations are applied one row at a time from Python, so the gain
+shows from a few hundred assets on; for smaller universes refactoring the
+covariance is as fast.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from cvxmarkowitz.cvxerror import CvxDataError
+from cvxmarkowitz.types import Matrix
+
+
+def rank_one_update(factor: Matrix, x: Matrix) -> None:
+    """Turn `factor` into the factor of `factor.T @ factor + x x^T`, in place."""
+    _rotate(factor, x, sign=1.0)
+
+
+def rank_one_downdate(factor: Matrix, x: Matrix) -> None:
+    """Turn `factor` into the factor of `factor.T @ factor - x x^T`, in place.
+
+    Raises:
+        CvxDataError: If the difference is not positive definite; `factor` is
+            then left as it was.
+    """
+    work = factor.copy()
+    _rotate(work, x, sign=-1.0)
+    factor[...] = work
+
+
+def _rotate(factor: Matrix, x: Matrix, sign: float) -> None:
+    """Apply the rotations that absorb `sign * x x^T` into `factor`, row by row."""
+    x = np.array(x, dtype=float)
+    for k in range(x.size):
+        diagonal, head = float(factor[k, k]), float(x[k])
+        squared = diagonal * diagonal + sign * head * head
+        if squared <= 0.0:
+            raise CvxDataError("The downdate leaves a covariance that is not positive definite")  # noqa: TRY003
+
+        r = math.sqrt(squared)
+        c, s = r / diagonal, head / diagonal
+        factor[k, k] = r
+
+        # views, so the arithmetic below happens in place
+        row, tail = factor[k, k + 1 :], x[k + 1 :]
+        row += (sign * s) * tail
+        row /= c
+        tail *= c
+        tail -= s * row
+
+
+@dataclass(frozen=True)
+class RollingCholesky:
+    """The Cholesky factor of a covariance that changes one observation at a time.
+
+    The covariance is the weighted sum of the outer products of the returns
+    added and not yet dropped. So a window of `T` demeaned returns is kept by
+    adding each new one with weight `1 / T` and dropping the oldest with the
+    same weight; an exponentially weighted covariance by `ewma`. Pass `factor`
+    to `Problem.update` as `chol` after each change: it has the exact shape
+    and type a `SampleCovariance` of as many assets wants, so it is used
+    without a copy.
+
+        rolling = RollingCholesky.from_returns(returns[:250], weight=1 / 250)
+        for t in range(250, len(returns)):
+            rolling.add(returns[t], weight=1 / 250)
+            rolling.drop(returns[t - 250], weight=1 / 250)
+            problem.update(chol=rolling.factor, ...)
+            problem.solve()
+
+    Attributes:
+        factor: The upper triangular factor, updated in place.
+    """
+
+    factor: Matrix
+
+    @classmethod
+    def from_covariance(cls, covariance: Matrix) -> RollingCholesky:
+        """Start from the factor of `covariance`, which must be positive definite."""
+        return cls(factor=np.linalg.cholesky(covariance).T.copy())
+
+    @classmethod
+    def from_returns(cls, returns: Matrix, weight: float = 1.0) -> RollingCholesky:
+        """Start from the covariance `weight * returns.T @ returns` of the rows of `returns`."""
+        return cls.from_covariance(weight * returns.T @ returns)
+
+    def add(self, returns: Matrix, weight: float = 1.0) -> None:
+        """Add the observation `returns`, with `weight`, to the covariance."""
+        rank_one_update(self.factor, np.sqrt(weight) * np.asarray(returns))
+
+    def drop(self, returns: Matrix, weight: float = 1.0) -> None:
+        """Remove the observation `returns`, added before with `weight`.
+
+        Raises:
+            CvxDataError: If what remains is not positive definite -- too few
+                observations are left, say; the factor is then unchanged.
+        """
+        rank_one_downdate(self.factor, np.sqrt(weight) * np.asarray(returns))
+
+    def decay(self, scale: float) -> None:
+        """Scale the covariance by `scale`, down-weighting every observation so far."""
+        self.factor[...] *= np.sqrt(scale)
+
+    def ewma(self, returns: Matrix, decay: float) -> None:
+        """Step an exponentially weighted covariance: `decay * cov + (1 - decay) * x x^T`."""
+        self.decay(decay)
+        self.add(returns, weight=1.0 - decay)
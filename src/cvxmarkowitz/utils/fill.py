@@ -13,10 +13,18 @@
 #    limitations under the License.
 """Helpers to pad vectors/matrices to target shapes."""
 
+import weakref
+
+import cvxpy as cp
 import numpy as np
 
 from cvxmarkowitz.types import Matrix
 
+# The arrays `fill_parameter` allocated, by `id` of the parameter holding them.
+# Only these are ever written in place: a parameter's value may also be an
+# array of the caller's, passed through, which must not be overwritten.
+_BUFFERS: dict[int, Matrix] = {}
+
 
 def fill_vector(x: Matrix, num: int) -> Matrix:
     """Fill a vector of length num with x."""
@@ -32,3 +40,114 @@ def fill_matrix(x: Matrix, rows: int, cols: int) -> Matrix:
     (n, m) = np.shape(x)
     z[:n, :m] = x
     return z
+
+
+def fill_parameter(parameter: cp.Parameter, x: Matrix) -> None:
+    """Set the value of `parameter` to `x`, zero-padded to its shape, without allocating.
+
+    What `parameter.value = fill_matrix(x, *parameter.shape)` does, but if `x`
+    already has the parameter's shape and dtype it is passed through as is,
+    uncopied; and otherwise it is written into a buffer the parameter keeps
+    from one call to the next, of which only the padded tail is zeroed. The
+    buffer is overwritten by the next call, so copy the parameter's value to
+    keep it; likewise an array passed through must not be mutated while the
+    parameter still holds it.
+
+    A parameter with a sparsity pattern stores only the entries in it; see
+    `_fill_sparse` for what it accepts.
+
+    Raises:
+        ValueError: If `x` is larger than the parameter along any axis, or
+            violates the parameter's attributes (`nonneg`, say).
+    """
+    x = np.asarray(x)
+    if parameter.sparse_idx is not None:
+        _fill_sparse(parameter, x, trusted=False)
+        return
+
+    if x.shape == parameter.shape and x.dtype == np.float64:
+        parameter.value = x
+        return
+
+    parameter.value = _pad(parameter, x)
+
+
+def fill_trusted(parameter: cp.Parameter, x: Matrix) -> None:
+    """Do what `fill_parameter` does, without checking `x` against the parameter.
+
+    cvxpy checks every value written through `parameter.value` against the
+    parameter's shape and attributes -- `nonneg`, say -- at a cost that dwarfs
+    the write itself for small parameters. This writes the value cvxpy keeps
+    directly instead. Data larger than the parameter still raises, from the
+    padding, but data violating its attributes is taken as is, and the solver
+    then solves a problem that is not the one built: only pass data known to
+    be valid.
+    """
+    x = np.asarray(x)
+    if parameter.sparse_idx is not None:
+        _fill_sparse(parameter, x, trusted=True)
+        return
+
+    if x.shape == parameter.shape and x.dtype == np.float64:
+        parameter._value = x
+        return
+
+    parameter._value = _pad(parameter, x)
+
+
+def _pad(parameter: cp.Parameter, x: Matrix) -> Matrix:
+    """Return `x` zero-padded to the shape of `parameter`, in the buffer the parameter keeps."""
+    buffer = _BUFFERS.get(id(parameter))
+    if buffer is None:
+        buffer = _BUFFERS[id(parameter)] = np.zeros(parameter.shape)
+        weakref.finalize(parameter, _BUFFERS.pop, id(parameter), None)
+
+    block = tuple(slice(n) for n in x.shape)
+    # the complement of the block, one slab per axis
+    for axis, n in enumerate(x.shape):
+        buffer[(*block[:axis], slice(n, None))] = 0.0
+    buffer[block] = x
+    return buffer
+
+
+def _fill_sparse(parameter: cp.Parameter, x: Matrix, *, trusted: bool) -> None:
+    """Set the entries of a parameter with a sparsity pattern.
+
+    `x` is either the vector of the entries in the pattern, in the order of
+    `parameter.sparse_idx` (row-major, as `numpy.nonzero` lists them), or a
+    dense matrix, zero-padded to the parameter's shape, whose nonzero entries
+    all lie in the pattern. The vector costs time in the number of entries in
+    the pattern only.
+
+    The entries are stored as cvxpy stores them. Its own setters take a dense
+    array and warn, or a scipy sparse array, which this package leaves to
+    cvxpy to import. Unless `trusted`, they are checked against the sign
+    of the parameter first, which cvxpy leaves unchecked for a parameter
+    with a sparsity pattern.
+
+    Raises:
+        ValueError: If the vector has the wrong length, the matrix is larger
+            than the parameter or has nonzero entries outside the pattern, or,
+            unless `trusted`, the entries violate the parameter's sign.
+    """
+    rows, cols = np.asarray(parameter.sparse_idx)
+    if x.ndim == 1:
+        if x.size != rows.size:
+            raise ValueError(f"{x.size} values for a sparsity pattern of {rows.size} entries")  # noqa: TRY003
+        values = np.array(x, dtype=np.float64)
+    else:
+        if any(n > m for n, m in zip(x.shape, parameter.shape, strict=True)):
+            raise ValueError(f"A {x.shape} matrix does not fit a parameter of shape {parameter.shape}")  # noqa: TRY003
+
+        inside = (rows < x.shape[0]) & (cols < x.shape[1])
+        values = np.zeros(rows.size)
+        values[inside] = x[rows[inside], cols[inside]]
+        if np.count_nonzero(values) != np.count_nonzero(x):
+            raise ValueError(f"Nonzero entries outside the sparsity pattern of {parameter.name()}")  # noqa: TRY003
+
+    if not trusted and (
+        (parameter.is_nonneg() and (values < 0).any()) or (parameter.is_nonpos() and (values > 0).any())
+    ):
+        raise ValueError(f"Values violating the sign of {parameter.name()}")  # noqa: TRY003
+
+    parameter._value = values
@@ -0,0 +1,54 @@
+#    Copyright 2023 Stanford University Convex Optimization Group
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""Process pools whose workers each hold a copy of one problem.
+
+`Problem.solve_many` and `frontier` hand their work to worker processes that
+all solve the same problem. Each worker receives the problem once, when the
+pool starts it, rather than with every task, so the pickled problem -- and
+with it the cached canonicalization -- crosses the process boundary once per
+worker.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cvxmarkowitz.problem import Problem
+
+# the problem of this process, set by `install`
+_INSTALLED: dict[str, Problem] = {}
+
+
+def pool(workers: int, problem: Problem) -> ProcessPoolExecutor:
+    """Return a pool of `workers` processes, each with a copy of `problem` installed.
+
+    The processes are spawned, not forked: forking a process that runs solver
+    threads can deadlock the child, and spawn is what macOS and Windows do
+    anyway.
+    """
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(workers, context, initializer=install, initargs=(problem,))
+
+
+def install(problem: Problem) -> None:
+    """Make `problem` the one `installed` returns in this process."""
+    _INSTALLED["problem"] = problem
+
+
+def installed() -> Problem:
+    """Return the problem `install` installed in this process."""
+    return _INSTALLED["problem"]
@@ -0,0 +1,125 @@
+#    Copyright 2023 Stanford University Convex Optimization Group
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+"""Write objects to disk so that their large arrays can be memory-mapped back, or copy them in memory."""
+
+from __future__ import annotations
+
+import io
+import pickle
+import struct
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Every buffer starts on a multiple of this many bytes, so the arrays read back
+# from the file are aligned for any dtype numpy holds.
+_ALIGN = 64
+
+
+def dump(obj: Any, path: str | Path) -> None:
+    """Pickle `obj` to `path`, writing its contiguous arrays out of band.
+
+    The file holds a header of lengths, the pickle stream, and then the raw
+    bytes of every contiguous numpy array the stream refers to -- which for a
+    compiled cvxpy problem is nearly all of it: the sparse tensors mapping
+    parameters to solver data. Keeping them outside the stream is what lets
+    `load` map them from the file instead of copying them into memory.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [buffer.raw() for buffer in buffers]
+
+    lengths = [len(payload), *(raw.nbytes for raw in raws)]
+    header = struct.pack(f"<{len(lengths) + 1}Q", len(raws), *lengths)
+
+    with Path(path).open("wb") as file:
+        file.write(header)
+        file.write(payload)
+        for raw in raws:
+            file.write(b"\0" * (-file.tell() % _ALIGN))
+            file.write(raw)
+
+
+def load(path: str | Path, mmap: bool = False) -> Any:
+    """Read back an object written by `dump`.
+
+    With `mmap=True` the arrays are views into a copy-on-write memory map of
+    the file rather than copies: pages are read from disk as they are touched,
+    processes loading the same file share them, and writing to an array only
+    ever changes this process's copy of the page, never the file.
+
+    Only load files you trust: this unpickles, and unpickling can run code.
+    """
+    data: Any = np.memmap(path, dtype=np.uint8, mode="c") if mmap else bytearray(Path(path).read_bytes())
+    view = memoryview(data)
+
+    (count,) = struct.unpack_from("<Q", view)
+    lengths = struct.unpack_from(f"<{count + 1}Q", view, offset=8)
+
+    offset = 8 * (count + 2)
+    payload = view[offset : offset + lengths[0]]
+    offset += lengths[0]
+
+    buffers = []
+    for length in lengths[1:]:
+        offset += -offset % _ALIGN
+        buffers.append(view[offset : offset + length])
+        offset += length
+
+    return pickle.loads(payload, buffers=buffers)  # noqa: S301  # documented: trusted files only
+
+
+def copy(obj: Any, share: Callable[[Any], bool]) -> Any:
+    """Return a copy of `obj` made by a pickle round trip, sharing the parts `share` selects.
+
+    Every object reached from `obj` for which `share` is True is referred to
+    by the copy as is, neither pickled nor copied; the rest is copied as pickle
+    copies it -- which, unlike `copy.deepcopy`, keeps the ids cvxpy gives to
+    parameters and variables, and with them every map keyed by those ids.
+    """
+    buffer = io.BytesIO()
+    pickler = _SharingPickler(buffer, share)
+    pickler.dump(obj)
+    buffer.seek(0)
+    return _SharingUnpickler(buffer, pickler.shared).load()
+
+
+class _SharingPickler(pickle.Pickler):
+    """Pickle by reference what `share` selects, remembering it in `shared`."""
+
+    def __init__(self, file: io.BytesIO, share: Callable[[Any], bool]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.share = share
+        self.shared: dict[int, Any] = {}
+
+    def persistent_id(self, obj: Any) -> int | None:
+        """Return the key of a shared object, None to pickle `obj` as usual."""
+        if not self.share(obj):
+            return None
+        self.shared[id(obj)] = obj
+        return id(obj)
+
+
+class _SharingUnpickler(pickle.Unpickler):
+    """Resolve the references `_SharingPickler` wrote to the objects themselves."""
+
+    def __init__(self, file: io.BytesIO, shared: dict[int, Any]) -> None:
+        super().__init__(file)
+        self.shared = shared
+
+    def persistent_load(self, pid: Any) -> Any:
+        """Return the shared object with key `pid`."""
+        return self.shared[pid]
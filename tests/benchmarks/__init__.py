@@ -0,0 +1 @@
+"""Benchmarks for building, updating and solving problems."""
@@ -0,0 +1,94 @@
+"""Fixtures shared by the benchmarks.
+
+The benchmarks use pytest-benchmark's `benchmark` fixture. `make benchmark`
+provisions the plugin and runs them; every other run skips them, by the
+`--benchmark-skip` in pytest.ini. Where the plugin is missing, this directory
+is not collected rather than failing to collect.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+
+import numpy as np
+import pytest
+from cvx.linalg import cholesky
+
+from cvxmarkowitz.names import DataNames as D
+
+if importlib.util.find_spec("pytest_benchmark") is None:
+    collect_ignore_glob = ["test_*.py"]
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip the `stress` sizes unless they are asked for, with `-m stress` say.
+
+    They take minutes and gigabytes, too much for a run of the whole suite.
+    """
+    if "stress" in config.getoption("markexpr", ""):
+        return
+
+    skip = pytest.mark.skip(reason="stress size; select with -m stress")
+    for item in items:
+        if "stress" in item.keywords:
+            item.add_marker(skip)
+
+
+def covariance(assets: int, seed: int | None = None) -> np.ndarray:
+    """Return a seeded, well-conditioned sample covariance of daily-scale returns."""
+    rng = np.random.default_rng(assets if seed is None else seed)
+    returns = rng.normal(scale=0.01, size=(2 * assets, assets))
+    return np.cov(returns, rowvar=False) + 1e-5 * np.eye(assets)
+
+
+@pytest.fixture(scope="session")
+def min_var_data():
+    """Return a factory of complete, seeded MinVar payloads by number of assets."""
+
+    def make(assets: int) -> dict[str, np.ndarray]:
+        return {
+            D.CHOLESKY: cholesky(covariance(assets)),
+            D.LOWER_BOUND_ASSETS: np.zeros(assets),
+            D.UPPER_BOUND_ASSETS: np.ones(assets),
+            D.VOLA_UNCERTAINTY: np.zeros(assets),
+        }
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def portfolio_data():
+    """Return a factory of seeded payloads covering every model's keywords.
+
+    The risk data follow the risk model: a Cholesky factor of the sample
+    covariance by default, factor data with `factors`, or scenario returns
+    with `rows`. Keywords a problem does not read are ignored by `update`.
+    """
+
+    def make(assets: int, factors: int = 0, rows: int = 0, seed: int = 0) -> dict[str, np.ndarray]:
+        rng = np.random.default_rng(seed)
+        data = {
+            D.LOWER_BOUND_ASSETS: np.zeros(assets),
+            D.UPPER_BOUND_ASSETS: np.ones(assets),
+            D.MU: rng.normal(loc=5e-4, scale=1e-3, size=assets),
+            D.MU_UNCERTAINTY: np.zeros(assets),
+        }
+
+        if factors:
+            data |= {
+                D.EXPOSURE: rng.normal(size=(factors, assets)),
+                D.CHOLESKY: cholesky(covariance(factors, seed)),
+                D.IDIOSYNCRATIC_VOLA: rng.uniform(0.005, 0.02, size=assets),
+                D.SYSTEMATIC_VOLA_UNCERTAINTY: np.zeros(factors),
+                D.IDIOSYNCRATIC_VOLA_UNCERTAINTY: np.zeros(assets),
+                D.LOWER_BOUND_FACTORS: -np.ones(factors),
+                D.UPPER_BOUND_FACTORS: np.ones(factors),
+            }
+        elif rows:
+            data[D.RETURNS] = rng.normal(scale=0.01, size=(rows, assets))
+        else:
+            data |= {D.CHOLESKY: cholesky(covariance(assets, seed)), D.VOLA_UNCERTAINTY: np.zeros(assets)}
+
+        return data
+
+    return make
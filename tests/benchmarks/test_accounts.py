@@ -0,0 +1,58 @@
+"""Benchmark many accounts of one strategy: one solve for all against one each.
+
+Every account runs MinVar on the same factor data and differs in its upper
+bounds only. Both variants compile one account's problem once, write the
+factor data once and take the fast path. "sequential" updates and solves the
+problem once per account; "stacked" hands all accounts to
+`Problem.solve_accounts`, which solves them as one block-diagonal problem.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cvxmarkowitz import MinVar
+from cvxmarkowitz.names import DataNames as D
+
+ASSETS, FACTORS = 100, 10
+
+# (variant, accounts)
+SIZES = [
+    ("sequential", 10),
+    ("stacked", 10),
+    ("sequential", 100),
+    ("stacked", 100),
+    pytest.param("sequential", 500, marks=pytest.mark.stress),
+    pytest.param("stacked", 500, marks=pytest.mark.stress),
+]
+
+
+def bounds(count: int) -> list[dict[str, np.ndarray]]:
+    """Return the upper bounds of each account."""
+    return [{D.UPPER_BOUND_ASSETS: np.full(ASSETS, 0.05 + 0.5 * account / count)} for account in range(count)]
+
+
+@pytest.mark.parametrize(("variant", "count"), SIZES)
+def test_solve(benchmark, portfolio_data, variant, count):
+    """Time solving every account, its data written; both give the same weights."""
+    problem = MinVar(assets=ASSETS, factors=FACTORS).build()
+    problem.compile_fast()
+    problem.update(**portfolio_data(ASSETS, factors=FACTORS))
+    accounts = bounds(count)
+
+    def sequential():
+        rows = []
+        for payload in accounts:
+            problem.update(**payload)
+            problem.solve()
+            rows.append(problem.weights)
+        return np.array(rows)
+
+    def stacked():
+        return problem.solve_accounts(accounts).weights
+
+    expected = sequential()
+    benchmark.group = f"solve {count} accounts"
+    weights = benchmark(stacked if variant == "stacked" else sequential)
+    np.testing.assert_allclose(weights, expected, atol=1e-4)
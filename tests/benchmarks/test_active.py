@@ -0,0 +1,47 @@
+"""Benchmark one large compiled problem serving a smaller universe.
+
+A problem compiled for `capacity` assets takes the data of a smaller
+universe padded with zeros. On its own, padding leaves the padded assets in
+the solver's problem, pinned by zero bounds. With `mask=True` the fast path
+drops them before the solve. Three ways to solve the same universe are timed:
+
+- "native": a problem compiled for the universe itself;
+- "padded": the large problem, padded only;
+- "masked": the large problem with its mask set.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cvxmarkowitz import MinVar
+
+# (variant, capacity, universe, factors)
+SIZES = [
+    ("native", 300, 200, None),
+    ("padded", 300, 200, None),
+    ("masked", 300, 200, None),
+    pytest.param("native", 2000, 1200, 20, marks=pytest.mark.stress),
+    pytest.param("padded", 2000, 1200, 20, marks=pytest.mark.stress),
+    pytest.param("masked", 2000, 1200, 20, marks=pytest.mark.stress),
+]
+
+
+def problem(portfolio_data, variant: str, capacity: int, universe: int, factors: int | None):
+    """Return a compiled MinVar problem holding the data of `universe` assets."""
+    assets = universe if variant == "native" else capacity
+    result = MinVar(assets=assets, factors=factors, mask=variant == "masked").build()
+    result.compile_fast()
+    result.update(**portfolio_data(universe, factors=factors or 0), active=np.ones(universe, dtype=bool))
+    return result
+
+
+@pytest.mark.parametrize(("variant", "capacity", "universe", "factors"), SIZES)
+def test_solve(benchmark, portfolio_data, variant, capacity, universe, factors):
+    """Time solving the universe; every variant reaches the native value."""
+    compiled = problem(portfolio_data, variant, capacity, universe, factors)
+    expected = problem(portfolio_data, "native", capacity, universe, factors).solve()
+
+    benchmark.group = f"solve {universe} of {capacity} assets, {factors} factors"
+    assert benchmark(compiled.solve) == pytest.approx(expected, rel=1e-4, abs=1e-8)
@@ -0,0 +1,40 @@
+"""Benchmark building a problem from a builder that has built it before.
+
+A builder keeps the expressions of its models, so a repeated `build` reuses
+the risk and return trees -- and the analysis cvxpy caches on them, the DPP
+check among it -- rather than constructing them again. The first build is
+timed on a fresh builder for comparison.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from cvxmarkowitz import MaxSharpe, MinVar, SoftRisk
+
+# (builder, assets, factors)
+SIZES = [
+    (MinVar, 300, None),
+    (MaxSharpe, 300, 20),
+    (SoftRisk, 300, 20),
+    pytest.param(MaxSharpe, 3000, 100, marks=pytest.mark.stress),
+]
+
+
+@pytest.mark.parametrize(("builder", "assets", "factors"), SIZES)
+def test_first_build(benchmark, builder, assets, factors):
+    """Time building from a fresh builder."""
+    benchmark.group = f"build, {builder.__name__}, {assets} assets, {factors} factors"
+    benchmark.pedantic(
+        lambda fresh: fresh.build(), setup=lambda: ((builder(assets=assets, factors=factors),), {}), rounds=20
+    )
+
+
+@pytest.mark.parametrize(("builder", "assets", "factors"), SIZES)
+def test_repeated_build(benchmark, builder, assets, factors):
+    """Time building again from a builder that has built before."""
+    built = builder(assets=assets, factors=factors)
+    built.build()
+
+    benchmark.group = f"build, {builder.__name__}, {assets} assets, {factors} factors"
+    benchmark(built.build)
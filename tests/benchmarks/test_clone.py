@@ -0,0 +1,71 @@
+"""Benchmark handing out one problem per thread: building afresh against cloning.
+
+A fresh build compiles on its first solve; a clone of a compiled problem
+shares the map from parameters to solver data and compiles nothing. The
+bytes each needs of its own -- the pickled problem without the shared map --
+are recorded in `extra_info`.
+"""
+
+from __future__ import annotations
+
+import io
+import pickle
+
+import pytest
+
+from cvxmarkowitz import MaxSharpe
+from cvxmarkowitz.names import ParameterName as P
+from cvxmarkowitz.problem import _compiled
+from cvxmarkowitz.utils.serialize import _SharingPickler
+
+# (assets, factors)
+SIZES = [(100, None), (300, 20), pytest.param(1000, 50, marks=pytest.mark.stress)]
+
+
+def builder(assets: int, factors: int | None) -> MaxSharpe:
+    """Return a MaxSharpe builder with its volatility limit set."""
+    result = MaxSharpe(assets=assets, factors=factors)
+    result.parameter[P.SIGMA_MAX].value = 0.01
+    return result
+
+
+def own_bytes(problem) -> int:
+    """Return the size of `problem` pickled without the parts clones share."""
+    buffer = io.BytesIO()
+    _SharingPickler(buffer, _compiled).dump(problem)
+    return buffer.tell()
+
+
+@pytest.mark.parametrize(("assets", "factors"), SIZES)
+def test_build(benchmark, portfolio_data, assets, factors):
+    """Time building, updating and solving a fresh problem."""
+    data = portfolio_data(assets, factors=factors or 0)
+
+    def run():
+        problem = builder(assets, factors).build()
+        problem.update(**data)
+        return problem.solve()
+
+    benchmark.group = f"problem per thread, {assets} assets, {factors} factors"
+    compiled = builder(assets, factors).build()
+    compiled.get_problem_data("CLARABEL")
+    benchmark.extra_info["bytes"] = len(pickle.dumps(compiled))
+    benchmark.pedantic(run, rounds=3)
+
+
+@pytest.mark.parametrize(("assets", "factors"), SIZES)
+def test_clone(benchmark, portfolio_data, assets, factors):
+    """Time cloning, updating and solving a compiled problem; both reach the same value."""
+    data = portfolio_data(assets, factors=factors or 0)
+    problem = builder(assets, factors).build()
+    problem.update(**data)
+    expected = problem.solve()
+
+    def run():
+        clone = problem.clone()
+        clone.update(**data)
+        return clone.solve()
+
+    benchmark.group = f"problem per thread, {assets} assets, {factors} factors"
+    benchmark.extra_info["bytes"] = own_bytes(problem)
+    assert benchmark.pedantic(run, rounds=3) == pytest.approx(expected, rel=1e-6)
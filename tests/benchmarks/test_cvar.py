@@ -0,0 +1,104 @@
+"""Benchmark the two CVaR formulations over 1,000 to 100,000 scenarios.
+
+`CVar` ranks the scenario losses with `sum_smallest`, its tail size fixed
+when the model is built; `ParametricCVar` is the Rockafellar-Uryasev
+formulation with one slack per scenario and alpha a Parameter. The first
+benchmark times a fresh problem to its first solution, compilation
+included. The second sweeps five confidence levels, the way a risk report
+would: `CVar` rebuilds and recompiles for each, `ParametricCVar` compiles
+once and only solves again. Both are linear programs the solver takes about
+as long over, and that time dominates: the sweep saves one compilation per
+level, some 5 to 20 per cent here, rather than orders of magnitude.
+
+`CuttingPlaneCVar` keeps the scenarios out of the problem: it solves on an
+active set of them and checks each solution against all, which keeps the
+problem at a few times the tail. The last benchmark times it on scenarios
+memory-mapped from a file, up to a million of them.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cvxmarkowitz import MinVar
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.names import ParameterName as P
+from cvxmarkowitz.problem import Problem
+from cvxmarkowitz.risk import CuttingPlaneCVar, CVar, ParametricCVar
+from cvxmarkowitz.risk.cvar import solve_cutting_plane
+
+ASSETS = 20
+
+LEVELS = (0.99, 0.975, 0.95, 0.9, 0.8)
+
+ROWS = [1_000, 10_000, pytest.param(100_000, marks=pytest.mark.stress)]
+
+
+def scenarios(rows: int) -> np.ndarray:
+    """Return `rows` seeded scenarios of ASSETS returns."""
+    return np.random.default_rng(rows).normal(scale=0.01, size=(rows, ASSETS))
+
+
+def problem(formulation: str, rows: int, alpha: float = LEVELS[0]) -> Problem:
+    """Return a MinVar problem on `rows` seeded scenarios with its data in place."""
+    model = CVar if formulation == "sum_smallest" else ParametricCVar
+    result = MinVar(assets=ASSETS, model={M.RISK: model(assets=ASSETS, rows=rows, alpha=alpha)}).build()
+    result.update(
+        **{
+            D.RETURNS: scenarios(rows),
+            D.LOWER_BOUND_ASSETS: np.zeros(ASSETS),
+            D.UPPER_BOUND_ASSETS: np.ones(ASSETS),
+        }
+    )
+    return result
+
+
+@pytest.mark.parametrize("rows", ROWS)
+@pytest.mark.parametrize("formulation", ["sum_smallest", "rockafellar_uryasev"])
+def test_first_solve(benchmark, formulation, rows):
+    """Time a fresh problem to its first solution."""
+    benchmark.group = f"cvar first solve, {rows} scenarios"
+    benchmark.pedantic(lambda p: p.solve(), setup=lambda: ((problem(formulation, rows),), {}), rounds=3)
+
+
+@pytest.mark.parametrize("rows", ROWS)
+@pytest.mark.parametrize("formulation", ["sum_smallest", "rockafellar_uryasev"])
+def test_sweep_alpha(benchmark, formulation, rows):
+    """Time solving at every confidence level in LEVELS."""
+
+    def rebuild() -> list[float]:
+        return [problem(formulation, rows, alpha).solve() for alpha in LEVELS]
+
+    compiled = problem(formulation, rows)
+    compiled.solve()
+
+    def resolve() -> list[float]:
+        values = []
+        for alpha in LEVELS:
+            compiled.model[M.RISK].parameter[P.ALPHA].value = alpha
+            values.append(compiled.solve())
+        return values
+
+    benchmark.group = f"cvar sweep over {len(LEVELS)} levels, {rows} scenarios"
+    values = benchmark.pedantic(rebuild if formulation == "sum_smallest" else resolve, rounds=3)
+    assert values == sorted(values, reverse=True)
+
+
+@pytest.mark.parametrize("rows", [*ROWS, pytest.param(1_000_000, marks=pytest.mark.stress)])
+def test_active_set(benchmark, tmp_path_factory, rows):
+    """Time the active-set CVaR from a fresh problem, the scenarios memory-mapped."""
+    path = tmp_path_factory.mktemp("scenarios") / "scenarios.npy"
+    np.save(path, scenarios(rows))
+    mapped = np.load(path, mmap_mode="r")
+
+    def fresh() -> tuple[tuple[Problem], dict]:
+        # room for ten times the tail
+        model = CuttingPlaneCVar(assets=ASSETS, alpha=LEVELS[0], rows=rows // 10)
+        result = MinVar(assets=ASSETS, model={M.RISK: model}).build()
+        result.update(**{D.LOWER_BOUND_ASSETS: np.zeros(ASSETS), D.UPPER_BOUND_ASSETS: np.ones(ASSETS)})
+        return (result,), {}
+
+    benchmark.group = f"cvar first solve, {rows} scenarios"
+    benchmark.pedantic(lambda p: solve_cutting_plane(p, mapped), setup=fresh, rounds=3)
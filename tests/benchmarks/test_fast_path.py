@@ -0,0 +1,33 @@
+"""Benchmark the fast path of Problem.compile_fast against cvxpy's solve path.
+
+Both sides time one `update` plus one `solve` on a problem compiled before the
+clock starts, which is the loop the fast path is for. The gap is cvxpy's fixed
+per-solve overhead, so it is widest at small sizes, where the solver itself is
+quick.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from cvxmarkowitz import MinVar
+
+
+@pytest.mark.parametrize("assets", [10, 100])
+@pytest.mark.parametrize("fast", [False, True], ids=["cvxpy", "fast"])
+def test_update_and_solve(benchmark, min_var_data, assets, fast):
+    """Time update plus solve on a compiled MinVar problem."""
+    data = min_var_data(assets)
+    problem = MinVar(assets=assets).build()
+    if fast:
+        problem.compile_fast()
+
+    problem.update(**data)
+    expected = problem.solve()  # compile outside the timed region
+
+    def update_and_solve() -> float:
+        problem.update(**data)
+        return problem.solve(warm_start=True)
+
+    benchmark.group = f"update+solve, {assets} assets"
+    assert benchmark(update_and_solve) == pytest.approx(expected, rel=1e-6)
@@ -0,0 +1,49 @@
+"""Benchmark importing the package, with a budget on what it adds to cvxpy.
+
+Each case runs in a fresh interpreter. The benchmark times the whole start;
+the budget covers the modules the import loads beyond those `import cvxpy`
+loads -- the package itself and what only it needs -- as `python -X
+importtime` reports them, so it does not move with the time cvxpy takes.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# seconds the package may add to cvxpy's own import
+BUDGET = 0.1
+
+STATEMENTS = [
+    "import cvxmarkowitz",
+    "from cvxmarkowitz import MinVar",
+    "from cvxmarkowitz import MaxSharpe",
+    "from cvxmarkowitz import SoftRisk",
+    "from cvxmarkowitz.risk import CVar",
+]
+
+
+def import_times(statement: str) -> dict[str, float]:
+    """Return the time in seconds each module took to import itself, by name, for `statement`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, own, _, name = line.replace("|", ":").split(":")
+        times[name.strip()] = int(own) / 1e6
+    return times
+
+
+@pytest.mark.parametrize("statement", STATEMENTS)
+def test_import(benchmark, statement):
+    """Time a fresh interpreter importing `statement`, and hold it to the budget."""
+    baseline = import_times("import cvxpy")
+    own = sum(time for name, time in import_times(statement).items() if name not in baseline)
+
+    benchmark.group = "import"
+    benchmark.extra_info["own"] = own
+    benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", statement],), kwargs={"check": True}, rounds=3)
+    assert own < BUDGET
@@ -0,0 +1,111 @@
+"""Benchmark build, update and solve for every portfolio and risk model.
+
+Each of `MinVar`, `MaxSharpe` and `SoftRisk` is paired with `SampleCovariance`,
+`FactorModel` and `CVar` over a range of sizes. The default sizes keep a run
+to minutes; the larger ones are marked `stress` and want a machine with the
+memory to match. `make benchmark-baseline`
+saves a run as JSON and `make benchmark-compare` fails on any benchmark slower
+than the baseline beyond a threshold (see local.mk).
+
+Update and solve are timed on a compiled problem, the steady state of a
+backtest. They stop short of the largest sizes `build` covers: cvxpy compiles
+a map with a column per parameter entry, which for a full Cholesky factor of
+1,000 assets, or exposures of 2,000 assets to 50 factors, runs to tens of
+gigabytes.
+"""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from cvxmarkowitz import MaxSharpe, MinVar, SoftRisk
+from cvxmarkowitz.builder import Builder
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.names import ParameterName as P
+from cvxmarkowitz.risk import CVar
+
+PORTFOLIOS = [MinVar, MaxSharpe, SoftRisk]
+
+# (risk model, assets, factors or scenario rows)
+SIZES = [
+    ("sample", 10, 0),
+    ("sample", 100, 0),
+    pytest.param("sample", 300, 0, marks=pytest.mark.stress),
+    ("factor", 100, 5),
+    ("factor", 1000, 20),
+    pytest.param("factor", 1000, 50, marks=pytest.mark.stress),
+    pytest.param("factor", 2000, 20, marks=pytest.mark.stress),
+    ("cvar", 10, 250),
+    ("cvar", 100, 250),
+    pytest.param("cvar", 1000, 250, marks=pytest.mark.stress),
+    pytest.param("cvar", 5000, 250, marks=pytest.mark.stress),
+]
+
+# too large to compile, but not to build
+BUILD_ONLY_SIZES = [
+    pytest.param("sample", 1000, 0, marks=pytest.mark.stress),
+    pytest.param("sample", 5000, 0, marks=pytest.mark.stress),
+    pytest.param("factor", 2000, 50, marks=pytest.mark.stress),
+    pytest.param("factor", 5000, 200, marks=pytest.mark.stress),
+]
+
+
+def builder(portfolio: type[Builder], risk: str, assets: int, size: int) -> Builder:
+    """Return a builder with its risk model and scalar parameters set."""
+    if risk == "factor":
+        result = portfolio(assets=assets, factors=size)
+    elif risk == "cvar":
+        result = portfolio(assets=assets, model={M.RISK: CVar(assets=assets, rows=size)})
+    else:
+        result = portfolio(assets=assets)
+
+    for name, value in {P.SIGMA_MAX: 1.0, P.SIGMA_TARGET: 0.01, P.OMEGA: 1.0}.items():
+        if name in result.parameter:
+            result.parameter[name].value = value
+
+    return result
+
+
+def data(portfolio_data, risk: str, assets: int, size: int, seed: int = 0) -> dict:
+    """Return a payload for the risk model, seeded by `seed`."""
+    return portfolio_data(
+        assets,
+        factors=size if risk == "factor" else 0,
+        rows=size if risk == "cvar" else 0,
+        seed=seed,
+    )
+
+
+@pytest.mark.parametrize(("risk", "assets", "size"), SIZES + BUILD_ONLY_SIZES)
+@pytest.mark.parametrize("portfolio", PORTFOLIOS, ids=lambda p: p.__name__)
+def test_build(benchmark, portfolio, risk, assets, size):
+    """Time assembling the problem, from a fresh builder each round."""
+    benchmark.group = f"build, {risk}"
+    benchmark.pedantic(lambda b: b.build(), setup=lambda: ((builder(portfolio, risk, assets, size),), {}), rounds=5)
+
+
+@pytest.mark.parametrize(("risk", "assets", "size"), SIZES)
+@pytest.mark.parametrize("portfolio", PORTFOLIOS, ids=lambda p: p.__name__)
+def test_update(benchmark, portfolio_data, portfolio, risk, assets, size):
+    """Time writing a fresh data set into a compiled problem."""
+    problem = builder(portfolio, risk, assets, size).build()
+    payloads = itertools.cycle([data(portfolio_data, risk, assets, size, seed) for seed in (0, 1)])
+    problem.update(**next(payloads))
+    problem.solve()
+
+    benchmark.group = f"update, {risk}"
+    benchmark(lambda: problem.update(**next(payloads)))
+
+
+@pytest.mark.parametrize(("risk", "assets", "size"), SIZES)
+@pytest.mark.parametrize("portfolio", PORTFOLIOS, ids=lambda p: p.__name__)
+def test_solve(benchmark, portfolio_data, portfolio, risk, assets, size):
+    """Time solving a compiled problem, its data in place."""
+    problem = builder(portfolio, risk, assets, size).build()
+    problem.update(**data(portfolio_data, risk, assets, size))
+    expected = problem.solve()  # compile outside the timed region
+
+    benchmark.group = f"solve, {risk}"
+    assert benchmark(problem.solve) == pytest.approx(expected, rel=1e-4, abs=1e-8)
@@ -0,0 +1,65 @@
+"""Benchmark building a problem with and without the robust terms.
+
+With `robust=False` a builder leaves out the absolute-weight variable, the
+uncertainty parameters and the constraints linking the two. Every input in
+the robust payload below has zero uncertainty, so both variants solve to the
+same portfolio; the plain one carries fewer variables and cone rows.
+
+The problem size is recorded in `extra_info`: the scalar variables and the
+rows of the constraint matrix handed to the solver.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from cvxmarkowitz import MaxSharpe
+from cvxmarkowitz.names import ParameterName as P
+
+# (robust, assets, factors)
+SIZES = [
+    (True, 100, None),
+    (False, 100, None),
+    (True, 300, 20),
+    (False, 300, 20),
+    pytest.param(True, 1000, 50, marks=pytest.mark.stress),
+    pytest.param(False, 1000, 50, marks=pytest.mark.stress),
+]
+
+
+def problem(portfolio_data, robust: bool, assets: int, factors: int | None):
+    """Return a MaxSharpe problem with its data in place."""
+    builder = MaxSharpe(assets=assets, factors=factors, robust=robust)
+    builder.parameter[P.SIGMA_MAX].value = 0.01
+    result = builder.build()
+    result.update(**portfolio_data(assets, factors=factors or 0))
+    return result
+
+
+def record_size(benchmark, compiled) -> None:
+    """Store the size of the compiled problem in the benchmark's extra info."""
+    data, _, _ = compiled.get_problem_data(solver="CLARABEL")
+    benchmark.extra_info["variables"] = compiled.problem.size_metrics.num_scalar_variables
+    benchmark.extra_info["rows"] = data["A"].shape[0]
+
+
+@pytest.mark.parametrize(("robust", "assets", "factors"), SIZES)
+def test_compile(benchmark, portfolio_data, robust, assets, factors):
+    """Time the first solve of a fresh problem, compilation included."""
+    benchmark.group = f"compile and solve, {assets} assets, {factors} factors"
+    benchmark.pedantic(
+        lambda p: p.solve(),
+        setup=lambda: ((problem(portfolio_data, robust, assets, factors),), {}),
+        rounds=3,
+    )
+
+
+@pytest.mark.parametrize(("robust", "assets", "factors"), SIZES)
+def test_solve(benchmark, portfolio_data, robust, assets, factors):
+    """Time solving a compiled problem; both variants reach the same value."""
+    compiled = problem(portfolio_data, robust, assets, factors)
+    record_size(benchmark, compiled)
+    expected = problem(portfolio_data, True, assets, factors).solve()
+
+    benchmark.group = f"solve, {assets} assets, {factors} factors"
+    assert benchmark(compiled.solve) == pytest.approx(expected, rel=1e-4, abs=1e-8)
@@ -0,0 +1,82 @@
+"""Benchmark a thin, returns-based factor against the square Cholesky factor.
+
+`SampleCovariance` takes any square root of the covariance. From T
+observations of n assets the square Cholesky factor has n x n entries and a
+second-order cone of size n; the scaled, demeaned returns have T x n and a
+cone of size T. Both give the same risk. For T well below n the thin factor
+compiles in a fraction of the time and memory, and solves faster, and the
+gap grows with n: the square factor at 1,000 assets does not compile in
+memory at all.
+
+The compile benchmark records the peak memory traced during compilation in
+`extra_info["peak_mib"]`.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+import numpy as np
+import pytest
+from cvx.linalg import cholesky
+
+from cvxmarkowitz import MinVar
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.risk import SampleCovariance
+
+# observations in the estimation window
+WINDOW = 60
+
+# (factor, assets)
+SIZES = [
+    ("square", 100),
+    ("thin", 100),
+    ("square", 300),
+    ("thin", 300),
+    ("thin", 1000),
+    pytest.param("thin", 3000, marks=pytest.mark.stress),
+]
+
+
+def problem(factor: str, assets: int):
+    """Return a MinVar problem on `assets` with its data in place."""
+    returns = np.random.default_rng(assets).normal(scale=0.01, size=(WINDOW, assets))
+    data = {
+        D.LOWER_BOUND_ASSETS: np.zeros(assets),
+        D.UPPER_BOUND_ASSETS: np.ones(assets),
+        D.VOLA_UNCERTAINTY: np.zeros(assets),
+    }
+
+    if factor == "thin":
+        result = MinVar(assets=assets, model={M.RISK: SampleCovariance(assets=assets, rows=WINDOW)}).build()
+        result.update(**data, **{D.CHOLESKY: SampleCovariance.returns_factor(returns)})
+    else:
+        # the sample covariance is singular for WINDOW < assets; shrink it for the Cholesky factor
+        cov = np.cov(returns, rowvar=False) + 1e-8 * np.eye(assets)
+        result = MinVar(assets=assets).build()
+        result.update(**data, **{D.CHOLESKY: cholesky(cov)})
+
+    return result
+
+
+@pytest.mark.parametrize(("factor", "assets"), SIZES)
+def test_compile(benchmark, factor, assets):
+    """Time the first solve of a fresh problem, compilation included."""
+    tracemalloc.start()
+    problem(factor, assets).solve()
+    benchmark.extra_info["peak_mib"] = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+
+    benchmark.group = f"compile and solve, {assets} assets"
+    benchmark.pedantic(lambda p: p.solve(), setup=lambda: ((problem(factor, assets),), {}), rounds=3)
+
+
+@pytest.mark.parametrize(("factor", "assets"), SIZES)
+def test_solve(benchmark, factor, assets):
+    """Time solving a compiled problem, its data in place."""
+    compiled = problem(factor, assets)
+    expected = compiled.solve()
+
+    benchmark.group = f"solve, {assets} assets"
+    assert benchmark(compiled.solve) == pytest.approx(expected, rel=1e-4, abs=1e-8)
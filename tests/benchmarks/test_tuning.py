@@ -0,0 +1,50 @@
+"""Benchmark every installed solver on the problems `Problem.autotune` would tune.
+
+Each solver solves a compiled problem; the tuning picks the fastest one that
+matches the reference values, so these timings are what it compares. A
+solver that cannot take a problem is skipped.
+"""
+
+from __future__ import annotations
+
+import cvxpy as cp
+import pytest
+
+from cvxmarkowitz import MaxSharpe, MinVar
+from cvxmarkowitz.names import ParameterName as P
+
+# (builder, assets, factors)
+SIZES = [
+    (MinVar, 100, None),
+    (MaxSharpe, 300, 20),
+    pytest.param(MaxSharpe, 1000, 50, marks=pytest.mark.stress),
+]
+
+
+@pytest.mark.parametrize("solver", cp.installed_solvers())
+@pytest.mark.parametrize(("builder", "assets", "factors"), SIZES)
+def test_solve(benchmark, portfolio_data, builder, assets, factors, solver):
+    """Time solving a compiled problem with one solver."""
+    model = builder(assets=assets, factors=factors)
+    if P.SIGMA_MAX in model.parameter:
+        model.parameter[P.SIGMA_MAX].value = 0.01
+    problem = model.build()
+    problem.update(**portfolio_data(assets, factors=factors or 0))
+
+    try:
+        problem.solve(solver=solver)
+    except cp.error.SolverError:
+        pytest.skip(f"{solver} cannot solve this problem")
+
+    benchmark.group = f"solvers, {builder.__name__}, {assets} assets, {factors} factors"
+    benchmark(problem.solve, solver=solver)
+
+
+def test_autotune(benchmark, portfolio_data):
+    """Time tuning a compiled problem on five samples."""
+    problem = MinVar(assets=100).build()
+    samples = [portfolio_data(100, seed=seed) for seed in range(5)]
+
+    benchmark.group = "autotune"
+    tuning = benchmark.pedantic(problem.autotune, args=(samples,), rounds=3)
+    assert tuning.solver in cp.installed_solvers()
@@ -0,0 +1,35 @@
+"""Benchmark the overhead of an update, checked against unchecked.
+
+Each round writes one of two data sets in turn, so every keyword has changed
+and the checked update cannot skip a model. The unchecked update
+(`validate=False`) writes the same data by the plan compiled at build time.
+At these sizes both cost little next to a solve, and the difference between
+them is the overhead of the checks.
+"""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from cvxmarkowitz import MaxSharpe
+from cvxmarkowitz.names import ParameterName as P
+
+# (assets, factors)
+SIZES = [(5, 2), (20, 5), (100, 10)]
+
+
+@pytest.mark.parametrize("validate", [True, False])
+@pytest.mark.parametrize(("assets", "factors"), SIZES)
+def test_update(benchmark, portfolio_data, assets, factors, validate):
+    """Time one update of a factor MaxSharpe problem."""
+    builder = MaxSharpe(assets=assets, factors=factors)
+    builder.parameter[P.SIGMA_MAX].value = 1.0
+    problem = builder.build()
+
+    data = itertools.cycle([portfolio_data(assets, factors, seed=seed) for seed in range(2)])
+    problem.update(**next(data))
+
+    benchmark.group = f"update, {assets} assets, {factors} factors"
+    benchmark(lambda: problem.update(validate=validate, **next(data)))
@@ -7,10 +7,25 @@ Security Notes:
 
 from __future__ import annotations
 
+import importlib.util
 from pathlib import Path
 
 import cvxpy as cp
+import numpy as np
 import pytest
+from cvx.linalg import cholesky
+
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.tuning import ENVIRONMENT
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Accept the `--benchmark-skip` of pytest.ini where pytest-benchmark is not installed.
+
+    The benchmarks are not collected then anyway; see tests/benchmarks/conftest.py.
+    """
+    if importlib.util.find_spec("pytest_benchmark") is None:
+        parser.addoption("--benchmark-skip", action="store_true", help="skip the benchmarks (no pytest-benchmark)")
 
 
 @pytest.fixture(scope="session", name="resource_dir")
@@ -27,3 +42,37 @@ def solver(request):
     available in the current environment.
     """
     return request.param
+
+
+@pytest.fixture
+def max_sharpe_data():
+    """Return a factory of complete data payloads for a two-asset MaxSharpe problem.
+
+    MaxSharpe is the case that matters for `Problem.update` because it carries
+    an `ExpectedReturns` model, the only one with a keyword held in `parameter`
+    rather than `data`. Each call returns fresh arrays, free to mutate.
+    """
+
+    def make() -> dict[str, np.ndarray]:
+        return {
+            D.CHOLESKY: cholesky(np.array([[1.0, 0.5], [0.5, 2.0]])),
+            D.LOWER_BOUND_ASSETS: np.zeros(2),
+            D.UPPER_BOUND_ASSETS: np.ones(2),
+            D.MU: np.array([0.25, 0.30]),
+            D.MU_UNCERTAINTY: np.zeros(2),
+            D.VOLA_UNCERTAINTY: np.zeros(2),
+        }
+
+    return make
+
+
+@pytest.fixture(autouse=True)
+def solvers_file(tmp_path, monkeypatch):
+    """Point the file of tuned solvers into the test's directory.
+
+    Otherwise `Problem.solve` would default to what the user tuned on this
+    machine, and `Problem.autotune` would write to their file.
+    """
+    path = tmp_path / "solvers.json"
+    monkeypatch.setenv(ENVIRONMENT, str(path))
+    return path
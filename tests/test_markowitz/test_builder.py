@@ -11,10 +11,12 @@ import cvxpy as cp
 import numpy as np
 import pytest
 
-from cvxmarkowitz import Builder, CvxBuildError, CvxDataError, CvxSolverError
+from cvxmarkowitz import Builder, CvxBuildError, CvxDataError, CvxSolverError, MaxSharpe, MinVar
+from cvxmarkowitz.model import Model
 from cvxmarkowitz.names import ConstraintName as C
 from cvxmarkowitz.names import DataNames as D
 from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.risk import SampleCovariance
 
 
 @dataclass(frozen=True)
@@ -117,6 +119,50 @@ def test_builder_risk():
     assert builder.risk == builder.model[M.RISK]
 
 
+@pytest.mark.parametrize("robust", [True, False])
+def test_injected_risk_model_keeps_its_setting(robust):
+    """The absolute weights follow the risk model, whatever the builder's flag."""
+    builder = MinVar(assets=3, robust=not robust, model={M.RISK: SampleCovariance(assets=3, robust=robust)})
+    assert (D._ABS in builder.variables) == robust
+
+    problem = builder.build()
+    problem.update(
+        **{
+            D.CHOLESKY: np.eye(3),
+            D.VOLA_UNCERTAINTY: np.zeros(3),
+            D.LOWER_BOUND_ASSETS: np.zeros(3),
+            D.UPPER_BOUND_ASSETS: np.ones(3),
+        }
+    )
+    assert problem.solve() == pytest.approx(1 / np.sqrt(3), abs=1e-6)
+
+
+@dataclass(frozen=True)
+class AbsoluteRisk(Model):
+    """A risk model of its own, with no `robust` field, on the absolute weights."""
+
+    def estimate(self, variables):
+        """Return the sum of the absolute weights."""
+        return cp.sum(variables[D._ABS])
+
+    def update(self, **kwargs):
+        """Take no data."""
+
+    def constraints(self, variables):
+        """Bound the absolute weights from below."""
+        return {"abs": variables[D._ABS] >= cp.abs(variables[D.WEIGHTS])}
+
+
+def test_injected_risk_model_without_robust_gets_the_absolute_weights():
+    """A risk model that does not say whether it is robust is taken to be."""
+    builder = MinVar(assets=3, model={M.RISK: AbsoluteRisk(assets=3)})
+    assert D._ABS in builder.variables
+
+    problem = builder.build()
+    problem.update(**{D.LOWER_BOUND_ASSETS: np.zeros(3), D.UPPER_BOUND_ASSETS: np.ones(3)})
+    assert problem.solve() == pytest.approx(1.0, abs=1e-6)
+
+
 def test_non_dpp_problem_raises_cvx_build_error():
     """A non-DPP problem must be rejected with a CvxError, not an AssertionError."""
     builder = NotDppBuilder(assets=2)
@@ -148,3 +194,41 @@ def test_the_dpp_check_survives_optimized_mode():
         check=True,
     )
     assert result.stdout.strip() == "raised"
+
+
+def test_estimate_is_built_once():
+    """The objective, the risk constraint and every build share one risk expression."""
+    builder = MaxSharpe(assets=3, factors=2)
+    risk = builder.estimate()
+
+    assert builder.estimate(M.RISK) is risk
+    assert builder.constraints[C.RISK].args[0] is risk
+    assert builder.objective.args[0] is builder.estimate(M.RETURN)
+
+    first, second = builder.build(), builder.build()
+    assert first.problem.objective.args[0] is second.problem.objective.args[0]
+
+
+def test_model_constraints_are_built_once():
+    """A model's constraints are built on the first build and reused by the next."""
+    builder = MinVar(assets=3)
+    first = builder.build()
+    key = next(key for key in builder.constraints if key.startswith(M.BOUND_ASSETS))
+    bounds = builder.constraints[key]
+
+    second = builder.build()
+
+    assert builder.constraints[key] is bounds
+    assert any(constraint is bounds for constraint in first.problem.constraints)
+    assert any(constraint is bounds for constraint in second.problem.constraints)
+
+
+def test_replaced_model_is_built_afresh():
+    """Replacing a model under its name builds its expressions anew."""
+    builder = MinVar(assets=3)
+    risk = builder.estimate()
+
+    builder.model[M.RISK] = SampleCovariance(assets=3)
+
+    assert builder.estimate() is not risk
+    assert builder.estimate() is builder.estimate()
@@ -0,0 +1,212 @@
+"""Tests for the cache of compiled problems."""
+
+import cvxpy as cp
+import numpy as np
+import pytest
+
+from cvxmarkowitz import MaxSharpe, MinVar
+from cvxmarkowitz.cache import CacheInfo, ProblemCache
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.names import ParameterName as P
+from cvxmarkowitz.risk import CVar, FactorModel, ParametricCVar
+
+
+def _max_sharpe(sigma_max: float) -> MaxSharpe:
+    """Return a two-asset MaxSharpe builder with its volatility limit set."""
+    builder = MaxSharpe(assets=2)
+    builder.parameter[P.SIGMA_MAX].value = sigma_max
+    return builder
+
+
+def test_hits_copy_the_compiled_problem(max_sharpe_data):
+    """A repeated structure is compiled once and handed out as independent copies."""
+    cache = ProblemCache()
+    first = cache.build(_max_sharpe(2.0))
+    second = cache.build(_max_sharpe(2.0))
+
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+    assert first is not second
+    assert second.problem._cache.param_prog is not None
+    # the copies share the compiled map rather than holding one each
+    assert second.problem._cache.param_prog.reduced_A is first.problem._cache.param_prog.reduced_A
+
+    mu = np.array([0.30, 0.25])
+    first.update(**max_sharpe_data())
+    second.update(**{**max_sharpe_data(), D.MU: mu})
+    first.solve()
+    second.solve()
+
+    expected = _max_sharpe(2.0).build()
+    expected.update(**{**max_sharpe_data(), D.MU: mu})
+    expected.solve()
+    np.testing.assert_allclose(second.weights, expected.weights, atol=1e-6)
+    assert not np.allclose(first.weights, second.weights, atol=1e-3)
+
+
+def test_hits_take_the_parameters_of_the_builder(max_sharpe_data):
+    """A hit starts from the parameter values of the builder asking for it."""
+    cache = ProblemCache()
+    cache.build(_max_sharpe(10.0))
+    tight = cache.build(_max_sharpe(1.0))
+    assert cache.cache_info().hits == 1
+
+    expected = _max_sharpe(1.0).build()
+    for problem in (tight, expected):
+        problem.update(**max_sharpe_data())
+        problem.solve()
+
+    np.testing.assert_allclose(tight.weights, expected.weights, atol=1e-6)
+    np.testing.assert_allclose(tight.value, expected.value, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        lambda: MinVar(assets=3),
+        lambda: MinVar(assets=2, factors=1),
+        lambda: MaxSharpe(assets=2),
+        lambda: MinVar(assets=2, model={M.RISK: CVar(assets=2, rows=50)}),
+        lambda: MinVar(assets=2, model={M.RISK: CVar(assets=2, rows=100, alpha=0.9)}),
+    ],
+)
+def test_structural_changes_miss(other):
+    """Problems that differ in structure are compiled separately."""
+    cache = ProblemCache()
+    cache.build(MinVar(assets=2, model={M.RISK: CVar(assets=2, rows=100, alpha=0.95)}))
+    cache.build(other())
+    assert cache.cache_info().misses == 2
+
+
+def test_least_recently_used_is_evicted():
+    """Beyond maxsize the least recently used structure is dropped."""
+    cache = ProblemCache(maxsize=2)
+    cache.build(MinVar(assets=2))
+    cache.build(MinVar(assets=3))
+    cache.build(MinVar(assets=2))
+    cache.build(MinVar(assets=4))
+    assert cache.cache_info() == CacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+
+    cache.build(MinVar(assets=2))
+    cache.build(MinVar(assets=3))
+    assert cache.cache_info() == CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
+
+
+def test_cache_clear():
+    """Clearing drops the problems and resets the counters."""
+    cache = ProblemCache()
+    cache.build(MinVar(assets=2))
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=128, currsize=0)
+
+
+def test_hits_take_the_parameters_of_the_models():
+    """Parameters only a callback reads, like the CVaR level, follow the builder."""
+    cache = ProblemCache()
+    data = {
+        D.RETURNS: np.random.default_rng(0).normal(size=(100, 2)),
+        D.LOWER_BOUND_ASSETS: np.zeros(2),
+        D.UPPER_BOUND_ASSETS: np.ones(2),
+    }
+
+    values = []
+    for alpha in (0.95, 0.75):
+        builder = MinVar(assets=2, model={M.RISK: ParametricCVar(assets=2, rows=100)})
+        builder.risk.parameter[P.ALPHA].value = alpha
+        problem = cache.build(builder)
+        problem.update(**data)
+        values.append(problem.solve())
+
+    assert cache.cache_info().hits == 1
+    assert values[0] > values[1]
+
+
+def test_initial_values_of_parameters_hit():
+    """Models that differ only in a parameter's initial value share a compilation."""
+    cache = ProblemCache()
+    data = {
+        D.RETURNS: np.random.default_rng(0).normal(size=(100, 2)),
+        D.LOWER_BOUND_ASSETS: np.zeros(2),
+        D.UPPER_BOUND_ASSETS: np.ones(2),
+    }
+
+    for alpha in (0.95, 0.75):
+        problem = cache.build(MinVar(assets=2, model={M.RISK: ParametricCVar(assets=2, rows=100, alpha=alpha)}))
+        problem.update(**data)
+
+        expected = MinVar(assets=2, model={M.RISK: ParametricCVar(assets=2, rows=100, alpha=alpha)}).build()
+        expected.update(**data)
+        assert problem.solve() == pytest.approx(expected.solve(), abs=1e-6)
+
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+
+
+def test_sparsity_patterns_miss():
+    """Exposures of different sparsity compile to different problems."""
+    cache = ProblemCache()
+    for diagonal in (0, 1, 1):
+        pattern = np.eye(2, 3, k=diagonal, dtype=bool)
+        cache.build(MinVar(assets=3, factors=2, model={M.RISK: FactorModel(assets=3, factors=2, sparsity=pattern)}))
+
+    assert cache.cache_info().misses == 2
+    assert cache.cache_info().hits == 1
+
+
+def test_hits_do_not_build(monkeypatch):
+    """A builder like one seen before is answered without building it."""
+    built = []
+    build = MinVar.build
+    monkeypatch.setattr(MinVar, "build", lambda self: built.append(self) or build(self))
+
+    cache = ProblemCache()
+    for _ in range(3):
+        cache.build(MinVar(assets=2))
+
+    assert len(built) == 1
+    assert cache.cache_info() == CacheInfo(hits=2, misses=1, maxsize=128, currsize=1)
+
+    # once evicted, the structure is built again
+    cache = ProblemCache(maxsize=1)
+    for assets in (2, 3, 2):
+        cache.build(MinVar(assets=assets))
+    assert len(built) == 4
+
+
+def test_hits_take_the_parameters_of_constraints():
+    """A parameter only a constraint of your own holds follows the builder."""
+    cache = ProblemCache()
+    data = {
+        D.CHOLESKY: np.eye(2),
+        D.LOWER_BOUND_ASSETS: np.zeros(2),
+        D.UPPER_BOUND_ASSETS: np.ones(2),
+    }
+
+    weights = []
+    for cap in (1.0, 0.2):
+        builder = MinVar(assets=2, robust=False)
+        builder.constraints["cap"] = builder.weights[0] <= cp.Parameter(name="cap", value=cap)
+        problem = cache.build(builder)
+        problem.update(**data)
+        problem.solve()
+        weights.append(problem.weights)
+
+    assert cache.cache_info().hits == 1
+    np.testing.assert_allclose(weights[0], [0.5, 0.5], atol=1e-4)
+    np.testing.assert_allclose(weights[1], [0.2, 0.8], atol=1e-4)
+
+
+def test_builders_holding_other_parameters_are_built(monkeypatch):
+    """A builder of the same structure but other parameters hits, yet is built every time."""
+    built = []
+    build = MinVar.build
+    monkeypatch.setattr(MinVar, "build", lambda self: built.append(self) or build(self))
+
+    cache = ProblemCache()
+    cache.build(MinVar(assets=2))
+    for _ in range(2):
+        builder = MinVar(assets=2)
+        builder.parameter["unused"] = cp.Parameter(name="unused")
+        cache.build(builder)
+
+    assert len(built) == 3
+    assert cache.cache_info() == CacheInfo(hits=2, misses=1, maxsize=128, currsize=1)
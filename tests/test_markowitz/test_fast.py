@@ -0,0 +1,237 @@
+"""Tests for the direct Clarabel path set up by Problem.compile_fast."""
+
+from __future__ import annotations
+
+import pickle
+
+import cvxpy as cp
+import numpy as np
+import pytest
+from cvx.linalg import cholesky
+from cvxpy.reductions.solvers.conic_solvers.clarabel_conif import CLARABEL
+
+from cvxmarkowitz import CvxSolverError, MaxSharpe, MinVar, SoftRisk
+from cvxmarkowitz.fast import _presolve
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.names import ParameterName as P
+from cvxmarkowitz.risk import FactorModel
+
+
+def _data(correlation: float = 0.5) -> dict[str, np.ndarray]:
+    """Return a complete two-asset payload for any of the builders."""
+    return {
+        D.CHOLESKY: cholesky(np.array([[1.0, correlation], [correlation, 2.0]])),
+        D.LOWER_BOUND_ASSETS: np.zeros(2),
+        D.UPPER_BOUND_ASSETS: np.ones(2),
+        D.MU: np.array([0.25, 0.30]),
+        D.MU_UNCERTAINTY: np.zeros(2),
+        D.VOLA_UNCERTAINTY: np.zeros(2),
+    }
+
+
+def _factor_data() -> dict[str, np.ndarray]:
+    """Return a three-asset, two-factor payload for MinVar."""
+    return {
+        D.EXPOSURE: np.array([[1.0, 0.5, 0.0], [0.0, 0.5, 1.0]]),
+        D.CHOLESKY: cholesky(np.array([[1.0, 0.2], [0.2, 0.5]])),
+        D.IDIOSYNCRATIC_VOLA: np.array([0.1, 0.2, 0.3]),
+        D.SYSTEMATIC_VOLA_UNCERTAINTY: np.zeros(2),
+        D.IDIOSYNCRATIC_VOLA_UNCERTAINTY: np.zeros(3),
+        D.LOWER_BOUND_ASSETS: np.zeros(3),
+        D.UPPER_BOUND_ASSETS: np.ones(3),
+        D.LOWER_BOUND_FACTORS: -np.ones(2),
+        D.UPPER_BOUND_FACTORS: np.ones(2),
+    }
+
+
+def _soft_risk() -> SoftRisk:
+    """Return a SoftRisk builder with its scalar parameters set."""
+    builder = SoftRisk(assets=4)
+    builder.parameter[P.SIGMA_TARGET].value = 0.1
+    builder.parameter[P.SIGMA_MAX].value = 1.0
+    builder.parameter[P.OMEGA].value = 5.0
+    return builder
+
+
+def _max_sharpe() -> MaxSharpe:
+    """Return a MaxSharpe builder with its volatility cap set."""
+    builder = MaxSharpe(assets=4)
+    builder.parameter[P.SIGMA_MAX].value = 1.0
+    return builder
+
+
+@pytest.mark.parametrize(
+    ("make", "data"),
+    [
+        (lambda: MinVar(assets=4), _data),
+        (_max_sharpe, _data),
+        (_soft_risk, _data),
+        (lambda: MinVar(assets=3, factors=2), _factor_data),
+        (
+            lambda: MinVar(
+                assets=3,
+                factors=2,
+                model={M.RISK: FactorModel(assets=3, factors=2, sparsity=_factor_data()[D.EXPOSURE] != 0)},
+            ),
+            _factor_data,
+        ),
+        (lambda: MinVar(assets=4, mask=True), lambda: {**_data(), D.ACTIVE: np.array([True, False])}),
+        (lambda: MinVar(assets=3, factors=2, mask=True), lambda: {**_factor_data(), D.ACTIVE: np.array([1, 0, 1])}),
+    ],
+)
+def test_fast_path_matches_cvxpy(make, data):
+    """The fast path reaches the value and weights the cvxpy path does."""
+    reference = make().build()
+    reference.update(**data())
+    expected = reference.solve()
+
+    problem = make().build()
+    problem.compile_fast()
+    problem.update(**data())
+
+    assert problem.solve() == pytest.approx(expected, abs=1e-6)
+    assert problem.value == pytest.approx(expected, abs=1e-6)
+    np.testing.assert_allclose(problem.weights, reference.weights, atol=1e-5)
+    assert problem.iterations > 0
+
+
+def test_fast_path_follows_updates():
+    """Each solve maps the current parameter values, not those at compile time."""
+    problem = MinVar(assets=2).build()
+    problem.compile_fast()
+
+    for rho, expected in ((0.0, 0.8165), (0.5, 0.9354), (0.9, 0.9958)):
+        problem.update(**_data(rho))
+        assert problem.solve(warm_start=True) == pytest.approx(expected, abs=1e-4)
+
+
+def test_fast_path_warm_start_keeps_the_solver():
+    """A warm fast solve updates the native solver; a cold one replaces it."""
+    problem = MinVar(assets=2).build()
+    problem.compile_fast()
+    problem.update(**_data())
+    problem.solve()
+    fast_path = problem._fast_paths[cp.CLARABEL]
+    native = fast_path._workspace["solver"]
+
+    problem.solve(warm_start=True)
+    assert fast_path._workspace["solver"] is native
+
+    problem.solve()
+    assert fast_path._workspace["solver"] is not native
+
+
+def test_fast_path_infeasible():
+    """An infeasible problem raises CvxSolverError with the cvxpy status."""
+    problem = MinVar(assets=2).build()
+    problem.compile_fast()
+    problem.update(**{**_data(), D.UPPER_BOUND_ASSETS: np.zeros(2)})
+
+    with pytest.raises(CvxSolverError, match=cp.INFEASIBLE):
+        problem.solve()
+
+
+def test_fast_path_iteration_limit():
+    """A solve cut short by its settings raises CvxSolverError."""
+    problem = MinVar(assets=2).build()
+    problem.compile_fast()
+    problem.update(**_data())
+
+    with pytest.raises(CvxSolverError, match=cp.USER_LIMIT):
+        problem.solve(max_iter=1)
+
+
+def test_fast_path_solver_failure(monkeypatch):
+    """A status with neither a solution nor a verdict raises CvxSolverError."""
+    problem = MinVar(assets=2).build()
+    problem.compile_fast()
+    problem.update(**_data())
+    monkeypatch.setitem(CLARABEL.STATUS_MAP, "Solved", cp.SOLVER_ERROR)
+
+    with pytest.raises(CvxSolverError, match=cp.SOLVER_ERROR):
+        problem.solve()
+
+
+def test_fast_path_pickles():
+    """A problem on the fast path pickles after a solve and stays on it."""
+    problem = MinVar(assets=2).build()
+    problem.compile_fast()
+    problem.update(**_data())
+    problem.solve()
+
+    clone = pickle.loads(pickle.dumps(problem))  # noqa: S301  # round-trip of our own object
+    clone.update(**_data(0.9))
+
+    assert clone.solve() == pytest.approx(0.9958, abs=1e-4)
+    assert clone._fast_paths[cp.CLARABEL]._workspace
+
+
+def test_fast_path_presolves_inactive_assets():
+    """Inactive assets leave the solver data and read zero; the others solve as if alone."""
+    alone = MinVar(assets=2).build()
+    alone.update(**_data())
+    expected = alone.solve()
+
+    # the inactive middle asset is correlated with the others, had it been active
+    covariance = np.array([[1.0, 0.3, 0.5], [0.3, 0.5, 0.3], [0.5, 0.3, 2.0]])
+    problem = MinVar(assets=3, mask=True).build()
+    problem.compile_fast()
+    problem.update(
+        **{
+            D.CHOLESKY: cholesky(covariance),
+            D.LOWER_BOUND_ASSETS: np.zeros(3),
+            D.UPPER_BOUND_ASSETS: np.ones(3),
+            D.VOLA_UNCERTAINTY: np.zeros(3),
+            D.ACTIVE: np.array([True, False, True]),
+        }
+    )
+
+    assert problem.solve() == pytest.approx(expected, abs=1e-6)
+    np.testing.assert_allclose(problem.weights, [alone.weights[0], 0.0, alone.weights[1]], atol=1e-4)
+
+    # Clarabel saw fewer columns than the compiled problem has
+    columns, _ = problem._fast_paths[cp.CLARABEL]._workspace["structure"]
+    assert np.frombuffer(columns, dtype=np.intp).size < problem._fast_paths[cp.CLARABEL].program.x.size
+
+
+def test_fast_path_warm_start_follows_the_mask():
+    """A warm solve keeps the native solver for the same mask and replaces it for another."""
+    problem = MinVar(assets=4, mask=True).build()
+    problem.compile_fast()
+    problem.update(**_data(), **{D.ACTIVE: np.array([True, True])})
+    problem.solve()
+    fast_path = problem._fast_paths[cp.CLARABEL]
+    native = fast_path._workspace["solver"]
+
+    problem.update(**_data(0.9))
+    problem.solve(warm_start=True)
+    assert fast_path._workspace["solver"] is native
+
+    problem.update(**{D.ACTIVE: np.array([True, False])})
+    assert problem.solve(warm_start=True) == pytest.approx(1.0, abs=1e-6)
+    assert fast_path._workspace["solver"] is not native
+
+
+def test_fast_path_mask_keeps_infeasible_rows():
+    """An inactive asset with a positive lower bound leaves the problem infeasible."""
+    problem = MinVar(assets=2, mask=True).build()
+    problem.compile_fast()
+    problem.update(**{**_data(), D.LOWER_BOUND_ASSETS: np.array([0.0, 0.1]), D.ACTIVE: np.array([True, False])})
+
+    with pytest.raises(CvxSolverError, match=cp.INFEASIBLE):
+        problem.solve()
+
+
+def test_presolve_keeps_a_cone_proper():
+    """A second-order cone that loses every row but its head keeps one zero row."""
+    problem = MinVar(assets=2, mask=True).build()
+    problem.compile_fast()
+    problem.update(**_data(), **{D.ACTIVE: np.array([True, True])})
+    fast_path = problem._fast_paths[cp.CLARABEL]
+    data, _ = fast_path.solver.apply(fast_path.program)
+
+    _, _, _, dims, _, _ = _presolve(data["c"], data["A"], data["b"], fast_path.dims, fast_path.masked)
+
+    assert fast_path.dims.soc == [4]
+    assert dims.soc == [2]
@@ -0,0 +1,115 @@
+"""Tests for the efficient-frontier sweep."""
+
+import cvxpy as cp
+import numpy as np
+import pytest
+from cvx.linalg import cholesky
+
+from cvxmarkowitz import CvxDataError, MaxSharpe, MinVar
+from cvxmarkowitz.frontier import _sweep_in_worker, frontier
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ParameterName as P
+from cvxmarkowitz.tuning import Tuning, signature, store
+from cvxmarkowitz.utils import processes
+
+ASSETS = 3
+
+
+@pytest.fixture
+def builder() -> MaxSharpe:
+    """Return a three-asset MaxSharpe builder."""
+    return MaxSharpe(assets=ASSETS)
+
+
+@pytest.fixture
+def problem(builder):
+    """Return the builder's problem with its data in place."""
+    covariance = np.array([[0.04, 0.006, 0.0], [0.006, 0.09, 0.012], [0.0, 0.012, 0.16]])
+    problem = builder.build()
+    problem.update(
+        **{
+            D.CHOLESKY: cholesky(covariance),
+            D.VOLA_UNCERTAINTY: np.zeros(ASSETS),
+            D.LOWER_BOUND_ASSETS: np.zeros(ASSETS),
+            D.UPPER_BOUND_ASSETS: np.ones(ASSETS),
+            D.MU: np.array([0.05, 0.08, 0.12]),
+            D.MU_UNCERTAINTY: np.zeros(ASSETS),
+        }
+    )
+    return problem
+
+
+def _loop(builder, problem, limits):
+    """Return the weights and values of solving each limit cold, one by one."""
+    weights, values = [], []
+    for limit in limits:
+        builder.parameter[P.SIGMA_MAX].value = limit
+        values.append(problem.solve())
+        weights.append(problem.weights)
+    return np.array(weights), np.array(values)
+
+
+def test_frontier_matches_a_loop(builder, problem):
+    """The sweep finds what solving each limit on its own finds, in the given order."""
+    limits = [0.3, 0.2, 0.25, 0.35]
+    result = frontier(problem, builder.parameter[P.SIGMA_MAX], limits)
+    weights, values = _loop(builder, problem, limits)
+
+    np.testing.assert_array_equal(result.limits, limits)
+    np.testing.assert_allclose(result.weights, weights, atol=1e-6)
+    np.testing.assert_allclose(result.returns, values, atol=1e-6)
+    assert (result.risks <= result.limits + 1e-6).all()
+    assert result.status == [cp.OPTIMAL] * 4
+
+    # along the sorted grid, more risk buys more return
+    assert (np.diff(result.returns[np.argsort(limits)]) > 0).all()
+
+
+def test_frontier_over_a_process_pool(builder, problem):
+    """Workers sweep contiguous runs of the grid and agree with a serial sweep."""
+    limits = np.linspace(0.2, 0.35, 5)
+    serial = frontier(problem, builder.parameter[P.SIGMA_MAX], limits)
+    pooled = frontier(problem, builder.parameter[P.SIGMA_MAX], limits[::-1], workers=2)
+
+    np.testing.assert_allclose(pooled.weights, serial.weights[::-1], atol=1e-6)
+    np.testing.assert_allclose(pooled.returns, serial.returns[::-1], atol=1e-6)
+
+
+def test_frontier_below_the_least_risk(builder, problem):
+    """A limit no portfolio meets yields its status and NaNs."""
+    result = frontier(problem, builder.parameter[P.SIGMA_MAX], [0.01, 0.3])
+
+    assert result.status == [cp.INFEASIBLE, cp.OPTIMAL]
+    assert np.isnan(result.weights[0]).all()
+    assert np.isnan([result.returns[0], result.risks[0]]).all()
+
+
+def test_frontier_of_nothing(builder, problem):
+    """An empty grid gives an empty frontier."""
+    result = frontier(problem, builder.parameter[P.SIGMA_MAX], [])
+    assert result.weights.shape == (0, ASSETS)
+    assert result.status == []
+
+
+def test_frontier_rejects_what_it_cannot_sweep(builder, problem):
+    """A problem without expected returns, or a foreign parameter, is refused."""
+    with pytest.raises(CvxDataError, match="expected returns"):
+        frontier(MinVar(assets=ASSETS).build(), builder.parameter[P.SIGMA_MAX], [0.1])
+    with pytest.raises(CvxDataError, match="not a parameter"):
+        frontier(problem, cp.Parameter(name="elsewhere"), [0.1])
+
+
+def test_frontier_defaults_to_the_tuned_solver(builder, problem):
+    """Without a solver the sweep solves with the one tuned for the problem."""
+    store(Tuning(signature=signature(problem.problem), solver=cp.SCIPY, trials=[]))
+
+    # SciPy solves linear programs only, so it fails where Clarabel would not
+    with pytest.raises(cp.error.SolverError):
+        frontier(problem, builder.parameter[P.SIGMA_MAX], [0.3])
+
+
+def test_worker_entry_point(builder, problem):
+    """The pool's task sweeps the installed problem, here in-process."""
+    processes.install(problem)
+    (point,) = _sweep_in_worker(builder.parameter[P.SIGMA_MAX].id, [0.3], solver=cp.CLARABEL, kwargs={})
+    assert point[3] == cp.OPTIMAL
@@ -0,0 +1,53 @@
+"""Unit tests for the ActiveSet model."""
+
+from __future__ import annotations
+
+import cvxpy as cp
+import numpy as np
+import pytest
+
+from cvxmarkowitz import CvxDataError, MinVar
+from cvxmarkowitz.models.active import ActiveSet
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+
+
+def test_active_pads_with_inactive_assets():
+    """A short mask leaves the padded assets inactive."""
+    model = ActiveSet(assets=4)
+    np.testing.assert_array_equal(model.data[D.ACTIVE].value, np.ones(4))
+
+    model.update(active=np.array([True, False]))
+    np.testing.assert_array_equal(model.data[D.ACTIVE].value, [1.0, 0.0, 0.0, 0.0])
+
+
+def test_active_rejects_fractions():
+    """Entries other than 0 and 1 raise CvxDataError."""
+    with pytest.raises(CvxDataError):
+        ActiveSet(assets=2).update(active=np.array([1.0, 0.5]))
+
+
+def test_active_estimate():
+    """The mask has no objective term."""
+    with pytest.raises(NotImplementedError):
+        ActiveSet(assets=2).estimate({D.WEIGHTS: cp.Variable(2)})
+
+
+def test_active_pins_inactive_weights(solver):
+    """On the cvxpy path too, an inactive asset is held at zero."""
+    builder = MinVar(assets=3, mask=True)
+    assert isinstance(builder.model[M.ACTIVE], ActiveSet)
+
+    problem = builder.build()
+    problem.update(
+        **{
+            D.CHOLESKY: np.eye(3),
+            D.LOWER_BOUND_ASSETS: np.zeros(3),
+            D.UPPER_BOUND_ASSETS: np.ones(3),
+            D.VOLA_UNCERTAINTY: np.zeros(3),
+            D.ACTIVE: np.array([1, 0, 1]),
+        }
+    )
+    problem.solve(solver=solver)
+
+    np.testing.assert_allclose(problem.weights, [0.5, 0.0, 0.5], atol=1e-5)
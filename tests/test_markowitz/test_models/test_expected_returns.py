@@ -77,3 +77,16 @@ def test_keywords_declares_the_parameter_backed_input():
     assert set(model.keywords) == {D.MU, D.MU_UNCERTAINTY}
     assert D.MU_UNCERTAINTY not in model.data
     assert D.MU_UNCERTAINTY in model.parameter
+
+
+def test_expected_returns_without_robust_terms():
+    """With robust=False the estimate is w^T mu and update takes mu alone."""
+    model = ExpectedReturns(assets=3, robust=False)
+    model.update(mu=np.array([0.1, 0.2]))
+
+    assert model.keywords == (D.MU,)
+    assert D.MU_UNCERTAINTY not in model.parameter
+
+    weights = cp.Variable(3)
+    weights.value = np.array([1.0, -1.0, 2.0])
+    assert model.estimate({D.WEIGHTS: weights}).value == pytest.approx(-0.1)
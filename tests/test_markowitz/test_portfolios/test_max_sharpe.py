@@ -80,3 +80,25 @@ def test_max_sharpe(solver, problem):
         np.array([5.5556e-01, 4.444e-01, 0.0, 0.0]),
         decimal=4,
     )
+
+
+def test_max_sharpe_without_robust_terms(solver):
+    """robust=False drops |w| and the uncertainties but keeps the solution."""
+    builder = MaxSharpe(assets=4, robust=False)
+    builder.parameter["sigma_max"].value = 1.0
+    problem = builder.build()
+
+    assert problem.variables.keys() == {D.WEIGHTS}
+    assert D.VOLA_UNCERTAINTY not in problem.parameter
+
+    problem.update(
+        **{
+            D.CHOLESKY: cholesky(np.array([[1.0, 0.6], [0.6, 2.0]])),
+            D.LOWER_BOUND_ASSETS: np.zeros(2),
+            D.UPPER_BOUND_ASSETS: np.ones(2),
+            D.MU: np.array([0.25, 0.30]),
+        }
+    )
+    problem.solve(solver=solver)
+
+    np.testing.assert_almost_equal(problem.weights, np.array([5.5556e-01, 4.444e-01, 0.0, 0.0]), decimal=4)
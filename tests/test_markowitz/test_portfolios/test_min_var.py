@@ -15,6 +15,7 @@ from cvxmarkowitz.names import ConstraintName as C
 from cvxmarkowitz.names import DataNames as D
 from cvxmarkowitz.names import ModelName as M
 from cvxmarkowitz.portfolios.min_var import MinVar
+from cvxmarkowitz.risk import SampleCovariance
 
 
 @pytest.fixture
@@ -101,6 +102,30 @@ def test_min_var(solver):
     assert objective == pytest.approx(0.9354143, abs=1e-5)
 
 
+def test_min_var_thin_factor(solver):
+    """A returns-based thin factor solves to the Cholesky-based portfolio.
+
+    Args:
+        solver: Pytest solver fixture to pass to cvxpy.
+    """
+    returns = np.random.default_rng(0).normal(scale=0.01, size=(3, 6))
+    data = {
+        D.LOWER_BOUND_ASSETS: np.zeros(6),
+        D.UPPER_BOUND_ASSETS: np.ones(6),
+        D.VOLA_UNCERTAINTY: np.full(6, 1e-3),
+    }
+
+    square = MinVar(assets=6).build()
+    square.update(**data, **{D.CHOLESKY: cholesky(np.cov(returns, rowvar=False) + 1e-6 * np.eye(6))})
+
+    thin = MinVar(assets=6, model={M.RISK: SampleCovariance(assets=6, rows=9)}).build()
+    factor = SampleCovariance.returns_factor(returns)
+    thin.update(**data, **{D.CHOLESKY: np.vstack([factor, 1e-3 * np.eye(6)])})
+
+    assert thin.solve(solver=solver) == pytest.approx(square.solve(solver=solver), abs=1e-6)
+    np.testing.assert_allclose(thin.weights, square.weights, atol=1e-4)
+
+
 def test_min_var_robust(solver):
     """Solve a robust MinVar instance with uncertainty and compare results.
 
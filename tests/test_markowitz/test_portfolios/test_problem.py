@@ -1,14 +1,23 @@
 """Tests for the built Problem container."""
 
+import asyncio
 import dataclasses
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 
 import cvxpy as cp
 import numpy as np
 import pytest
 from cvx.linalg import cholesky
 
-from cvxmarkowitz import CvxDataError, MaxSharpe, MinVar
+from cvxmarkowitz import CvxDataError, CvxSolverError, MaxSharpe, MinVar, Problem, SoftRisk
+from cvxmarkowitz.models.expected_returns import ExpectedReturns
 from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.names import ParameterName as P
+from cvxmarkowitz.problem import _solve_in_worker
+from cvxmarkowitz.utils import processes
+from cvxmarkowitz.utils.serialize import dump
 
 
 def _data(correlation: float) -> dict[str, np.ndarray]:
@@ -21,23 +30,6 @@ def _data(correlation: float) -> dict[str, np.ndarray]:
     }
 
 
-def _max_sharpe_data() -> dict[str, np.ndarray]:
-    """Return a complete data payload for a two-asset MaxSharpe problem.
-
-    MaxSharpe is the case that matters here because it carries an
-    `ExpectedReturns` model, the only one with a keyword held in `parameter`
-    rather than `data`.
-    """
-    return {
-        D.CHOLESKY: cholesky(np.array([[1.0, 0.5], [0.5, 2.0]])),
-        D.LOWER_BOUND_ASSETS: np.zeros(2),
-        D.UPPER_BOUND_ASSETS: np.ones(2),
-        D.MU: np.array([0.25, 0.30]),
-        D.MU_UNCERTAINTY: np.zeros(2),
-        D.VOLA_UNCERTAINTY: np.zeros(2),
-    }
-
-
 def test_problem_data():
     """get_problem_data returns the compiled data, chain and inverse data."""
     problem = MinVar(assets=10).build()
@@ -86,6 +78,143 @@ def test_update_overwrites_in_place():
     assert other.solve() == pytest.approx(first)
 
 
+def test_update_skips_models_whose_data_did_not_change(max_sharpe_data):
+    """Repeating the arrays writes nothing; a fresh array writes only its model."""
+    builder = MaxSharpe(assets=2)
+    builder.parameter[P.SIGMA_MAX].value = 1.0
+    problem = builder.build()
+    data = max_sharpe_data()
+    problem.update(**data)
+    problem.solve()
+    assert problem.stats.parameters_written == 6
+
+    problem.update(**data)
+    problem.solve()
+    assert problem.stats.parameters_written == 0
+
+    # equal data in fresh arrays is not compared, but written
+    problem.update(**max_sharpe_data())
+    problem.solve()
+    assert problem.stats.parameters_written == 6
+
+    # only mu, in a fresh array
+    mu = np.array([0.5, 0.30])
+    problem.update(mu=mu)
+    value = problem.solve()
+    assert problem.stats.parameters_written == 2
+
+    builder = MaxSharpe(assets=2)
+    builder.parameter[P.SIGMA_MAX].value = 1.0
+    expected = builder.build()
+    expected.update(**{**max_sharpe_data(), D.MU: mu})
+    assert value == pytest.approx(expected.solve())
+
+
+def test_update_with_fingerprints_compares_contents(max_sharpe_data):
+    """With fingerprints, equal data in fresh arrays writes nothing."""
+    problem = dataclasses.replace(_max_sharpe(), fingerprints=True)
+    problem.update(**max_sharpe_data())
+    problem.update(**max_sharpe_data())
+    problem.solve()
+    assert problem.stats.parameters_written == 6
+
+    problem.update(**max_sharpe_data())
+    problem.solve()
+    assert problem.stats.parameters_written == 0
+
+    # other contents, then the same contents of another type
+    problem.update(mu=np.array([0.5, 0.30]))
+    problem.solve()
+    assert problem.stats.parameters_written == 2
+    problem.update(mu=np.array([0.5, 0.30], dtype=np.float32))
+    problem.solve()
+    assert problem.stats.parameters_written == 2
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_failed_update_then_the_good_data_again(validate, max_sharpe_data):
+    """Models written before an update failed are written again with the good data."""
+    problem = _max_sharpe()
+    problem.update(**max_sharpe_data())
+    expected = problem.solve()
+
+    # the risk model takes the new factor before the return model or the
+    # unchecked fill rejects the lengths of the uncertainties
+    rejected = {**max_sharpe_data(), D.CHOLESKY: 5 * np.eye(2), D.MU_UNCERTAINTY: np.zeros(1 if validate else 3)}
+    with pytest.raises((CvxDataError, ValueError)):
+        problem.update(validate=validate, **rejected)
+
+    # forgotten: a partial update does not fall back on it
+    with pytest.raises(CvxDataError, match="Missing data for"):
+        problem.update(mu=max_sharpe_data()[D.MU])
+
+    problem.update(**max_sharpe_data())
+    assert problem.solve() == pytest.approx(expected)
+    np.testing.assert_allclose(problem.model[M.RISK].data[D.CHOLESKY].value, max_sharpe_data()[D.CHOLESKY])
+
+
+def test_partial_update_needs_earlier_data():
+    """A keyword no update has supplied yet is still missing."""
+    problem = MaxSharpe(assets=2).build()
+    with pytest.raises(CvxDataError, match="Missing data for"):
+        problem.update(mu=np.zeros(2))
+
+
+def _max_sharpe() -> Problem:
+    """Return a two-asset MaxSharpe problem with its risk bound set."""
+    builder = MaxSharpe(assets=2)
+    builder.parameter[P.SIGMA_MAX].value = 1.0
+    return builder.build()
+
+
+def test_unvalidated_update_matches_a_validated_one(max_sharpe_data):
+    """The plan writes what the models would, to the same solution."""
+    validated = _max_sharpe()
+    validated.update(**max_sharpe_data())
+    expected = validated.solve()
+
+    problem = _max_sharpe()
+    problem.update(validate=False, **max_sharpe_data(), unknown=np.zeros(2))
+    assert problem.solve() == pytest.approx(expected)
+    assert problem.stats.parameters_written == 6
+
+    # only the parameter of mu, and no check that the rest was ever given
+    problem.update(validate=False, mu=np.array([0.30, 0.25]))
+    problem.solve()
+    assert problem.stats.parameters_written == 1
+    _max_sharpe().update(validate=False, mu=np.zeros(2))
+
+
+def test_validated_update_after_an_unvalidated_one(max_sharpe_data):
+    """Data written unchecked counts as changed for the next validated update."""
+    problem = _max_sharpe()
+    data = max_sharpe_data()
+    problem.update(validate=False, **data)
+    problem.solve()
+    problem.update(**data)
+    problem.solve()
+    assert problem.stats.parameters_written == 6
+
+    problem.update(**data)
+    problem.solve()
+    assert problem.stats.parameters_written == 0
+
+
+def test_unvalidated_update_of_a_model_without_targets(monkeypatch, max_sharpe_data):
+    """A model without targets is updated as before, with the earlier data filled in."""
+    monkeypatch.setattr(ExpectedReturns, "targets", lambda self: None)
+    problem = _max_sharpe()
+    problem.update(validate=False, **max_sharpe_data())
+    problem.solve()
+    problem.update(validate=False, mu=np.array([0.30, 0.25]))
+    value = problem.solve()
+    assert problem.stats.parameters_written == 2
+
+    expected = _max_sharpe()
+    expected.update(**{**max_sharpe_data(), D.MU: np.array([0.30, 0.25])})
+    assert value == pytest.approx(expected.solve())
+
+
 def test_factor_weights_without_factors():
     """Asking a non-factor problem for factor weights raises CvxDataError."""
     problem = MinVar(assets=2).build()
@@ -93,7 +222,7 @@ def test_factor_weights_without_factors():
         _ = problem.factor_weights
 
 
-def test_missing_parameter_backed_keyword_raises_cvx_data_error():
+def test_missing_parameter_backed_keyword_raises_cvx_data_error(max_sharpe_data):
     """Omitting `mu_uncertainty` raises CvxDataError, not a bare KeyError.
 
     `ExpectedReturns` keeps `mu_uncertainty` in `model.parameter` rather than
@@ -103,14 +232,14 @@ def test_missing_parameter_backed_keyword_raises_cvx_data_error():
     README promises `except CvxError` catches in full.
     """
     problem = MaxSharpe(assets=2).build()
-    payload = _max_sharpe_data()
+    payload = max_sharpe_data()
     del payload[D.MU_UNCERTAINTY]
 
     with pytest.raises(CvxDataError, match=D.MU_UNCERTAINTY):
         problem.update(**payload)
 
 
-def test_dropping_any_required_keyword_raises_cvx_data_error():
+def test_dropping_any_required_keyword_raises_cvx_data_error(max_sharpe_data):
     """Every keyword a model declares is guarded, not just the ones in `data`.
 
     The general form of the test above. It walks `Model.keywords` instead of
@@ -122,10 +251,444 @@ def test_dropping_any_required_keyword_raises_cvx_data_error():
 
     # the parameter-backed keyword must be among them; that is the whole point
     assert D.MU_UNCERTAINTY in required
-    assert required == set(_max_sharpe_data())
+    assert required == set(max_sharpe_data())
 
     for omitted in sorted(required):
-        payload = _max_sharpe_data()
+        payload = max_sharpe_data()
         del payload[omitted]
         with pytest.raises(CvxDataError, match="Missing data for"):
             problem.update(**payload)
+
+
+def test_solve_many_matches_a_serial_loop():
+    """solve_many yields, in input order, what update-then-solve would produce."""
+    correlations = (0.0, 0.5, 0.9)
+    results = list(MinVar(assets=2).build().solve_many(_data(rho) for rho in correlations))
+
+    for rho, result in zip(correlations, results, strict=True):
+        problem = MinVar(assets=2).build()
+        problem.update(**_data(rho))
+        assert result.value == pytest.approx(problem.solve())
+        np.testing.assert_allclose(result.weights, problem.weights, atol=1e-4)
+        assert result.status == cp.OPTIMAL
+
+
+def test_solve_many_serial_leaves_the_last_data_set():
+    """With one worker the batch runs against this problem, in place."""
+    problem = MinVar(assets=2).build()
+    *_, last = problem.solve_many([_data(0.0), _data(0.9)])
+
+    assert problem.value == pytest.approx(last.value)
+    assert last.value == pytest.approx(0.9958, abs=1e-4)
+
+
+def test_solve_many_over_a_process_pool():
+    """A pool returns the serial results in input order and leaves the problem alone."""
+    problem = MinVar(assets=2).build()
+    problem.solve_many([_data(0.0)]).__next__()  # compile (and solve) before fanning out
+
+    correlations = (0.9, 0.0, 0.5, 0.2)
+    pooled = list(problem.solve_many((_data(rho) for rho in correlations), workers=2))
+    serial = list(MinVar(assets=2).build().solve_many(_data(rho) for rho in correlations))
+
+    assert [r.value for r in pooled] == pytest.approx([r.value for r in serial])
+    # the pool solved copies; this problem still holds the first data set
+    assert problem.value == pytest.approx(0.8165, abs=1e-4)
+
+
+def test_solve_many_reports_a_non_optimal_status():
+    """An infeasible data set yields its status and NaNs instead of stopping the batch."""
+    infeasible = {**_data(0.5), D.UPPER_BOUND_ASSETS: np.zeros(2)}
+    results = list(MinVar(assets=2).build().solve_many([infeasible, _data(0.5)]))
+
+    assert results[0].status == cp.INFEASIBLE
+    assert np.isnan(results[0].value)
+    assert np.isnan(results[0].weights).all()
+    assert results[1].status == cp.OPTIMAL
+    assert results[0].stats.status == cp.INFEASIBLE
+    assert results[1].stats.status == cp.OPTIMAL
+
+
+def test_solve_accounts_matches_each_account(max_sharpe_data):
+    """The stacked accounts reach what each reaches alone, one row of weights each."""
+    problem = MaxSharpe(assets=2)
+    problem.parameter[P.SIGMA_MAX].value = 1.0
+    problem = problem.build()
+    problem.update(**max_sharpe_data())
+
+    caps = (0.55, 0.7, 1.0)
+    result = problem.solve_accounts({D.UPPER_BOUND_ASSETS: np.full(2, cap)} for cap in caps)
+    assert result.weights.shape == (3, 2)
+
+    for cap, weights, value in zip(caps, result.weights, result.values, strict=True):
+        alone = MaxSharpe(assets=2)
+        alone.parameter[P.SIGMA_MAX].value = 1.0
+        alone = alone.build()
+        alone.update(**{**max_sharpe_data(), D.UPPER_BOUND_ASSETS: np.full(2, cap)})
+        assert value == pytest.approx(alone.solve(), abs=1e-6)
+        np.testing.assert_allclose(weights, alone.weights, atol=1e-4)
+
+
+def test_solve_accounts_with_their_own_universe():
+    """Under a mask every account drops its inactive assets; the rest solve as usual."""
+    problem = MinVar(assets=3, mask=True).build()
+    problem.update(
+        **{
+            D.CHOLESKY: np.eye(3),
+            D.LOWER_BOUND_ASSETS: np.zeros(3),
+            D.UPPER_BOUND_ASSETS: np.ones(3),
+            D.VOLA_UNCERTAINTY: np.zeros(3),
+            D.ACTIVE: np.ones(3),
+        }
+    )
+
+    result = problem.solve_accounts([{D.ACTIVE: np.array([1, 1, 0])}, {D.ACTIVE: np.array([1, 1, 1])}])
+
+    np.testing.assert_allclose(result.weights, [[0.5, 0.5, 0.0], [1 / 3, 1 / 3, 1 / 3]], atol=1e-5)
+    assert result.values == pytest.approx([np.sqrt(0.5), np.sqrt(1 / 3)], abs=1e-6)
+
+
+def test_solve_accounts_reports_a_non_optimal_status():
+    """An infeasible account yields its status and NaNs; the others are solved."""
+    problem = MinVar(assets=2).build()
+    problem.update(**_data(0.5))
+
+    result = problem.solve_accounts([{D.UPPER_BOUND_ASSETS: np.zeros(2)}, {D.UPPER_BOUND_ASSETS: np.ones(2)}])
+
+    assert result.status == [cp.INFEASIBLE, cp.OPTIMAL]
+    assert np.isnan(result.weights[0]).all()
+    assert np.isnan(result.values[0])
+    assert result.values[1] == pytest.approx(0.9354, abs=1e-4)
+
+
+def test_worker_entry_points():
+    """The pool's initializer and task run the installed problem, here in-process."""
+    problem = MinVar(assets=2).build()
+    processes.install(problem)
+    result = _solve_in_worker(_data(0.9), solver=cp.CLARABEL, kwargs={})
+
+    assert result.value == pytest.approx(0.9958, abs=1e-4)
+
+
+def test_solved_problem_pickles_with_its_compilation():
+    """A solved problem pickles, compiled, even though the solver workspace does not."""
+    problem = MinVar(assets=2).build()
+    problem.update(**_data(0.5))
+    problem.solve()
+
+    clone = pickle.loads(pickle.dumps(problem))  # noqa: S301  # round-trip of our own object
+
+    assert clone.problem._cache.param_prog is not None
+    assert problem.problem._solver_cache  # the original keeps its workspace
+    clone.update(**_data(0.9))
+    assert clone.solve() == pytest.approx(0.9958, abs=1e-4)
+
+
+@pytest.mark.parametrize("builder", [MinVar, MaxSharpe, SoftRisk])
+@pytest.mark.parametrize("factors", [None, 2])
+def test_every_builder_pickles(builder, factors):
+    """Every builder, and every problem it builds, survives a pickle round trip."""
+    built = builder(assets=3, factors=factors)
+    for name in (P.SIGMA_TARGET, P.OMEGA):
+        if name in built.parameter:
+            built.parameter[name].value = 1.0
+    problem = built.build()
+    problem.get_problem_data(cp.CLARABEL)
+
+    assert pickle.loads(pickle.dumps(built)).assets == 3  # noqa: S301  # round-trip of our own object
+    clone = pickle.loads(pickle.dumps(problem))  # noqa: S301
+    assert clone.problem._cache.param_prog is not None
+    assert str(clone.problem.objective) == str(problem.problem.objective)
+
+
+def test_soft_risk_solves_in_workers_without_compiling(max_sharpe_data):
+    """A compiled SoftRisk problem ships to a process pool and solves there as is."""
+    builder = SoftRisk(assets=2)
+    builder.parameter[P.SIGMA_TARGET].value = 0.1
+    builder.parameter[P.SIGMA_MAX].value = 1.0
+    builder.parameter[P.OMEGA].value = 5.0
+    problem = builder.build()
+    problem.update(**max_sharpe_data())
+    problem.solve()
+
+    mus = (np.array([0.25, 0.30]), np.array([0.30, 0.25]))
+    pooled = list(problem.solve_many(({D.MU: mu} for mu in mus), workers=2))
+    serial = list(problem.solve_many({D.MU: mu} for mu in mus))
+
+    assert [r.status for r in pooled] == [cp.OPTIMAL, cp.OPTIMAL]
+    assert not any(r.stats.compiled for r in pooled)
+    assert [r.value for r in pooled] == pytest.approx([r.value for r in serial], abs=1e-6)
+
+
+def test_clone_is_independent():
+    """A clone updates and solves apart from its original, without compiling."""
+    problem = MinVar(assets=2).build()
+    problem.update(**_data(0.5))
+    problem.solve()
+
+    clone = problem.clone()
+    clone.update(**_data(0.9))
+    clone.solve()
+
+    assert not clone.stats.compiled
+    assert clone.value == pytest.approx(0.9958, abs=1e-4)
+    assert problem.solve() == pytest.approx(0.9354, abs=1e-4)
+    assert clone.parameter["chol"] is not problem.parameter["chol"]
+
+
+def test_clone_shares_the_compiled_map():
+    """The map from parameters to solver data is the original's, not a copy."""
+    problem = MinVar(assets=2).build()
+    problem.get_problem_data(cp.CLARABEL)
+
+    clone = problem.clone()
+
+    program = problem.problem._cache.param_prog
+    assert clone.problem._cache.param_prog is not program
+    assert clone.problem._cache.param_prog.reduced_A is program.reduced_A
+    assert clone.problem._cache.param_prog.q is program.q
+
+
+def test_clone_stays_on_the_fast_path():
+    """A clone of a problem on the fast path solves on it, with its own mask."""
+    problem = MinVar(assets=3, mask=True).build()
+    problem.update(
+        **{
+            D.CHOLESKY: np.eye(3),
+            D.LOWER_BOUND_ASSETS: np.zeros(3),
+            D.UPPER_BOUND_ASSETS: np.ones(3),
+            D.VOLA_UNCERTAINTY: np.zeros(3),
+            D.ACTIVE: np.ones(3),
+        }
+    )
+    problem.compile_fast()
+
+    clone = problem.clone()
+    clone.update(**{D.ACTIVE: np.array([1, 1, 0])})
+    clone.solve()
+
+    assert clone._fast_paths[cp.CLARABEL].mask is clone.model["active"].data[D.ACTIVE]
+    np.testing.assert_allclose(clone.weights, [0.5, 0.5, 0.0], atol=1e-5)
+    assert problem.solve() == pytest.approx(np.sqrt(1 / 3), abs=1e-6)
+
+
+def test_clones_solve_on_threads():
+    """One clone per thread solves its own data, as serial solves would."""
+    problem = MinVar(assets=2).build()
+    problem.update(**_data(0.0))
+    problem.solve()
+
+    correlations = (0.9, 0.0, 0.5, 0.2)
+
+    def solve(correlation: float) -> float:
+        clone = problem.clone()
+        clone.update(**_data(correlation))
+        return clone.solve()
+
+    with ThreadPoolExecutor(4) as pool:
+        values = list(pool.map(solve, correlations))
+
+    serial = [r.value for r in MinVar(assets=2).build().solve_many(_data(rho) for rho in correlations)]
+    assert values == pytest.approx(serial, abs=1e-6)
+
+
+def test_iterations_before_any_solve():
+    """Without a solve there are no iterations, and none saved."""
+    problem = MinVar(assets=2).build()
+    assert problem.iterations == 0
+    assert problem.iterations_saved == 0
+
+
+def test_warm_start_matches_a_cold_solve():
+    """A warm start changes how the solver gets there, not where it ends up."""
+    problem = MinVar(assets=2).build()
+    problem.update(**_data(0.5))
+    cold = problem.solve()
+    baseline = problem.iterations
+
+    assert baseline > 0
+    assert problem.iterations_saved == 0
+
+    problem.update(**_data(0.6))
+    warm = problem.solve(warm_start=True)
+
+    fresh = MinVar(assets=2).build()
+    fresh.update(**_data(0.6))
+    assert warm == pytest.approx(fresh.solve(), abs=1e-6)
+    assert warm != pytest.approx(cold)
+    assert problem.iterations_saved == baseline - problem.iterations
+
+
+def test_warm_start_keeps_the_solver_workspace():
+    """Clarabel reuses its workspace on a warm solve and gets a fresh one on a cold solve."""
+    problem = MinVar(assets=2).build()
+    problem.update(**_data(0.5))
+    problem.solve()
+    workspace = problem.problem._solver_cache[cp.CLARABEL]
+
+    problem.solve(warm_start=True)
+    assert problem.problem._solver_cache[cp.CLARABEL] is workspace
+
+    problem.solve()
+    assert problem.problem._solver_cache[cp.CLARABEL] is not workspace
+
+
+def test_asolve_matches_solve():
+    """Awaiting asolve updates and solves as update followed by solve does."""
+    expected = MinVar(assets=2).build()
+    expected.update(**_data(0.9))
+    expected.solve()
+
+    result = asyncio.run(MinVar(assets=2).build().asolve(**_data(0.9)))
+
+    np.testing.assert_allclose(result.weights, expected.weights, atol=1e-6)
+    assert result.value == pytest.approx(expected.value)
+    assert result.stats.status == cp.OPTIMAL
+
+
+def test_asolve_serializes_calls_on_one_problem():
+    """Concurrent calls on one problem each get the solution of their own data."""
+    correlations = [-0.9, 0.0, 0.5, 0.9] * 3
+    expected = [next(MinVar(assets=2).build().solve_many([_data(c)])).weights for c in correlations]
+
+    problem = MinVar(assets=2).build()
+    other = MinVar(assets=2).build()
+
+    async def run():
+        with ThreadPoolExecutor(4) as executor:
+            return await asyncio.gather(
+                *(problem.asolve(executor=executor, **_data(c)) for c in correlations),
+                other.asolve(executor=executor, **_data(0.5)),
+            )
+
+    *results, _ = asyncio.run(run())
+    for result, weights in zip(results, expected, strict=True):
+        np.testing.assert_allclose(result.weights, weights, atol=1e-6)
+
+
+def test_asolve_cancelled_holds_the_lock_until_the_solve_ends():
+    """A cancelled call still finishes its solve before the next call starts."""
+    problem = MinVar(assets=2).build()
+
+    async def run():
+        first = asyncio.create_task(problem.asolve(**_data(-0.9)))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await problem.asolve(**_data(0.9))
+
+    result = asyncio.run(run())
+    assert result.status == cp.OPTIMAL
+    assert not any(lock.locked() for lock in problem._locks.values())
+    assert pickle.loads(pickle.dumps(problem))._locks == {}  # noqa: S301
+
+
+def test_asolve_releases_the_lock_if_the_executor_refuses():
+    """A call the executor rejects leaves the problem free for the next one."""
+    problem = MinVar(assets=2).build()
+    executor = ThreadPoolExecutor(1)
+    executor.shutdown()
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await problem.asolve(executor=executor, **_data(0.9))
+        return await problem.asolve(**_data(0.9))
+
+    assert asyncio.run(run()).status == cp.OPTIMAL
+
+
+def test_asolve_in_successive_event_loops():
+    """Each event loop gets a lock of its own, and those of closed loops go."""
+    problem = MinVar(assets=2).build()
+
+    async def run():
+        # two calls at once, so that the lock waits, and binds to the loop
+        return await asyncio.gather(problem.asolve(**_data(0.5)), problem.asolve(**_data(0.9)))
+
+    for _ in range(2):
+        assert [result.status for result in asyncio.run(run())] == [cp.OPTIMAL] * 2
+    assert len(problem._locks) == 1
+
+
+def test_stats_split_the_solve_into_phases():
+    """Each solve records its phases; only the first one compiles."""
+    problem = MinVar(assets=2).build()
+    assert problem.stats is None
+
+    problem.update(**_data(0.5))
+    problem.solve()
+    stats = problem.stats
+    assert stats.compiled
+    assert stats.solver == cp.CLARABEL
+    assert stats.status == cp.OPTIMAL
+    assert stats.iterations == problem.iterations
+    assert stats.update_time > 0
+    assert min(stats.setup_time, stats.solve_time, stats.unpack_time) >= 0
+    assert stats.total_time == pytest.approx(
+        stats.update_time + stats.setup_time + stats.solve_time + stats.unpack_time
+    )
+    assert stats.primal_residual < 1e-6
+    assert stats.dual_residual < 1e-6
+
+    problem.solve()
+    assert not problem.stats.compiled
+    assert problem.stats.update_time == 0
+
+
+def test_stats_on_the_fast_path():
+    """The fast path reports the same phases and the solver's residuals."""
+    problem = MinVar(assets=2).build()
+    problem.compile_fast()
+    problem.update(**_data(0.5))
+    problem.solve()
+
+    assert not problem.stats.compiled
+    assert problem.stats.solve_time > 0
+    assert problem.stats.primal_residual is not None
+
+
+def test_stats_are_kept_when_the_solve_fails():
+    """A solve that does not end optimal still records its statistics."""
+    problem = MinVar(assets=2).build()
+    problem.update(**{**_data(0.5), D.UPPER_BOUND_ASSETS: np.zeros(2)})
+    with pytest.raises(CvxSolverError):
+        problem.solve()
+
+    assert problem.stats.status == cp.INFEASIBLE
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_save_and_load_skip_compilation(tmp_path, monkeypatch, mmap):
+    """A loaded problem solves from the saved canonicalization, never compiling."""
+    problem = MinVar(assets=2).build()
+    problem.save(tmp_path / "min_var.bin")
+
+    loaded = Problem.load(tmp_path / "min_var.bin", mmap=mmap)
+
+    # running the reduction chain is what compiling means; forbid it
+    def compile_again(*args, **kwargs):
+        pytest.fail("the loaded problem was compiled again")
+
+    monkeypatch.setattr(type(loaded.problem._cache.solving_chain), "apply", compile_again)
+
+    for rho, expected in ((0.0, 0.8165), (0.9, 0.9958)):
+        loaded.update(**_data(rho))
+        assert loaded.solve() == pytest.approx(expected, abs=1e-4)
+
+
+def test_save_keeps_parameter_values(tmp_path):
+    """The data the problem held when saved is still there after loading."""
+    problem = MinVar(assets=2).build()
+    problem.update(**_data(0.5))
+    problem.save(tmp_path / "min_var.bin")
+
+    assert Problem.load(tmp_path / "min_var.bin").solve() == pytest.approx(0.9354, abs=1e-4)
+
+
+def test_load_rejects_other_objects(tmp_path):
+    """A file that does not hold a Problem raises CvxDataError."""
+    dump({"not": "a problem"}, tmp_path / "other.bin")
+
+    with pytest.raises(CvxDataError, match="not a Problem"):
+        Problem.load(tmp_path / "other.bin")
@@ -6,6 +6,8 @@ soft-risk objective/CallbackParam, and a small solve.
 
 from __future__ import annotations
 
+import pickle
+
 import cvxpy as cp
 import numpy as np
 import pytest
@@ -94,3 +96,17 @@ def test_soft_risk_solve(solver, builder):
     weights = problem.weights[:2]
     assert np.all(weights >= -1e-6)
     np.testing.assert_almost_equal(np.sum(weights), 1.0, decimal=4)
+
+
+def test_pickles_with_its_callback(builder):
+    """A built problem pickles; its derived parameter follows the unpickled copy's."""
+    builder.parameter[P.SIGMA_TARGET].value = 0.1
+    builder.parameter[P.OMEGA].value = 5.0
+
+    clone = pickle.loads(pickle.dumps(builder.build()))  # noqa: S301  # round-trip of our own object
+
+    assert clone.parameter["sigma_target_times_omega"].value == pytest.approx(0.5)
+    clone.parameter["risk priority"].value = 2.0
+    assert clone.parameter["sigma_target_times_omega"].value == pytest.approx(0.2)
+    # the builder's own parameters are untouched
+    assert builder.parameter[P.OMEGA].value == 5.0
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
+import pytest
+
 import cvxmarkowitz
 
 
@@ -61,3 +66,49 @@ def test_build_returns_the_exported_problem_type():
     """Builder.build() returns the same Problem class the package exports."""
     problem = cvxmarkowitz.MinVar(assets=3).build()
     assert isinstance(problem, cvxmarkowitz.Problem)
+
+
+def _loaded(statement: str) -> set[str]:
+    """Return the modules a fresh interpreter has loaded after running `statement`."""
+    script = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def test_import_leaves_out_cvxpy():
+    """Importing the package, or its errors, loads neither cvxpy nor a builder."""
+    loaded = _loaded("import cvxmarkowitz\nfrom cvxmarkowitz import CvxError")
+
+    assert "cvxpy" not in loaded
+    assert "cvxmarkowitz.builder" not in loaded
+
+
+def test_one_builder_loads_only_what_it_uses():
+    """Building a MinVar loads neither the other builders nor the unused machinery."""
+    loaded = _loaded("from cvxmarkowitz import MinVar\nMinVar(assets=3).build()")
+
+    assert "cvxmarkowitz.portfolios.min_var" in loaded
+    assert "cvxmarkowitz.risk.sample.sample" in loaded
+    for module in (
+        "asyncio",
+        "multiprocessing",
+        "cvxmarkowitz.fast",
+        "cvxmarkowitz.portfolios.max_sharpe",
+        "cvxmarkowitz.portfolios.soft_risk",
+        "cvxmarkowitz.risk.cvar.cutting",
+        "cvxmarkowitz.risk.factor.factor",
+    ):
+        assert module not in loaded
+
+
+def test_lazy_names_resolve():
+    """A lazy name is the class of its module, listed by dir; an unknown one raises."""
+    from cvxmarkowitz import risk
+    from cvxmarkowitz.portfolios.min_var import MinVar
+    from cvxmarkowitz.risk.cvar.cvar import CVar
+
+    assert cvxmarkowitz.MinVar is MinVar
+    assert risk.CVar is CVar
+    assert {"MinVar", "SoftRisk"} <= set(dir(cvxmarkowitz))
+    with pytest.raises(AttributeError, match="no attribute 'Nope'"):
+        _ = cvxmarkowitz.Nope
@@ -0,0 +1,168 @@
+"""Tests for the CVaR solved on an active set of scenarios held outside the problem."""
+
+from __future__ import annotations
+
+import cvxpy as cp
+import numpy as np
+import pytest
+
+from cvxmarkowitz import CvxDataError, CvxSolverError, MinVar
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.risk import CuttingPlaneCVar, CVar
+from cvxmarkowitz.risk.cvar import solve_cutting_plane
+from cvxmarkowitz.risk.cvar.cutting import losses
+from cvxmarkowitz.tuning import Tuning, signature, store
+
+BOUNDS = {D.LOWER_BOUND_ASSETS: np.zeros(6), D.UPPER_BOUND_ASSETS: np.ones(6)}
+
+
+@pytest.fixture
+def scenarios():
+    """Return 2,000 seeded scenarios of 6 assets of unequal volatility.
+
+    Equal weights, where the solve starts, have a tail of their own, far
+    from that of the solution, so the active set has to grow.
+    """
+    return np.random.default_rng(0).normal(scale=0.01, size=(2000, 6)) * np.array([1.0, 2.0, 4.0, 8.0, 0.5, 3.0])
+
+
+def expected(scenarios, alpha=0.95):
+    """Return the CVar MinVar solution on the same scenarios."""
+    problem = MinVar(assets=6, model={M.RISK: CVar(assets=6, rows=scenarios.shape[0], alpha=alpha)}).build()
+    problem.update(**BOUNDS, **{D.RETURNS: scenarios})
+    return problem.solve(), problem.weights
+
+
+def cutting_plane(assets=6, **kwargs):
+    """Return a MinVar problem with an active-set CVaR, its bounds in place."""
+    problem = MinVar(assets=assets, model={M.RISK: CuttingPlaneCVar(assets=assets, **kwargs)}).build()
+    problem.update(**BOUNDS)
+    return problem
+
+
+@pytest.mark.parametrize(("alpha", "rows"), [(0.95, 600), (0.8, 2000)])
+def test_matches_cvar(scenarios, alpha, rows):
+    """The active set reaches the CVaR minimum the full formulation finds."""
+    value, weights = expected(scenarios, alpha)
+    problem = cutting_plane(alpha=alpha, rows=rows)
+
+    result = solve_cutting_plane(problem, scenarios)
+
+    assert result.value == pytest.approx(value, abs=1e-7)
+    assert result.risk == pytest.approx(value, abs=1e-7)
+    assert result.gap <= 1e-8
+    assert result.iterations > 1
+    assert result.active <= rows
+    np.testing.assert_allclose(problem.weights, weights, atol=1e-4)
+
+
+def test_memory_mapped_scenarios(scenarios, tmp_path):
+    """Scenarios memory-mapped from a file, read in small blocks, give the same answer."""
+    np.save(tmp_path / "scenarios.npy", scenarios)
+    mapped = np.load(tmp_path / "scenarios.npy", mmap_mode="r")
+
+    result = solve_cutting_plane(cutting_plane(rows=600), mapped, chunk=128)
+
+    assert result.value == pytest.approx(expected(scenarios)[0], abs=1e-7)
+
+
+def test_losses_in_blocks(scenarios):
+    """Losses read in blocks equal the losses in one product."""
+    weights = np.linspace(0.0, 1.0, 6)
+
+    np.testing.assert_allclose(losses(scenarios, weights, chunk=7), -scenarios @ weights)
+
+
+def test_fewer_columns_than_assets(scenarios):
+    """Scenarios on the first assets only leave the rest out of the risk."""
+    problem = cutting_plane(assets=8, rows=600)
+
+    result = solve_cutting_plane(problem, scenarios)
+
+    assert result.value == pytest.approx(expected(scenarios)[0], abs=1e-7)
+    np.testing.assert_allclose(problem.weights[6:], 0.0, atol=1e-6)
+
+
+def test_starts_from_the_previous_solution(scenarios):
+    """A second call on the same scenarios starts from the tail of the solution."""
+    problem = cutting_plane(rows=600)
+    solve_cutting_plane(problem, scenarios)
+
+    assert solve_cutting_plane(problem, scenarios).iterations == 1
+
+
+def test_stops_once_nothing_is_violated(scenarios):
+    """A gap the tolerance never accepts ends once no scenario beyond the set exceeds the value at risk."""
+    value, weights = expected(scenarios)
+    problem = cutting_plane(rows=600)
+
+    result = solve_cutting_plane(problem, scenarios, tol=-1.0)
+    assert result.iterations < 20
+    assert result.value == pytest.approx(value, rel=1e-4)
+    np.testing.assert_allclose(problem.weights, weights, atol=1e-4)
+
+
+def test_defaults_to_the_tuned_solver(scenarios):
+    """Without a solver the solves use the one tuned for the problem."""
+    problem = cutting_plane(rows=600)
+    store(Tuning(signature=signature(problem.problem), solver=cp.SCIPY, trials=[]))
+
+    # a linear program, which SciPy solves
+    solve_cutting_plane(problem, scenarios)
+    assert problem.stats.solver == cp.SCIPY
+
+
+def test_runs_out_of_iterations(scenarios):
+    """A gap still open after the last iteration is a solver error."""
+    with pytest.raises(CvxSolverError, match="did not converge in 1 iterations"):
+        solve_cutting_plane(cutting_plane(rows=600), scenarios, max_iterations=1)
+
+
+def test_runs_out_of_rows(scenarios):
+    """A gap still open once the rows are full is a solver error."""
+    with pytest.raises(CvxSolverError, match="Raise `max_iterations`, `tol` or the model's rows"):
+        solve_cutting_plane(cutting_plane(rows=101), scenarios)
+
+
+@pytest.mark.parametrize(("alpha", "rows"), [(0.9999, 600), (0.95, 100)])
+def test_tail_must_fit(scenarios, alpha, rows):
+    """The tail needs a scenario, and room in the rows."""
+    with pytest.raises(CvxDataError, match="needs at least one, and fewer than"):
+        solve_cutting_plane(cutting_plane(alpha=alpha, rows=rows), scenarios)
+
+
+def test_needs_rows():
+    """A model without room for a scenario is rejected at construction."""
+    with pytest.raises(CvxDataError, match="room for a scenario"):
+        CuttingPlaneCVar(assets=6)
+
+
+def test_needs_the_cutting_plane_model(scenarios):
+    """Another risk model cannot be solved on an active set."""
+    with pytest.raises(CvxDataError, match="CuttingPlaneCVar"):
+        solve_cutting_plane(MinVar(assets=6).build(), scenarios)
+
+
+def test_update_ignores_the_model():
+    """The model has no data, so update asks nothing of it."""
+    model = CuttingPlaneCVar(assets=6, rows=10)
+
+    assert model.keywords == ()
+    model.update(**{D.RETURNS: np.ones((3, 6))})
+
+
+def test_activate_writes_into_the_buffers(scenarios):
+    """Every cut pads the scenarios into the arrays the parameters keep."""
+    model = CuttingPlaneCVar(assets=6, rows=10)
+
+    model.activate(scenarios, np.array([3, 5, 7]), size=2)
+    active = model.parameter["active"].value
+    np.testing.assert_array_equal(active, np.vstack([scenarios[[3, 5, 7]], np.zeros((7, 6))]))
+    np.testing.assert_array_equal(model.parameter["tail_weights"].value, [0.5] * 3 + [0.0] * 7)
+
+    model.activate(scenarios[:, :4], np.array([1]), size=1)
+    assert model.parameter["active"].value is active
+    np.testing.assert_array_equal(active[0], [*scenarios[1, :4], 0.0, 0.0])
+    np.testing.assert_array_equal(active[1:], 0.0)
+    np.testing.assert_array_equal(model.parameter["tail_weights"].value, [1.0] + [0.0] * 9)
@@ -12,8 +12,9 @@ import pytest
 from cvxmarkowitz import CvxDataError
 from cvxmarkowitz.names import DataNames as D
 from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.names import ParameterName as P
 from cvxmarkowitz.portfolios.min_var import MinVar
-from cvxmarkowitz.risk import CVar
+from cvxmarkowitz.risk import CVar, ParametricCVar
 
 
 def test_estimate_risk(solver):
@@ -104,3 +105,62 @@ def test_smallest_admissible_tail_is_accepted():
     model = CVar(assets=4, alpha=0.95, rows=20)  # int(20 * 0.05) == 1
 
     assert D.RETURNS in model.data
+
+
+@pytest.fixture
+def scenarios():
+    """Return seeded scenario data for 8 assets over 100 scenarios."""
+    rng = np.random.default_rng(0)
+    return {
+        D.RETURNS: rng.normal(size=(100, 8)),
+        D.LOWER_BOUND_ASSETS: np.zeros(8),
+        D.UPPER_BOUND_ASSETS: np.ones(8),
+    }
+
+
+@pytest.mark.parametrize("alpha", [0.95, 0.75])
+def test_parametric_cvar_matches_cvar(solver, scenarios, alpha):
+    """Both formulations agree where rows * (1 - alpha) is a whole number."""
+    expected = MinVar(assets=8, model={M.RISK: CVar(assets=8, rows=100, alpha=alpha)}).build()
+    expected.update(**scenarios)
+
+    problem = MinVar(assets=8, model={M.RISK: ParametricCVar(assets=8, rows=100, alpha=alpha)}).build()
+    problem.update(**scenarios)
+
+    assert problem.solve(solver=solver) == pytest.approx(expected.solve(solver=solver), abs=1e-6)
+    np.testing.assert_allclose(problem.weights, expected.weights, atol=1e-4)
+
+
+def test_parametric_cvar_sweeps_alpha_without_recompiling(scenarios):
+    """Changing alpha between solves reuses the compiled problem."""
+    problem = MinVar(assets=8, model={M.RISK: ParametricCVar(assets=8, rows=100)}).build()
+    problem.update(**scenarios)
+    alpha = problem.model[M.RISK].parameter[P.ALPHA]
+
+    values = [problem.solve()]
+    compiled = problem.problem._cache.param_prog
+
+    for level in (0.9, 0.75, 0.5):
+        alpha.value = level
+        values.append(problem.solve())
+        assert problem.problem._cache.param_prog is compiled
+        assert not problem.stats.compiled
+
+    # a wider tail averages in milder losses
+    assert values == sorted(values, reverse=True)
+
+
+def test_parametric_cvar_rejects_alpha_of_one(scenarios):
+    """Alpha of one leaves no tail to average over."""
+    problem = MinVar(assets=8, model={M.RISK: ParametricCVar(assets=8, rows=100)}).build()
+    problem.update(**scenarios)
+    problem.model[M.RISK].parameter[P.ALPHA].value = 1.0
+
+    with pytest.raises(CvxDataError, match="alpha must lie in"):
+        problem.solve()
+
+
+def test_parametric_cvar_needs_scenarios():
+    """A model without scenarios is rejected at construction."""
+    with pytest.raises(CvxDataError, match="at least one scenario"):
+        ParametricCVar(assets=4)
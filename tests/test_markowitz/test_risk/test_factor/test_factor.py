@@ -277,3 +277,94 @@ def test_mismatch_matrix_nonsquare(factor_model):
                 D.SYSTEMATIC_VOLA_UNCERTAINTY: np.array([0.2, 0.3]),
             }
         )
+
+
+def _industries(assets: int, factors: int) -> np.ndarray:
+    """Return a mask of one market and one industry factor per asset."""
+    mask = np.zeros((factors, assets), dtype=bool)
+    mask[0] = True
+    mask[1 + np.arange(assets) % (factors - 1), np.arange(assets)] = True
+    return mask
+
+
+def test_sparse_exposure_matches_dense(solver):
+    """A sparse exposure solves to the portfolio of the same dense one.
+
+    The sparse model is updated once with the dense exposure and once with
+    the entries in the pattern only.
+    """
+    mask = _industries(assets=12, factors=4)
+    exposure = np.where(mask, np.random.default_rng(0).uniform(0.5, 1.5, size=mask.shape), 0.0)
+    data = {
+        D.CHOLESKY: cholesky(rand_cov(4, seed=0)),
+        D.IDIOSYNCRATIC_VOLA: np.full(12, 0.1),
+        D.LOWER_BOUND_ASSETS: np.zeros(12),
+        D.UPPER_BOUND_ASSETS: np.ones(12),
+        D.LOWER_BOUND_FACTORS: -np.ones(4),
+        D.UPPER_BOUND_FACTORS: np.ones(4),
+        D.SYSTEMATIC_VOLA_UNCERTAINTY: np.zeros(4),
+        D.IDIOSYNCRATIC_VOLA_UNCERTAINTY: np.zeros(12),
+    }
+
+    dense = MinVar(assets=12, factors=4).build()
+    dense.update(**data, **{D.EXPOSURE: exposure})
+    expected = dense.solve(solver=solver)
+
+    sparse = MinVar(assets=12, factors=4, model={M.RISK: FactorModel(assets=12, factors=4, sparsity=mask)}).build()
+    assert sparse.parameter[D.EXPOSURE].sparse_idx is not None
+
+    for value in (exposure, exposure[mask]):
+        sparse.update(**data, **{D.EXPOSURE: value})
+        assert sparse.solve(solver=solver) == pytest.approx(expected, abs=1e-6)
+        np.testing.assert_allclose(sparse.weights, dense.weights, atol=1e-4)
+
+
+def test_sparse_exposure_pattern_shape():
+    """A pattern not shaped like the exposure is rejected."""
+    with pytest.raises(CvxDataError, match="sparsity pattern has shape"):
+        FactorModel(assets=3, factors=2, sparsity=np.ones((3, 2), dtype=bool))
+
+
+def test_sparse_exposure_outside_pattern():
+    """A dense exposure with entries outside the pattern is rejected."""
+    model = FactorModel(assets=3, factors=2, sparsity=np.eye(2, 3, dtype=bool))
+
+    with pytest.raises(ValueError, match="outside the sparsity pattern"):
+        model.update(
+            **{
+                D.CHOLESKY: np.eye(2),
+                D.EXPOSURE: np.ones((2, 3)),
+                D.IDIOSYNCRATIC_VOLA: np.zeros(3),
+                D.SYSTEMATIC_VOLA_UNCERTAINTY: np.zeros(2),
+                D.IDIOSYNCRATIC_VOLA_UNCERTAINTY: np.zeros(3),
+            }
+        )
+
+
+def test_factor_without_robust_terms():
+    """robust=False matches the robust model with zero uncertainty and needs no |y|."""
+    data = {
+        D.CHOLESKY: np.eye(2),
+        D.EXPOSURE: np.array([[1, 0, 1], [1, 0.5, 1]]),
+        D.IDIOSYNCRATIC_VOLA: np.array([0.1, 0.1, 0.1]),
+    }
+    plain = FactorModel(assets=3, factors=2, robust=False)
+    plain.update(**data)
+
+    robust = FactorModel(assets=3, factors=2)
+    robust.update(**data, **{D.SYSTEMATIC_VOLA_UNCERTAINTY: np.zeros(2), D.IDIOSYNCRATIC_VOLA_UNCERTAINTY: np.zeros(3)})
+
+    assert set(plain.keywords) == {D.CHOLESKY, D.EXPOSURE, D.IDIOSYNCRATIC_VOLA}
+
+    weights = cp.Variable(3)
+    weights.value = np.array([0.5, 0.1, 0.2])
+    factor_weights = plain.data[D.EXPOSURE] @ weights
+    variables = {D.WEIGHTS: weights, D.FACTOR_WEIGHTS: factor_weights}
+
+    assert plain.constraints(variables).keys() == {"factors"}
+    assert plain.estimate(variables).value == pytest.approx(
+        robust.estimate({**variables, D._ABS: cp.abs(factor_weights)}).value
+    )
+
+    with pytest.raises(CvxDataError, match="chol and exposure"):
+        plain.update(**{**data, D.CHOLESKY: np.eye(3)})
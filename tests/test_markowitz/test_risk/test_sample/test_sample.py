@@ -142,3 +142,58 @@ def test_mismatch_cholesky_rows():
                 D.VOLA_UNCERTAINTY: np.zeros(2),
             }
         )
+
+
+def test_returns_factor():
+    """The thin factor is a square root of the sample covariance."""
+    returns = np.random.default_rng(0).normal(size=(5, 3))
+    factor = SampleCovariance.returns_factor(returns)
+
+    assert factor.shape == (5, 3)
+    np.testing.assert_allclose(factor.T @ factor, np.cov(returns, rowvar=False))
+
+
+def test_returns_factor_needs_two_observations():
+    """One observation has no sample covariance."""
+    with pytest.raises(CvxDataError, match="at least 2 observations"):
+        SampleCovariance.returns_factor(np.ones((1, 3)))
+
+
+def test_thin_factor_matches_cholesky():
+    """A thin factor gives the risk of the square Cholesky factor.
+
+    The parameter is sized by `rows`, not by the assets, and a window with
+    fewer observations than `rows` is padded with zero rows.
+    """
+    returns = np.random.default_rng(1).normal(size=(6, 4))
+    weights = {D.WEIGHTS: np.array([0.4, -0.1, 0.5, 0.2]), D._ABS: np.array([0.4, 0.1, 0.5, 0.2])}
+    vola = np.array([0.1, 0.0, 0.2, 0.3])
+
+    square = SampleCovariance(assets=4)
+    square.update(**{D.CHOLESKY: cholesky(np.cov(returns, rowvar=False)), D.VOLA_UNCERTAINTY: vola})
+
+    thin = SampleCovariance(assets=4, rows=8)
+    thin.update(**{D.CHOLESKY: SampleCovariance.returns_factor(returns), D.VOLA_UNCERTAINTY: vola})
+
+    assert thin.data[D.CHOLESKY].shape == (8, 4)
+    np.testing.assert_almost_equal(thin.estimate(weights).value, square.estimate(weights).value)
+
+
+def test_thin_factor_mismatch():
+    """A thin factor is matched against vola_uncertainty on its columns."""
+    riskmodel = SampleCovariance(assets=4, rows=8)
+
+    with pytest.raises(CvxDataError, match="chol and vola_uncertainty"):
+        riskmodel.update(**{D.CHOLESKY: np.ones((4, 3)), D.VOLA_UNCERTAINTY: np.zeros(4)})
+
+
+def test_sample_without_robust_terms():
+    """With robust=False the risk is norm2(chol @ w), with no |w| variable needed."""
+    riskmodel = SampleCovariance(assets=4, robust=False)
+    riskmodel.update(**{D.CHOLESKY: cholesky(np.array([[1.0, 0.5], [0.5, 2.0]]))})
+
+    assert riskmodel.keywords == (D.CHOLESKY,)
+    assert riskmodel.constraints({D.WEIGHTS: np.zeros(4)}) == {}
+
+    vola = riskmodel.estimate({D.WEIGHTS: np.array([1.0, 1.0, 0.0, 0.0])}).value
+    np.testing.assert_almost_equal(vola, 2.0)
@@ -0,0 +1,57 @@
+"""Tests for the per-solve statistics and their log."""
+
+import math
+
+import pytest
+
+from cvxmarkowitz.stats import SolveStats, SolveStatsLog, residuals
+
+
+def _stats(solve_time: float) -> SolveStats:
+    """Return statistics of an optimal solve taking `solve_time` in the solver."""
+    return SolveStats(
+        solver="CLARABEL",
+        status="optimal",
+        compiled=False,
+        update_time=0.0,
+        setup_time=0.0,
+        solve_time=solve_time,
+        unpack_time=0.0,
+        iterations=int(solve_time),
+    )
+
+
+def test_log_counts_and_percentiles():
+    """The log counts solves per label and takes percentiles of any attribute."""
+    log = SolveStatsLog()
+    for t in range(1, 101):
+        log.record("MinVar", _stats(float(t)))
+    log.record("MaxSharpe", _stats(1.0))
+
+    assert log.labels == ["MinVar", "MaxSharpe"]
+    assert log.count("MinVar") == 100
+    assert log.percentiles("MinVar", q=(0, 50, 100)) == {0: 1.0, 50: 50.5, 100: 100.0}
+    assert log.percentiles("MinVar", q=(100,), attribute="iterations") == {100: 100.0}
+
+
+def test_log_window_bounds_the_history():
+    """Percentiles cover the last `window` solves; the count covers all."""
+    log = SolveStatsLog(window=2)
+    for t in (100.0, 1.0, 2.0):
+        log.record("MinVar", _stats(t))
+
+    assert log.count("MinVar") == 3
+    assert log.percentiles("MinVar", q=(100,)) == {100: 2.0}
+
+
+def test_log_unknown_label():
+    """Nothing recorded yields a zero count and NaN percentiles."""
+    log = SolveStatsLog()
+    assert log.count("MinVar") == 0
+    assert all(math.isnan(value) for value in log.percentiles("MinVar").values())
+
+
+@pytest.mark.parametrize("native", [None, object()])
+def test_residuals_without_clarabel(native):
+    """Solvers that report no residuals yield None for both."""
+    assert residuals(native) == (None, None)
@@ -0,0 +1,157 @@
+"""Tests for choosing the default solver by timing the installed ones."""
+
+import json
+from pathlib import Path
+
+import cvxpy as cp
+import numpy as np
+import pytest
+from cvx.linalg import cholesky
+
+from cvxmarkowitz import CvxDataError, CvxSolverError, MinVar
+from cvxmarkowitz import tuning as tuned
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.tuning import ENVIRONMENT, Trial, Tuning, lookup, signature, store
+
+
+def _samples(count: int) -> list[dict[str, np.ndarray]]:
+    """Return `count` complete payloads for a three-asset MinVar problem."""
+    rng = np.random.default_rng(0)
+    samples = []
+    for _ in range(count):
+        returns = rng.normal(scale=0.01, size=(10, 3))
+        samples.append(
+            {
+                D.CHOLESKY: cholesky(np.cov(returns, rowvar=False)),
+                D.LOWER_BOUND_ASSETS: np.zeros(3),
+                D.UPPER_BOUND_ASSETS: np.ones(3),
+                D.VOLA_UNCERTAINTY: np.zeros(3),
+            }
+        )
+    return samples
+
+
+def test_autotune_records_every_solver(solvers_file):
+    """Each solver tried gets a trial; the winner is stored and becomes the default."""
+    problem = MinVar(assets=3).build()
+
+    tuning = problem.autotune(_samples(3), solvers=[cp.CLARABEL, cp.SCIPY])
+
+    clarabel, scipy = tuning.trials
+    assert clarabel == Trial(solver=cp.CLARABEL, time=clarabel.time, error=0.0, solved=3, samples=3)
+    assert clarabel.time > 0
+    # SCIPY solves linear programs only
+    assert scipy.solved == 0
+    assert np.isnan(scipy.time)
+    assert np.isnan(scipy.error)
+
+    assert tuning.solver == cp.CLARABEL
+    assert tuning.signature == signature(problem.problem)
+    assert problem.solver == cp.CLARABEL
+    assert json.loads(solvers_file.read_text())[tuning.signature]["solver"] == cp.CLARABEL
+
+
+def test_autotune_falls_back_to_the_reference(tmp_path):
+    """Without a solver that passes, the reference wins."""
+    problem = MinVar(assets=3).build()
+    path = tmp_path / "elsewhere" / "solvers.json"
+
+    tuning = problem.autotune(_samples(2), solvers=[cp.SCIPY], path=path)
+
+    assert tuning.solver == cp.CLARABEL
+    assert [trial.solver for trial in tuning.trials] == [cp.SCIPY]
+    assert lookup(tuning.signature, path) == cp.CLARABEL
+    assert lookup(tuning.signature) is None
+
+
+def test_autotune_needs_samples():
+    """An empty sample is an error."""
+    with pytest.raises(CvxDataError, match="at least one sample"):
+        MinVar(assets=3).build().autotune([])
+
+
+def test_autotune_needs_the_reference_to_solve():
+    """A sample the reference cannot solve stops the tuning."""
+    sample = {**_samples(1)[0], D.UPPER_BOUND_ASSETS: np.full(3, 0.1)}
+
+    with pytest.raises(CvxSolverError):
+        MinVar(assets=3).build().autotune([sample])
+
+
+def test_trial_passes():
+    """A trial passes if it solved every sample, accurately enough."""
+    trial = Trial(solver=cp.CLARABEL, time=1.0, error=1e-6, solved=2, samples=2)
+
+    assert trial.passes(1e-4)
+    assert not trial.passes(1e-8)
+    assert not Trial(solver=cp.CLARABEL, time=1.0, error=0.0, solved=1, samples=2).passes(1e-4)
+
+
+def test_solve_uses_the_stored_choice(solvers_file):
+    """A problem of a tuned structure defaults to the solver chosen for it, if installed."""
+    problem = MinVar(assets=3).build()
+    key = signature(problem.problem)
+    store(Tuning(signature=key, solver=cp.SCIPY, trials=[]))
+
+    assert tuned.solvers_file() == solvers_file
+    assert problem.solver == cp.SCIPY
+    # another structure is untouched
+    assert MinVar(assets=4).build().solver == cp.CLARABEL
+
+    store(Tuning(signature=key, solver="NOT_INSTALLED", trials=[]))
+    assert MinVar(assets=3).build().solver == cp.CLARABEL
+
+
+def test_solve_defaults_to_the_winner():
+    """After tuning, `solve` without a solver uses the winner."""
+    problem = MinVar(assets=3).build()
+    samples = _samples(2)
+    problem.autotune(samples, solvers=[cp.CLARABEL])
+
+    problem.update(**samples[0])
+    problem.solve()
+
+    assert problem.stats.solver == cp.CLARABEL
+
+
+def test_signature_ignores_data():
+    """The signature follows the structure of a problem, not its data."""
+    first = MinVar(assets=3).build()
+    second = MinVar(assets=3).build()
+    first.update(**_samples(1)[0])
+
+    assert signature(first.problem) == signature(second.problem)
+    assert signature(first.problem) != signature(MinVar(assets=4).build().problem)
+
+
+def test_solvers_file_defaults_to_the_cache(tmp_path, monkeypatch):
+    """Without the environment variable the file lives in the user's cache."""
+    monkeypatch.delenv(ENVIRONMENT)
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    assert tuned.solvers_file() == tmp_path / ".cache" / "cvxmarkowitz" / "solvers.json"
+
+
+@pytest.mark.parametrize("content", ["{", "[]", '{"key": "CLARABEL"}', '{"key": {"solver": 1}}'])
+def test_unreadable_solvers_file_has_nothing_tuned(solvers_file, content):
+    """A corrupt file falls back to the default solver, and the next store replaces it."""
+    solvers_file.write_text(content.replace("key", signature(MinVar(assets=3).build().problem)))
+    problem = MinVar(assets=3).build()
+    assert problem.solver == cp.CLARABEL
+
+    store(Tuning(signature="other", solver=cp.SCIPY, trials=[]))
+    assert lookup("other") == cp.SCIPY
+
+
+def test_no_home_directory(monkeypatch):
+    """Without the variable and a home directory there is no file, and nothing tuned."""
+    monkeypatch.delenv(ENVIRONMENT)
+
+    def homeless() -> Path:
+        raise RuntimeError
+
+    monkeypatch.setattr(Path, "home", homeless)
+    with pytest.raises(CvxDataError, match=ENVIRONMENT):
+        tuned.solvers_file()
+    assert lookup("key") is None
+    assert MinVar(assets=3).build().solver == cp.CLARABEL
@@ -4,9 +4,13 @@ These tests verify that the helper functions keep existing entries and fill
 remaining slots with zeros as required.
 """
 
+import gc
+
+import cvxpy as cp
 import numpy as np
+import pytest
 
-from cvxmarkowitz.utils.fill import fill_matrix, fill_vector
+from cvxmarkowitz.utils.fill import _BUFFERS, fill_matrix, fill_parameter, fill_trusted, fill_vector
 
 
 def test_fill_vector():
@@ -19,3 +23,103 @@ def test_fill_matrix():
     """fill_matrix should embed the input block in the top-left and zero-fill the rest."""
     a = np.ones((2, 2))
     np.allclose(fill_matrix(rows=3, cols=3, x=a), np.array([[1, 1, 0], [1, 1, 0], [0, 0, 0]]))
+
+
+def test_fill_parameter_pads_in_place():
+    """fill_parameter reuses one buffer, re-zeroing the tail a larger input left behind."""
+    parameter = cp.Parameter((3, 3))
+    fill_parameter(parameter, np.ones((2, 3), dtype=int))
+    buffer = parameter.value
+
+    fill_parameter(parameter, 2 * np.ones((1, 2), dtype=int))
+    assert parameter.value is buffer
+    np.testing.assert_array_equal(buffer, [[2, 2, 0], [0, 0, 0], [0, 0, 0]])
+
+
+def test_fill_parameter_passes_exact_inputs_through():
+    """An input of the parameter's shape and dtype is taken as is, and never overwritten."""
+    parameter = cp.Parameter(3)
+    fill_parameter(parameter, np.zeros(2))
+    x = np.ones(3)
+    fill_parameter(parameter, x)
+    assert parameter.value is x
+
+    fill_parameter(parameter, np.zeros(2))
+    np.testing.assert_array_equal(x, np.ones(3))
+    np.testing.assert_array_equal(parameter.value, np.zeros(3))
+
+
+def test_fill_parameter_validates():
+    """The parameter's attributes and shape are still checked."""
+    with pytest.raises(ValueError, match="nonnegative"):
+        fill_parameter(cp.Parameter(3, nonneg=True), -np.ones(2))
+    with pytest.raises(ValueError, match="broadcast"):
+        fill_parameter(cp.Parameter(3), np.ones(4))
+
+
+def test_fill_trusted_skips_the_checks():
+    """fill_trusted pads and passes through like fill_parameter, but checks no attribute."""
+    parameter = cp.Parameter(3, nonneg=True)
+    fill_trusted(parameter, -np.ones(2, dtype=int))
+    np.testing.assert_array_equal(parameter.value, [-1.0, -1.0, 0.0])
+
+    x = np.ones(3)
+    fill_trusted(parameter, x)
+    assert parameter.value is x
+
+    sparse = cp.Parameter((2, 3), sparsity=([0, 1], [2, 0]))
+    fill_trusted(sparse, np.array([1.0, 2.0]))
+    np.testing.assert_array_equal(sparse.value_sparse.toarray(), [[0.0, 0.0, 1.0], [2.0, 0.0, 0.0]])
+
+
+def test_fill_parameter_releases_the_buffer():
+    """A buffer goes when its parameter does."""
+    parameter = cp.Parameter(3)
+    fill_parameter(parameter, np.ones(2))
+    key = id(parameter)
+    assert key in _BUFFERS
+
+    del parameter
+    gc.collect()
+    assert key not in _BUFFERS
+
+
+def test_fill_sparse_parameter():
+    """A parameter with a sparsity pattern takes its entries or a dense matrix."""
+    parameter = cp.Parameter((2, 3), sparsity=([0, 1], [2, 0]))
+
+    fill_parameter(parameter, np.array([1.0, 2.0]))
+    np.testing.assert_array_equal(parameter.value_sparse.toarray(), [[0.0, 0.0, 1.0], [2.0, 0.0, 0.0]])
+
+    # a smaller dense matrix is padded, cutting the entry at (0, 2) off
+    fill_parameter(parameter, np.array([[0.0, 0.0], [3.0, 0.0]]))
+    np.testing.assert_array_equal(parameter.value_sparse.data, [0.0, 3.0])
+
+
+@pytest.mark.parametrize(
+    ("x", "match"),
+    [
+        (np.ones(3), "3 values for a sparsity pattern of 2"),
+        (np.ones((3, 3)), "does not fit"),
+        (np.ones((2, 3)), "outside the sparsity pattern"),
+    ],
+)
+def test_fill_sparse_parameter_validates(x, match):
+    """Entries of the wrong number, place or size are rejected."""
+    parameter = cp.Parameter((2, 3), sparsity=([0, 1], [2, 0]))
+
+    with pytest.raises(ValueError, match=match):
+        fill_parameter(parameter, x)
+
+
+@pytest.mark.parametrize("x", [np.array([1.0, -2.0]), np.array([[0.0, 0.0, 1.0], [-2.0, 0.0, 0.0]])])
+def test_fill_sparse_parameter_checks_attributes(x):
+    """Only fill_trusted takes entries that violate the sign of a sparse parameter."""
+    parameter = cp.Parameter((2, 3), sparsity=([0, 1], [2, 0]), nonneg=True)
+
+    with pytest.raises(ValueError, match="violating the sign"):
+        fill_parameter(parameter, x)
+    assert parameter.value_sparse is None
+
+    fill_trusted(parameter, x)
+    np.testing.assert_array_equal(parameter.value_sparse.data, [1.0, -2.0])
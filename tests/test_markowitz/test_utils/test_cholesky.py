@@ -0,0 +1,79 @@
+"""Tests for rank-one Cholesky updates and the rolling factor built on them."""
+
+import numpy as np
+import pytest
+from cvx.linalg import cholesky
+
+from cvxmarkowitz import CvxDataError, MinVar
+from cvxmarkowitz.names import DataNames as D
+from cvxmarkowitz.names import ModelName as M
+from cvxmarkowitz.utils.cholesky import RollingCholesky, rank_one_downdate, rank_one_update
+
+
+@pytest.fixture
+def returns():
+    """Return seeded daily-scale returns of five assets."""
+    return np.random.default_rng(0).normal(scale=0.01, size=(40, 5))
+
+
+def test_update_and_downdate(returns):
+    """An update matches the factor of the updated covariance; a downdate undoes it."""
+    covariance = returns.T @ returns
+    factor = cholesky(covariance)
+    x = returns[0]
+
+    rank_one_update(factor, x)
+    np.testing.assert_allclose(factor, cholesky(covariance + np.outer(x, x)), atol=1e-12)
+
+    rank_one_downdate(factor, x)
+    np.testing.assert_allclose(factor, cholesky(covariance), atol=1e-12)
+
+
+def test_failed_downdate_leaves_the_factor(returns):
+    """A downdate past positive definiteness raises and changes nothing."""
+    factor = cholesky(returns.T @ returns)
+    before = factor.copy()
+
+    with pytest.raises(CvxDataError, match="not positive definite"):
+        rank_one_downdate(factor, 10 * returns[0])
+    np.testing.assert_array_equal(factor, before)
+
+
+def test_rolling_window(returns):
+    """Adding the newest and dropping the oldest keeps the factor of the window."""
+    window = 20
+    rolling = RollingCholesky.from_returns(returns[:window], weight=1 / window)
+    for t in range(window, len(returns)):
+        rolling.add(returns[t], weight=1 / window)
+        rolling.drop(returns[t - window], weight=1 / window)
+
+    recent = returns[-window:]
+    np.testing.assert_allclose(rolling.factor, cholesky(recent.T @ recent / window), atol=1e-12)
+
+
+def test_ewma(returns):
+    """The ewma step follows the recursion of an exponentially weighted covariance."""
+    covariance = returns[:10].T @ returns[:10]
+    rolling = RollingCholesky.from_covariance(covariance)
+    for x in returns[10:]:
+        rolling.ewma(x, decay=0.94)
+        covariance = 0.94 * covariance + 0.06 * np.outer(x, x)
+
+    np.testing.assert_allclose(rolling.factor.T @ rolling.factor, covariance, atol=1e-14)
+
+
+def test_factor_feeds_sample_covariance(returns):
+    """The rolling factor goes into `update` as `chol`, uncopied."""
+    rolling = RollingCholesky.from_returns(returns)
+    problem = MinVar(assets=5).build()
+    problem.update(
+        **{
+            D.CHOLESKY: rolling.factor,
+            D.VOLA_UNCERTAINTY: np.zeros(5),
+            D.LOWER_BOUND_ASSETS: np.zeros(5),
+            D.UPPER_BOUND_ASSETS: np.ones(5),
+        }
+    )
+
+    assert problem.model[M.RISK].data[D.CHOLESKY].value is rolling.factor
+    assert problem.solve() == pytest.approx(np.linalg.norm(rolling.factor @ problem.weights), abs=1e-6)
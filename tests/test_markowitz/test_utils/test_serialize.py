@@ -0,0 +1,57 @@
+"""Tests for writing objects to disk with their arrays out of band."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cvxmarkowitz.utils.serialize import copy, dump, load
+
+
+@pytest.fixture
+def payload():
+    """Return an object mixing contiguous arrays with plain Python values."""
+    return {"vector": np.arange(5.0), "matrices": [np.eye(3), np.ones((2, 4))], "name": "risk"}
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_round_trip(tmp_path, payload, mmap):
+    """What load returns equals what dump wrote, copied or mapped."""
+    dump(payload, tmp_path / "payload.bin")
+    restored = load(tmp_path / "payload.bin", mmap=mmap)
+
+    assert restored["name"] == "risk"
+    np.testing.assert_array_equal(restored["vector"], payload["vector"])
+    for got, expected in zip(restored["matrices"], payload["matrices"], strict=True):
+        np.testing.assert_array_equal(got, expected)
+
+
+def test_mapped_arrays_are_copy_on_write(tmp_path, payload):
+    """Writing to a mapped array changes this process's copy, not the file."""
+    dump(payload, tmp_path / "payload.bin")
+
+    mapped = load(tmp_path / "payload.bin", mmap=True)
+    mapped["vector"][0] = 42.0
+
+    assert load(tmp_path / "payload.bin")["vector"][0] == 0.0
+
+
+def test_arrays_are_aligned(tmp_path, payload):
+    """Every array read back is aligned for its dtype."""
+    dump(payload, tmp_path / "payload.bin")
+    restored = load(tmp_path / "payload.bin", mmap=True)
+
+    assert restored["vector"].flags.aligned
+    assert all(matrix.flags.aligned for matrix in restored["matrices"])
+
+
+def test_copy_shares_what_it_is_told(payload):
+    """The selected parts are the original's objects; the rest are copies."""
+    payload["matrices"].append(payload["vector"])
+
+    copied = copy(payload, share=lambda obj: obj is payload["vector"])
+
+    assert copied["vector"] is payload["vector"]
+    assert copied["matrices"][2] is payload["vector"]
+    assert copied["matrices"][0] is not payload["matrices"][0]
+    np.testing.assert_array_equal(copied["matrices"][0], payload["matrices"][0])